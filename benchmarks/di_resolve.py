@@ -0,0 +1,108 @@
+import argparse
+import inspect
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Type
+
+from qr_code_generator.di.container import DIContainer, SCOPED, SINGLETON, TRANSIENT
+
+
+# Trivial constructors, so the numbers measure the container rather than the services it builds
+class Clock:
+    pass
+
+
+class Store:
+    def __init__(self, clock: Clock):
+        self.clock = clock
+
+
+class Handler:
+    def __init__(self, store: Store, clock: Clock, retries: int = 3):
+        self.store = store
+        self.clock = clock
+        self.retries = retries
+
+
+class LegacyContainer:
+    # The previous resolver: reflection on every transient resolve, unsynchronised singletons
+    def __init__(self):
+        self._services: Dict[Type, tuple] = {}
+        self._singletons: Dict[Type, Any] = {}
+
+    def register(self, service_type, implementation=None, lifetime=SINGLETON):
+        self._services[service_type] = (implementation or service_type, lifetime)
+
+    def resolve(self, service_type):
+        implementation, lifetime = self._services[service_type]
+        if lifetime == SINGLETON:
+            if service_type not in self._singletons:
+                self._singletons[service_type] = self._create_instance(implementation)
+            return self._singletons[service_type]
+        return self._create_instance(implementation)
+
+    def _create_instance(self, implementation):
+        params = {}
+        for param_name, param in inspect.signature(implementation.__init__).parameters.items():
+            if param_name == 'self':
+                continue
+            if param.annotation != inspect.Parameter.empty:
+                try:
+                    params[param_name] = self.resolve(param.annotation)
+                except KeyError:
+                    if param.default != inspect.Parameter.empty:
+                        continue
+                    raise
+        return implementation(**params)
+
+
+def build(container, handler_lifetime: str):
+    container.register(Clock)
+    container.register(Store, lifetime=TRANSIENT)
+    container.register(Handler, lifetime=handler_lifetime)
+    return container
+
+
+def throughput(resolve: Callable[[], Any], seconds: float) -> float:
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            resolve()
+        count += 100
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure DIContainer resolve throughput against the reflection-based resolver')
+    parser.add_argument('--seconds', type=float, default=1.0, help='Time spent on each measurement')
+    parser.add_argument('--threads', type=int, default=4, help='Threads for the concurrent singleton measurement')
+    args = parser.parse_args()
+
+    legacy = build(LegacyContainer(), TRANSIENT)
+    current = build(DIContainer(), TRANSIENT)
+    singleton = build(DIContainer(), SINGLETON)
+    scoped = build(DIContainer(), SCOPED)
+    scope = scoped.create_scope()
+
+    results = {
+        'legacy_transient_per_sec': throughput(lambda: legacy.resolve(Handler), args.seconds),
+        'transient_per_sec': throughput(lambda: current.resolve(Handler), args.seconds),
+        'singleton_per_sec': throughput(lambda: singleton.resolve(Handler), args.seconds),
+        'scoped_per_sec': throughput(lambda: scope.resolve(Handler), args.seconds),
+    }
+    with ThreadPoolExecutor(args.threads) as pool:
+        futures = [pool.submit(throughput, lambda: singleton.resolve(Handler), args.seconds)
+                   for _ in range(args.threads)]
+        results['singleton_threads_per_sec'] = sum(future.result() for future in futures)
+
+    output = {name: round(value, 1) for name, value in results.items()}
+    output['transient_speedup'] = round(results['transient_per_sec'] / results['legacy_transient_per_sec'], 2)
+    print(json.dumps(output, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
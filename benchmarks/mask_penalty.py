@@ -0,0 +1,58 @@
+import argparse
+import json
+import random
+import string
+import time
+
+import qrcode
+from qrcode.constants import ERROR_CORRECT_H, ERROR_CORRECT_L, ERROR_CORRECT_M, ERROR_CORRECT_Q
+
+from qr_code_generator.core.masks import FastMaskQRCode
+
+
+ERROR_LEVELS = [ERROR_CORRECT_L, ERROR_CORRECT_M, ERROR_CORRECT_Q, ERROR_CORRECT_H]
+
+
+def make_payloads(count: int, seed: int):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + ":;+@. \n"
+    return [
+        (''.join(rng.choice(alphabet) for _ in range(rng.randint(10, 600))), rng.choice(ERROR_LEVELS))
+        for _ in range(count)
+    ]
+
+
+def choose_masks(qr_class, payloads):
+    masks = []
+    start = time.perf_counter()
+    for data, error_correction in payloads:
+        qr = qr_class(error_correction=error_correction)
+        qr.add_data(data)
+        qr.best_fit()
+        masks.append(qr.best_mask_pattern())
+    return masks, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare stock and NumPy mask-pattern penalty scoring')
+    parser.add_argument('--count', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.count, args.seed)
+    stock_masks, stock_seconds = choose_masks(qrcode.QRCode, payloads)
+    fast_masks, fast_seconds = choose_masks(FastMaskQRCode, payloads)
+
+    mismatches = sum(1 for a, b in zip(stock_masks, fast_masks) if a != b)
+    print(json.dumps({
+        'payloads': args.count,
+        'mask_mismatches': mismatches,
+        'stock_seconds': round(stock_seconds, 4),
+        'numpy_seconds': round(fast_seconds, 4),
+        'speedup': round(stock_seconds / fast_seconds, 2) if fast_seconds else None,
+    }, indent=2))
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,254 @@
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.workbook import make_workbook
+
+
+PAYLOADS = ['phone', 'vcard', 'mecard', 'wifi', 'url', 'sms', 'email']
+FORMATS = ['png', 'svg', 'pdf']
+TRACKED_PACKAGES = ['qrcode', 'pillow', 'pandas', 'numpy', 'openpyxl']
+
+# Higher is better for throughput metrics, lower is better for memory
+METRICS = {'rows_per_sec': 1, 'ops_per_sec': 1, 'peak_rss_mb': -1}
+
+
+def peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_case(workbook: str, rows: int, payload_format: str, output_format: str) -> Dict[str, Any]:
+    from qr_code_generator.service import QRCodeService
+
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as output_folder:
+        start = time.perf_counter()
+        exit_code = QRCodeService().generate_from_excel(
+            workbook, output_folder, payload_format=payload_format, output_format=output_format, max_rows=rows,
+        )
+        seconds = time.perf_counter() - start
+        generated = sum(1 for _ in Path(output_folder).iterdir())
+    # A run that stops early or skips rows is not a throughput measurement
+    failed = exit_code != 0 or generated < rows
+    return {
+        'exit_code': exit_code,
+        'generated': generated,
+        'failed': failed,
+        'seconds': round(seconds, 3),
+        'rows_per_sec': round(rows / seconds, 1) if seconds and not failed else None,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def measure_case(workbook: Path, rows: int, payload_format: str, output_format: str) -> Dict[str, Any]:
+    # Each case runs in a fresh interpreter so peak RSS belongs to that case alone
+    command = [
+        sys.executable, '-m', 'benchmarks.pipeline', 'case',
+        str(workbook), str(rows), payload_format, output_format,
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        stderr = completed.stderr.strip().splitlines()
+        result = {
+            'exit_code': completed.returncode,
+            'failed': True,
+            'error': stderr[-1] if stderr else 'no result',
+            'rows_per_sec': None,
+            'peak_rss_mb': None,
+        }
+    else:
+        result = json.loads(lines[-1])
+    result['name'] = f'pipeline rows={rows} payload={payload_format} format={output_format}'
+    return result
+
+
+def time_operation(name: str, fn: Callable[[], Any], min_seconds: float = 0.2, repeat: int = 3) -> Dict[str, Any]:
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            break
+        loops *= 2
+    # Best of several timings is the least noisy estimate on a shared machine
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return {'name': name, 'ops_per_sec': round(loops / best, 1), 'loops': loops}
+
+
+def micro_benchmarks(min_seconds: float = 0.2) -> List[Dict[str, Any]]:
+    import pandas as pd
+
+    from qr_code_generator.core.sanitizer import FilenameSanitizer
+    from qr_code_generator.core.validator import DataValidator
+    from qr_code_generator.utils.pii_utils import PIIRedactor
+
+    filename = 'Ada Lovelace <ada@example.com> / +44 7000 000000?.png'
+    template_value = '../../etc/passwd:Ada*Lovelace'
+    log_line = 'Generated: +447000000000_ada.lovelace@example.com.png for Ada Lovelace'
+    validator = DataValidator()
+    frame = pd.DataFrame({'Phone': [f'+44{7000000000 + i}' for i in range(1000)], 'Name': ['Ada'] * 1000})
+    return [
+        time_operation('FilenameSanitizer.sanitize_filename', lambda: FilenameSanitizer.sanitize_filename(filename), min_seconds),
+        time_operation('FilenameSanitizer.sanitize_template_value',
+                       lambda: FilenameSanitizer.sanitize_template_value(template_value), min_seconds),
+        time_operation('PIIRedactor.redact_pii', lambda: PIIRedactor.redact_pii(log_line), min_seconds),
+        time_operation('DataValidator.validate_dataframe[1000 rows]', lambda: validator.validate_dataframe(frame), min_seconds),
+        time_operation('DataValidator.row_validity[1000 rows]', lambda: validator.row_validity(frame['Phone']), min_seconds),
+    ]
+
+
+def environment() -> Dict[str, Any]:
+    versions = {}
+    for package in TRACKED_PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'packages': versions,
+    }
+
+
+def run_suite(sizes: List[int], payloads: List[str], formats: List[str], matrix: bool, micro: bool) -> Dict[str, Any]:
+    cases = []
+    for payload_format in payloads:
+        for output_format in formats:
+            # Without --matrix, payloads are measured as PNG and formats with the phone payload
+            if matrix or output_format == formats[0] or payload_format == payloads[0]:
+                cases.append((payload_format, output_format))
+
+    results: Dict[str, Any] = {'environment': environment(), 'pipeline': [], 'micro': []}
+    with tempfile.TemporaryDirectory() as scratch:
+        for rows in sizes:
+            workbook = make_workbook(Path(scratch) / f'contacts_{rows}.xlsx', rows)
+            for payload_format, output_format in cases:
+                result = measure_case(workbook, rows, payload_format, output_format)
+                if result['failed']:
+                    detail = result.get('error') or f"exit code {result['exit_code']}, {result['generated']}/{rows} generated"
+                    print(f"{result['name']}: FAILED ({detail})", file=sys.stderr)
+                else:
+                    print(f"{result['name']}: {result['rows_per_sec']} rows/s, peak {result['peak_rss_mb']} MB", file=sys.stderr)
+                results['pipeline'].append(result)
+    if micro:
+        for result in micro_benchmarks():
+            print(f"{result['name']}: {result['ops_per_sec']} ops/s", file=sys.stderr)
+            results['micro'].append(result)
+    return results
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1) -> List[Dict[str, Any]]:
+    previous = {entry['name']: entry for entry in baseline.get('pipeline', []) + baseline.get('micro', [])}
+    rows = []
+    for entry in current.get('pipeline', []) + current.get('micro', []):
+        old = previous.get(entry['name'])
+        if old is None or old.get('failed'):
+            continue
+        if entry.get('failed'):
+            # A case that used to pass and now fails is the worst regression, not a missing number
+            rows.append({
+                'name': entry['name'], 'metric': 'failed', 'baseline': None, 'current': None,
+                'change': None, 'regression': True,
+            })
+            continue
+        for metric, direction in METRICS.items():
+            before, after = old.get(metric), entry.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            rows.append({
+                'name': entry['name'],
+                'metric': metric,
+                'baseline': before,
+                'current': after,
+                'change': round(change, 4),
+                'regression': change * direction < -threshold,
+            })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the QR generation pipeline and compare runs')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the suite and write results as JSON')
+    run_parser.add_argument('--sizes', default='1000',
+                            help='Comma-separated workbook sizes, e.g. 1000,10000,100000 (default: 1000)')
+    run_parser.add_argument('--payloads', default=','.join(PAYLOADS))
+    run_parser.add_argument('--formats', default=','.join(FORMATS))
+    run_parser.add_argument('--matrix', action='store_true', help='Measure every payload with every format')
+    run_parser.add_argument('--no-micro', dest='micro', action='store_false', help='Skip the microbenchmarks')
+    run_parser.add_argument('-o', '--output', default='benchmark-results.json')
+
+    compare_parser = commands.add_parser('compare', help='Flag regressions between two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='Relative change that counts as a regression (default: 0.1)')
+
+    case_parser = commands.add_parser('case', help=argparse.SUPPRESS)
+    case_parser.add_argument('workbook')
+    case_parser.add_argument('rows', type=int)
+    case_parser.add_argument('payload_format')
+    case_parser.add_argument('output_format')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'case':
+        print(json.dumps(run_case(args.workbook, args.rows, args.payload_format, args.output_format)))
+        return 0
+
+    if args.command == 'run':
+        results = run_suite(
+            [int(size) for size in args.sizes.split(',')],
+            args.payloads.split(','),
+            args.formats.split(','),
+            args.matrix,
+            args.micro,
+        )
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(args.output)
+        failures = sum(1 for result in results['pipeline'] if result['failed'])
+        if failures:
+            print(f"{failures} pipeline case(s) failed", file=sys.stderr)
+        return 1 if failures else 0
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    rows = compare_results(baseline, current, args.threshold)
+    for row in rows:
+        flag = 'REGRESSION' if row['regression'] else 'ok'
+        change = 'FAILED' if row['change'] is None else f"{row['change']:+.1%}"
+        print(f"{flag:<10} {change:>8}  {row['metric']:<12} {row['name']}")
+    regressions = sum(1 for row in rows if row['regression'])
+    print(f"{regressions} regression(s) over {args.threshold:.0%} in {len(rows)} comparisons")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,106 @@
+import argparse
+import json
+import random
+import re
+import time
+from typing import Callable, List
+
+from qr_code_generator.core.sanitizer import FilenameSanitizer, PathValidator
+from qr_code_generator.utils.constants import MAX_FILENAME_LENGTH, PATH_TRAVERSAL_PATTERNS, WINDOWS_RESERVED_NAMES
+
+
+# Pieces that exercise every branch: traversal patterns in mixed case, drive and UNC prefixes, reserved names
+FRAGMENTS = [
+    'Ada', 'Lovelace', '+447000000000', 'ada@example.com', ' ', '.', '..', '../', '..\\', '%2e%2e/', '%2E%2e\\',
+    '%2E%2E/', '/', '\\', 'C:', 'c:/', '//', '\\\\', 'CON', 'aux', 'com1', '.png', '<', '>', ':', '"', '|', '?', '*',
+    '\x00', '\x1f', '\t', 'é', 'Ωmega', 'İ', '_',
+]
+
+
+def legacy_sanitize_filename(filename: str, max_length: int = MAX_FILENAME_LENGTH) -> str:
+    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
+    name_without_ext = sanitized.rsplit('.', 1)[0] if '.' in sanitized else sanitized
+    if name_without_ext.upper() in WINDOWS_RESERVED_NAMES:
+        sanitized = f"_{sanitized}"
+    if len(sanitized) > max_length:
+        ext = sanitized.rsplit('.', 1)[1] if '.' in sanitized else ''
+        name_part = sanitized.rsplit('.', 1)[0] if '.' in sanitized else sanitized
+        max_name_length = max_length - len(ext) - 1 if ext else max_length
+        sanitized = name_part[:max_name_length] + f".{ext}" if ext else name_part[:max_length]
+    return sanitized
+
+
+def legacy_sanitize_template_value(value: str) -> str:
+    for pattern in PATH_TRAVERSAL_PATTERNS:
+        if pattern.lower() in value.lower():
+            value = value.replace(pattern, '_')
+    if re.match(r'^[a-zA-Z]:[/\\]', value):
+        value = '_' + value
+    if value.startswith('\\\\') or value.startswith('//'):
+        value = '_' + value
+    return legacy_sanitize_filename(value)
+
+
+def legacy_is_path_traversal_attempt(value: str) -> bool:
+    value_lower = value.lower()
+    for pattern in PATH_TRAVERSAL_PATTERNS:
+        if pattern.lower() in value_lower:
+            return True
+    return False
+
+
+def make_corpus(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 12))) for _ in range(count)]
+
+
+def measure(fn: Callable[[], object], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the per-call sanitizer with the precompiled engine')
+    parser.add_argument('--count', type=int, default=100000, help='Values in the synthetic column')
+    parser.add_argument('--unique', type=float, default=1.0, help='Fraction of distinct values in the column')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    distinct = make_corpus(max(1, int(args.count * args.unique)))
+    column = [distinct[i % len(distinct)] for i in range(args.count)]
+
+    mismatches = sum(
+        legacy_sanitize_filename(value) != FilenameSanitizer.sanitize_filename(value)
+        or legacy_sanitize_template_value(value) != FilenameSanitizer.sanitize_template_value(value)
+        or legacy_is_path_traversal_attempt(value) != PathValidator.is_path_traversal_attempt(value)
+        for value in distinct
+    )
+    timings = {
+        'legacy_filename_seconds': measure(lambda: [legacy_sanitize_filename(v) for v in column], args.repeat),
+        'filename_seconds': measure(lambda: [FilenameSanitizer.sanitize_filename(v) for v in column], args.repeat),
+        'filename_many_seconds': measure(lambda: FilenameSanitizer.sanitize_filename_many(column), args.repeat),
+        'legacy_template_seconds': measure(lambda: [legacy_sanitize_template_value(v) for v in column], args.repeat),
+        'template_seconds': measure(lambda: [FilenameSanitizer.sanitize_template_value(v) for v in column], args.repeat),
+        'template_many_seconds': measure(lambda: FilenameSanitizer.sanitize_template_value_many(column), args.repeat),
+        'legacy_traversal_seconds': measure(lambda: [legacy_is_path_traversal_attempt(v) for v in column], args.repeat),
+        'traversal_seconds': measure(lambda: [PathValidator.is_path_traversal_attempt(v) for v in column], args.repeat),
+    }
+
+    print(json.dumps({
+        'values': args.count,
+        'distinct': len(distinct),
+        'mismatches': mismatches,
+        **{name: round(seconds, 4) for name, seconds in timings.items()},
+        'filename_speedup': round(timings['legacy_filename_seconds'] / timings['filename_many_seconds'], 2),
+        'template_speedup': round(timings['legacy_template_seconds'] / timings['template_many_seconds'], 2),
+        'traversal_speedup': round(timings['legacy_traversal_seconds'] / timings['traversal_seconds'], 2),
+    }, indent=2))
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
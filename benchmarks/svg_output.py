@@ -0,0 +1,49 @@
+import argparse
+import io
+import json
+import time
+
+from qrcode.image.svg import SvgPathImage
+
+from qr_code_generator.core.generator import QRCodeGenerator
+from qr_code_generator.core.renderer import SvgMatrixImage
+
+
+def make_payload(repeat: int) -> str:
+    card = "BEGIN:VCARD\nVERSION:3.0\nN:Lovelace;Ada\nTEL:+441234567890\nEMAIL:ada@example.com\nEND:VCARD\n"
+    return card * repeat
+
+
+def render(factory, qr, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        buffer = io.BytesIO()
+        factory(qr).save(buffer)
+    return len(buffer.getvalue()), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare per-module and run-merged SVG output')
+    parser.add_argument('--count', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=4, help='vCard repetitions in the payload (sets the QR version)')
+    args = parser.parse_args()
+
+    qr = QRCodeGenerator().make_qr(make_payload(args.repeat))
+    stock_bytes, stock_seconds = render(lambda q: q.make_image(image_factory=SvgPathImage), qr, args.count)
+    compact_bytes, compact_seconds = render(lambda q: SvgMatrixImage(q.modules, q.box_size, q.border), qr, args.count)
+
+    print(json.dumps({
+        'qr_version': qr.version,
+        'renders': args.count,
+        'stock_bytes': stock_bytes,
+        'compact_bytes': compact_bytes,
+        'size_ratio': round(stock_bytes / compact_bytes, 2),
+        'stock_seconds': round(stock_seconds, 4),
+        'compact_seconds': round(compact_seconds, 4),
+        'speedup': round(stock_seconds / compact_seconds, 2) if compact_seconds else None,
+    }, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
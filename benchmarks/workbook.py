@@ -0,0 +1,62 @@
+import argparse
+import random
+from pathlib import Path
+
+from openpyxl import Workbook
+
+
+COLUMNS = [
+    'Phone', 'Name', 'Email', 'Organization', 'SSID', 'Password', 'Encryption',
+    'URL', 'Message', 'Subject', 'Body',
+]
+
+FIRST_NAMES = ['Ada', 'Alan', 'Grace', 'Linus', 'Margaret', 'Dennis', 'Barbara', 'Ken', 'Radia', 'Edsger']
+LAST_NAMES = ['Lovelace', 'Turing', 'Hopper', 'Torvalds', 'Hamilton', 'Ritchie', 'Liskov', 'Thompson', 'Perlman']
+ORGANIZATIONS = ['Analytical Engines Ltd', 'Bletchley Park', 'Harvard Mark I', 'Bell Labs', 'MIT']
+
+
+def make_row(index: int, rng: random.Random) -> list:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    # Unique numbers so every row produces its own file with the default {Phone} template
+    phone = f"+44{7000000000 + index:010d}"
+    email = f"{first}.{last}{index}@example.com".lower()
+    return [
+        phone,
+        f"{first} {last}",
+        email,
+        rng.choice(ORGANIZATIONS),
+        f"Office-{index % 50}",
+        ''.join(rng.choice('abcdefghjkmnpqrstuvwxyz23456789') for _ in range(12)),
+        'WPA',
+        f"https://example.com/badge/{index}?ref=qrgen",
+        f"Hi {first}, your table is {rng.randint(1, 99)}",
+        f"Ticket {index}",
+        f"Dear {first} {last}, your registration number is {index}.",
+    ]
+
+
+def make_workbook(path: str | Path, rows: int, seed: int = 0) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(COLUMNS)
+    for index in range(rows):
+        sheet.append(make_row(index, rng))
+    workbook.save(path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic contacts workbook with columns for every payload format')
+    parser.add_argument('output', help='Path of the .xlsx file to write')
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    print(make_workbook(args.output, args.rows, args.seed))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,9 +1,13 @@
 __version__ = "3.0.1"
 
-from qr_code_generator.core.generator import QRCodeGenerator
-from qr_code_generator.core.formatter import PhoneFormatter
-from qr_code_generator.core.validator import DataValidator
-from qr_code_generator.core.sanitizer import FilenameSanitizer
+# Public classes are imported on first access so that `import qr_code_generator` (and the CLI's
+# --help/--version) does not pay for pandas, NumPy, qrcode and PIL
+_LAZY_EXPORTS = {
+    "QRCodeGenerator": "qr_code_generator.core.generator",
+    "PhoneFormatter": "qr_code_generator.core.formatter",
+    "DataValidator": "qr_code_generator.core.validator",
+    "FilenameSanitizer": "qr_code_generator.core.sanitizer",
+}
 
 __all__ = [
     "__version__",
@@ -12,3 +16,17 @@ __all__ = [
     "DataValidator",
     "FilenameSanitizer",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
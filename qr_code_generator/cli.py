@@ -3,7 +3,8 @@ import logging
 import sys
 
 from qr_code_generator import __version__
-from qr_code_generator.service import QRCodeService
+from qr_code_generator.utils.log_utils import queued_logging
+from qr_code_generator.utils.stats_utils import profiled
 
 
 logging.basicConfig(
@@ -14,6 +15,10 @@ logger = logging.getLogger(__name__)
 
 
 def main():
+    if sys.argv[1:2] == ['serve']:
+        from qr_code_generator.server import serve_main
+        sys.exit(serve_main(sys.argv[2:]))
+
     parser = argparse.ArgumentParser(
         description='Generate QR codes from Excel contact data',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -40,13 +45,28 @@ Examples:
   # Export manifest
   python -m qr_code_generator --export-manifest --manifest-format json
   
+  # Stream every code into one ZIP archive (manifest included)
+  python -m qr_code_generator --output-archive delivery.zip
+  
+  # Print badges: 3x8 labels per A4 page with the Name column as caption
+  python -m qr_code_generator --label-sheet badges.pdf --label-grid 3x8 --caption-column Name
+  
+  # Serve codes over HTTP instead of running a batch (see: qrgen serve --help)
+  qrgen serve --port 8080 --workers 4
+  
   # Security options
   python -m qr_code_generator --allowed-output-path ./output --redact-logs
+  
+  # Resume an interrupted run, regenerating only new or changed rows
+  python -m qr_code_generator --resume
+  
+  # Render on 8 processes
+  python -m qr_code_generator --workers 8
         """
     )
 
     parser.add_argument('-i', '--input', default='input/contacts.xlsx',
-                       help='Input Excel file (default: input/contacts.xlsx)')
+                       help='Input file: .xlsx, .xls, .csv, .json, .ndjson (default: input/contacts.xlsx)')
     parser.add_argument('-o', '--output', default='images',
                        help='Output folder for QR codes (default: images)')
     parser.add_argument('-s', '--sheet', type=int, default=0,
@@ -59,6 +79,8 @@ Examples:
                        help='Overwrite existing QR code files')
     parser.add_argument('--dedup', action='store_true',
                        help='Skip duplicate phone numbers')
+    parser.add_argument('--resume', '--incremental', dest='resume', action='store_true',
+                       help='Keep a journal in the output folder and only regenerate new or changed rows')
 
     qr_group = parser.add_argument_group('QR code appearance')
     qr_group.add_argument('--fill-color', default='black',
@@ -71,6 +93,8 @@ Examples:
                          help='Border size in boxes (default: 4)')
     qr_group.add_argument('--error-correction', choices=['L', 'M', 'Q', 'H'], default='L',
                          help='Error correction level (default: L)')
+    qr_group.add_argument('--render-engine', choices=['pil', 'numpy'], default='pil',
+                         help='Raster renderer: pil draws each module, numpy scales the module matrix in one step (default: pil)')
 
     format_group = parser.add_argument_group('Payload and filename')
     format_group.add_argument('--payload-format', 
@@ -99,51 +123,111 @@ Examples:
     output_group = parser.add_argument_group('Output options')
     output_group.add_argument('--dry-run', action='store_true',
                              help='Validate inputs without generating QR codes')
+    output_group.add_argument('--output-archive', metavar='PATH',
+                             help='Stream all codes and the manifest into one .zip, .tar or .tar.gz file instead of the output folder')
+    output_group.add_argument('--shard-depth', type=int, default=0, metavar='N',
+                             help='Place each file under N levels of hash-prefix subdirectories, e.g. ab/cd/ for 2 (default: 0, flat)')
     output_group.add_argument('--export-manifest', action='store_true',
                              help='Generate manifest file with metadata')
     output_group.add_argument('--manifest-format', choices=['json', 'csv'], default='json',
                              help='Manifest file format (default: json)')
 
+    label_group = parser.add_argument_group('Label sheets')
+    label_group.add_argument('--label-sheet', metavar='PATH',
+                            help='Tile all codes onto the pages of one PDF instead of writing one file per row')
+    label_group.add_argument('--label-grid', default='3x8', metavar='COLSxROWS',
+                            help='Labels per page as columns x rows (default: 3x8)')
+    label_group.add_argument('--page-size', choices=['A4', 'A5', 'Letter', 'Legal'], default='A4',
+                            help='Label sheet page size (default: A4)')
+    label_group.add_argument('--page-margin', type=float, default=10.0, metavar='MM',
+                            help='Label sheet page margin in millimetres (default: 10)')
+    label_group.add_argument('--caption-column', metavar='COLUMN',
+                            help='Print the value of this column under each label')
+
+    performance_group = parser.add_argument_group('Performance')
+    performance_group.add_argument('--workers', type=int, default=1,
+                                  help='Number of processes used to render QR codes (default: 1)')
+    performance_group.add_argument('--writer-threads', type=int, default=0,
+                                  help='Threads that write rendered images to disk while the next rows are encoded (default: 0, write inline)')
+    performance_group.add_argument('--write-queue-size', type=int, default=64,
+                                  help='Maximum rendered images waiting for a writer thread (default: 64)')
+    performance_group.add_argument('--profile', metavar='PATH',
+                                  help='Write a cProfile dump of the run to PATH (inspect with: python -m pstats PATH)')
+    performance_group.add_argument('--cache-dir',
+                                  help='Reuse rendered QR codes from this on-disk cache directory')
+    performance_group.add_argument('--cache-max-mb', type=int, default=512,
+                                  help='Maximum cache size in MB before least recently used entries are evicted (default: 512)')
+    performance_group.add_argument('--cache-link', action='store_true',
+                                  help='Hardlink cached files into the output folder instead of copying them')
+
     logging_group = parser.add_argument_group('Logging')
     logging_group.add_argument('-v', '--verbose', action='store_true',
                              help='Enable verbose output')
     logging_group.add_argument('-q', '--quiet', action='store_true',
                              help='Suppress non-error output')
+    logging_group.add_argument('--row-log', default='every', metavar='POLICY',
+                             help='Per-row "Generated" lines: every, sample:N (first row and every Nth after it) '
+                                  'or summary[:SECONDS] (a progress line every 10s or SECONDS instead) (default: every)')
     parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}',
                        help='Show version and exit')
 
     args = parser.parse_args()
 
+    # Set on the package logger so the service's per-row records are not even created under --quiet
+    package_logger = logging.getLogger('qr_code_generator')
     if args.quiet:
-        logger.setLevel(logging.ERROR)
+        package_logger.setLevel(logging.ERROR)
     elif args.verbose:
-        logger.setLevel(logging.DEBUG)
+        package_logger.setLevel(logging.DEBUG)
 
+    # Imported after parsing so --help, --version and usage errors skip pandas, NumPy, qrcode and PIL
+    from qr_code_generator.service import QRCodeService
     service = QRCodeService()
     
-    exit_code = service.generate_from_excel(
-        args.input,
-        args.output,
-        args.sheet,
-        args.keep_plus,
-        args.overwrite,
-        args.fill_color,
-        args.back_color,
-        args.box_size,
-        args.border,
-        args.error_correction,
-        args.payload_format,
-        args.output_format,
-        args.filename_template,
-        args.dedup,
-        args.allowed_output_path,
-        args.max_file_size_mb,
-        args.max_rows,
-        args.redact_logs,
-        args.dry_run,
-        args.export_manifest,
-        args.manifest_format,
-    )
+    # Log lines are written by a listener thread so console I/O stays off the row loop
+    with queued_logging(), profiled(args.profile):
+        exit_code = service.generate_from_excel(
+            args.input,
+            args.output,
+            args.sheet,
+            args.keep_plus,
+            args.overwrite,
+            args.fill_color,
+            args.back_color,
+            args.box_size,
+            args.border,
+            args.error_correction,
+            args.payload_format,
+            args.output_format,
+            args.filename_template,
+            args.dedup,
+            args.allowed_output_path,
+            args.max_file_size_mb,
+            args.max_rows,
+            args.redact_logs,
+            args.dry_run,
+            args.export_manifest,
+            args.manifest_format,
+            workers=args.workers,
+            render_engine=args.render_engine,
+            cache_dir=args.cache_dir,
+            cache_max_mb=args.cache_max_mb,
+            cache_link=args.cache_link,
+            resume=args.resume,
+            writer_threads=args.writer_threads,
+            write_queue_size=args.write_queue_size,
+            output_archive=args.output_archive,
+            label_sheet=args.label_sheet,
+            label_grid=args.label_grid,
+            page_size=args.page_size,
+            page_margin_mm=args.page_margin,
+            caption_column=args.caption_column,
+            shard_depth=args.shard_depth,
+            row_log=args.row_log,
+        )
+
+    if args.profile:
+        logger.info(f"Profile written to {args.profile} (inspect with: python -m pstats {args.profile})")
 
     sys.exit(exit_code)
 
@@ -0,0 +1,88 @@
+import io
+import os
+import tarfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional, Set
+
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz')
+
+# Image formats that are already compressed are stored as-is in ZIP archives
+STORED_SUFFIXES = ('.png', '.pdf')
+
+
+def archive_kind(path: str | Path) -> Optional[str]:
+    name = str(path).lower()
+    for extension in ARCHIVE_EXTENSIONS:
+        if name.endswith(extension):
+            return 'zip' if extension == '.zip' else 'tar'
+    return None
+
+
+class ArchiveSink:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.kind = archive_kind(self.path)
+        if self.kind is None:
+            raise ValueError(
+                f"Unsupported archive type: {self.path.name}. Supported: {', '.join(ARCHIVE_EXTENSIONS)}"
+            )
+        self.names: Set[str] = set()
+        self._partial = self.path.with_name(self.path.name + '.part')
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._tar: Optional[tarfile.TarFile] = None
+
+    def __enter__(self) -> "ArchiveSink":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(commit=exc_type is None)
+
+    def open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.kind == 'zip':
+            self._zip = zipfile.ZipFile(self._partial, 'w', allowZip64=True)
+        else:
+            mode = 'w:gz' if str(self.path).lower().endswith(('.tar.gz', '.tgz')) else 'w'
+            self._tar = tarfile.open(self._partial, mode)
+
+    def add(self, name: str, write: Callable[[BinaryIO], Any]) -> None:
+        if self._zip is None and self._tar is None:
+            raise RuntimeError("Archive is not open")
+        # Entries are encoded to memory first: writers may need to seek (PIL's PDF writer does), and a
+        # failed render must not leave a truncated entry behind
+        buffer = io.BytesIO()
+        write(buffer)
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_STORED if name.lower().endswith(STORED_SUFFIXES) else zipfile.ZIP_DEFLATED
+            with self._zip.open(info, 'w', force_zip64=True) as stream:
+                stream.write(buffer.getbuffer())
+        elif self._tar is not None:
+            # Tar headers carry the entry size, which is known once the entry is in memory
+            info = tarfile.TarInfo(name)
+            info.size = buffer.tell()
+            info.mtime = int(time.time())
+            buffer.seek(0)
+            self._tar.addfile(info, buffer)
+        self.names.add(name)
+
+    def add_bytes(self, name: str, data: bytes) -> None:
+        self.add(name, lambda stream: stream.write(data))
+
+    def close(self, commit: bool = True) -> None:
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
+        if not self._partial.exists():
+            return
+        if commit:
+            os.replace(self._partial, self.path)
+        else:
+            self._partial.unlink()
@@ -0,0 +1,144 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+
+DEFAULT_CACHE_MAX_MB = 512
+
+
+def render_key(
+    data: str,
+    fill_color: Any = "black",
+    back_color: Any = "white",
+    box_size: int = 10,
+    border: int = 4,
+    error_correction: str = 'L',
+    output_format: str = 'png',
+    render_engine: str = 'pil',
+) -> str:
+    fields = [data, fill_color, back_color, box_size, border, error_correction, output_format.lower(), render_engine]
+    digest = hashlib.sha256()
+    for field in fields:
+        encoded = repr(field).encode('utf-8')
+        digest.update(len(encoded).to_bytes(8, 'big'))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    def __init__(self, directory: str | Path, max_mb: int = DEFAULT_CACHE_MAX_MB, link: bool = False):
+        self.directory = Path(directory)
+        self.max_bytes = max_mb * 1024 * 1024
+        self.link = link
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Path, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False
+        path, _ = entry
+        try:
+            self._materialize(path, destination)
+            os.utime(path)
+        except FileNotFoundError:
+            self._forget(key)
+            self.misses += 1
+            return False
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True
+
+    def store(self, key: str, source: Path) -> None:
+        if key in self._entries:
+            return
+        path = self._entry_path(key, source.suffix)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        os.close(fd)
+        try:
+            shutil.copyfile(source, tmp_name)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        size = path.stat().st_size
+        self._entries[key] = (path, size)
+        self._total_bytes += size
+        self._evict()
+
+    def release(self, destination: Path) -> None:
+        # A hardlinked output must not be rewritten in place, or the cached copy changes too
+        try:
+            if destination.stat().st_nlink > 1:
+                destination.unlink()
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'cache_evictions': self.evictions,
+            'cache_bytes': self._total_bytes,
+        }
+
+    def _materialize(self, path: Path, destination: Path) -> None:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        tmp_name = f"{destination}.{os.getpid()}.tmp"
+        try:
+            if self.link:
+                try:
+                    os.link(path, tmp_name)
+                except OSError:
+                    shutil.copyfile(path, tmp_name)
+            else:
+                shutil.copyfile(path, tmp_name)
+            os.replace(tmp_name, destination)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def _entry_path(self, key: str, suffix: str) -> Path:
+        return self.directory / key[:2] / f"{key}{suffix}"
+
+    def _load_index(self) -> None:
+        found = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir() or len(shard.name) != 2:
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.is_file() or entry.name.endswith('.tmp'):
+                    continue
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name.split('.', 1)[0], Path(entry.path), stat.st_size))
+        for _, key, path, size in sorted(found):
+            self._entries[key] = (path, size)
+            self._total_bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, (path, _) = next(iter(self._entries.items()))
+            self._forget(key)
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            self.evictions += 1
+
+    def _forget(self, key: str) -> None:
+        _, size = self._entries.pop(key)
+        self._total_bytes -= size
@@ -1,8 +1,16 @@
 import re
-from typing import Optional
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple
+
+
+PhoneArray = pd.Series | np.ndarray
 
 
 class PhoneFormatter:
+    NON_DIGITS = re.compile(r'\D')
+    DIGITS = re.compile(r'\d')
+
     @staticmethod
     def format_phone(phone: str, keep_plus: bool = True) -> str:
         phone_str = str(phone).strip()
@@ -12,7 +20,7 @@ class PhoneFormatter:
 
     @staticmethod
     def normalize_phone(phone: str) -> str:
-        digits = re.sub(r'\D', '', phone)
+        digits = PhoneFormatter.NON_DIGITS.sub('', phone)
         if phone.startswith('00') and len(digits) > 11:
             digits = digits[2:]
         elif digits.startswith('0') and len(digits) > 10:
@@ -25,9 +33,67 @@ class PhoneFormatter:
     def validate_phone(phone: str) -> tuple[bool, Optional[str]]:
         if not phone or not str(phone).strip():
             return False, "Phone number cannot be empty"
-        digits = re.sub(r'\D', '', str(phone))
+        digits = PhoneFormatter.NON_DIGITS.sub('', str(phone))
         if len(digits) < 7:
             return False, "Phone number must have at least 7 digits"
         if len(digits) > 15:
             return False, "Phone number cannot exceed 15 digits (E.164)"
         return True, None
+
+    @staticmethod
+    def format_many(phones: PhoneArray, keep_plus: bool = True) -> PhoneArray:
+        text = PhoneFormatter._as_text(phones).str.strip()
+        if keep_plus:
+            text = text.where(text.str.startswith('+'), '+' + text)
+        return PhoneFormatter._like(phones, text)
+
+    @staticmethod
+    def normalize_many(phones: PhoneArray) -> PhoneArray:
+        text = PhoneFormatter._as_text(phones)
+        digits = text.str.replace(PhoneFormatter.NON_DIGITS, '', regex=True)
+        lengths = digits.str.len()
+        international = text.str.startswith('00') & (lengths > 11)
+        trunk = ~international & digits.str.startswith('0') & (lengths > 10)
+        digits = digits.mask(international, digits.str[2:]).mask(trunk, digits.str[1:])
+        return PhoneFormatter._like(phones, '+' + digits)
+
+    @staticmethod
+    def validate_many(phones: PhoneArray) -> Tuple[PhoneArray, PhoneArray]:
+        series = phones if isinstance(phones, pd.Series) else pd.Series(phones, dtype=object)
+        values = series.to_numpy(dtype=object)
+        falsy = np.fromiter(map(PhoneFormatter._is_falsy, values), dtype=bool, count=len(values))
+        text = pd.Series(values, dtype=object).astype(str)
+        empty = falsy | (text.str.strip() == '').to_numpy()
+        digit_count = text.str.count(PhoneFormatter.DIGITS).to_numpy()
+        too_short = ~empty & (digit_count < 7)
+        too_long = ~empty & (digit_count > 15)
+        errors = np.select(
+            [empty, too_short, too_long],
+            [
+                "Phone number cannot be empty",
+                "Phone number must have at least 7 digits",
+                "Phone number cannot exceed 15 digits (E.164)",
+            ],
+            default=None,
+        )
+        valid = ~(empty | too_short | too_long)
+        if isinstance(phones, pd.Series):
+            return pd.Series(valid, index=phones.index), pd.Series(errors, index=phones.index, dtype=object)
+        return valid, errors
+
+    @staticmethod
+    def _is_falsy(value: object) -> bool:
+        # Mirrors validate_phone's "not phone"; bool(pd.NA) raises, so it is judged by its text like NaN is
+        return value is not pd.NA and not value
+
+    @staticmethod
+    def _as_text(phones: PhoneArray) -> pd.Series:
+        if isinstance(phones, pd.Series):
+            return phones.astype(str)
+        return pd.Series(phones, dtype=object).astype(str)
+
+    @staticmethod
+    def _like(phones: PhoneArray, result: pd.Series) -> PhoneArray:
+        if isinstance(phones, pd.Series):
+            return result.set_axis(phones.index)
+        return result.to_numpy(dtype=object)
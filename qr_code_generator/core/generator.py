@@ -1,9 +1,12 @@
+import io
+import time
 import qrcode
-from qrcode.image.svg import SvgPathImage
 from qrcode.constants import ERROR_CORRECT_L, ERROR_CORRECT_M, ERROR_CORRECT_Q, ERROR_CORRECT_H
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, BinaryIO
 from qr_code_generator.core.interfaces import QRCodeResult
+from qr_code_generator.core.masks import FastMaskQRCode
+from qr_code_generator.core.renderer import SvgMatrixImage, render_matrix
 from qr_code_generator.plugins.output import (
     OutputAdapter,
     PNGOutputAdapter,
@@ -20,6 +23,8 @@ class QRCodeGenerator:
         'H': ERROR_CORRECT_H,
     }
 
+    RENDER_ENGINES = ('pil', 'numpy')
+
     OUTPUT_ADAPTERS: Dict[str, type[OutputAdapter]] = {
         'png': PNGOutputAdapter,
         'svg': SVGOutputAdapter,
@@ -35,32 +40,26 @@ class QRCodeGenerator:
         box_size: int = 10,
         border: int = 4,
         error_correction: str = 'L',
-        output_format: str = 'png'
+        output_format: str = 'png',
+        render_engine: str = 'pil',
+        make_parents: bool = True,
     ) -> QRCodeResult:
         try:
             output_format = output_format.lower()
-            adapter_cls = self.OUTPUT_ADAPTERS.get(output_format)
-            if adapter_cls is None:
+            if output_format not in self.OUTPUT_ADAPTERS:
                 return QRCodeResult(success=False, error=f"Unsupported output format: {output_format}")
+            if render_engine not in self.RENDER_ENGINES:
+                return QRCodeResult(success=False, error=f"Unsupported render engine: {render_engine}")
 
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=self.ERROR_LEVELS.get(error_correction, ERROR_CORRECT_L),
-                box_size=box_size,
-                border=border,
-            )
-            qr.add_data(data)
-            qr.make(fit=True)
-
-            if output_format == 'svg':
-                qr_image = qr.make_image(image_factory=SvgPathImage)
-            else:
-                qr_image = qr.make_image(fill_color=fill_color, back_color=back_color)
-
-            adapter = adapter_cls()
-            result = adapter.save(qr_image, output_path)
+            start = time.perf_counter()
+            qr = self.make_qr(data, box_size, border, error_correction)
+            encoded = time.perf_counter()
+            qr_image = self.make_image(qr, output_format, fill_color, back_color, render_engine)
+            rendered = time.perf_counter()
+            result = self.save(qr_image, output_path, output_format, make_parents)
             if not result.success:
                 return result
+            saved = time.perf_counter()
 
             return QRCodeResult(
                 success=True,
@@ -71,11 +70,121 @@ class QRCodeGenerator:
                     'border': border,
                     'error_correction': error_correction,
                     'output_format': output_format,
+                    'render_engine': render_engine,
+                    'timings': {'encode': encoded - start, 'render': rendered - encoded, 'save': saved - rendered},
                 }
             )
         except Exception as e:
             return QRCodeResult(success=False, error=str(e))
 
+    def render(
+        self,
+        data: str,
+        fill_color: str = "black",
+        back_color: str = "white",
+        box_size: int = 10,
+        border: int = 4,
+        error_correction: str = 'L',
+        output_format: str = 'png',
+        render_engine: str = 'pil',
+    ) -> Any:
+        qr = self.make_qr(data, box_size, border, error_correction)
+        return self.make_image(qr, output_format.lower(), fill_color, back_color, render_engine)
+
+    def save(self, qr_image: Any, output_path: Path, output_format: str = 'png', make_parents: bool = True) -> QRCodeResult:
+        adapter_cls = self.OUTPUT_ADAPTERS.get(output_format.lower())
+        if adapter_cls is None:
+            return QRCodeResult(success=False, error=f"Unsupported output format: {output_format}")
+        return adapter_cls().save(qr_image, output_path, make_parents=make_parents)
+
+    def generate_bytes(
+        self,
+        data: str,
+        output_format: str = 'png',
+        fill_color: str = "black",
+        back_color: str = "white",
+        box_size: int = 10,
+        border: int = 4,
+        error_correction: str = 'L',
+        render_engine: str = 'pil',
+    ) -> bytes:
+        buffer = io.BytesIO()
+        result = self.render_to_buffer(
+            data, buffer, output_format, fill_color, back_color, box_size, border, error_correction, render_engine
+        )
+        if not result.success:
+            raise ValueError(result.error)
+        return buffer.getvalue()
+
+    def render_to_buffer(
+        self,
+        data: str,
+        buffer: BinaryIO,
+        output_format: str = 'png',
+        fill_color: str = "black",
+        back_color: str = "white",
+        box_size: int = 10,
+        border: int = 4,
+        error_correction: str = 'L',
+        render_engine: str = 'pil',
+    ) -> QRCodeResult:
+        try:
+            output_format = output_format.lower()
+            if output_format not in self.OUTPUT_ADAPTERS:
+                return QRCodeResult(success=False, error=f"Unsupported output format: {output_format}")
+            if render_engine not in self.RENDER_ENGINES:
+                return QRCodeResult(success=False, error=f"Unsupported render engine: {render_engine}")
+
+            qr_image = self.render(data, fill_color, back_color, box_size, border, error_correction, output_format, render_engine)
+            start = buffer.tell() if buffer.seekable() else 0
+            self.write(qr_image, buffer, output_format)
+            return QRCodeResult(
+                success=True,
+                metadata={
+                    'data_length': len(data),
+                    'bytes_written': buffer.tell() - start if buffer.seekable() else None,
+                    'mime_type': self.OUTPUT_ADAPTERS[output_format]().mime_type,
+                    'output_format': output_format,
+                    'render_engine': render_engine,
+                }
+            )
+        except Exception as e:
+            return QRCodeResult(success=False, error=str(e))
+
+    def write(self, qr_image: Any, stream: BinaryIO, output_format: str = 'png') -> None:
+        adapter_cls = self.OUTPUT_ADAPTERS.get(output_format.lower())
+        if adapter_cls is None:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        adapter = adapter_cls()
+        if not adapter.supports_stream():
+            raise ValueError(f"{adapter.name} output cannot be written to a stream")
+        adapter.write(qr_image, stream)
+
+    def make_qr(self, data: str, box_size: int = 10, border: int = 4, error_correction: str = 'L') -> qrcode.QRCode:
+        qr = FastMaskQRCode(
+            version=1,
+            error_correction=self.ERROR_LEVELS.get(error_correction, ERROR_CORRECT_L),
+            box_size=box_size,
+            border=border,
+        )
+        qr.add_data(data)
+        qr.make(fit=True)
+        return qr
+
+    def make_image(
+        self,
+        qr: qrcode.QRCode,
+        output_format: str = 'png',
+        fill_color: str = "black",
+        back_color: str = "white",
+        render_engine: str = 'pil',
+    ) -> Any:
+        if output_format == 'svg':
+            return SvgMatrixImage(qr.modules, qr.box_size, qr.border, fill_color, back_color)
+        if render_engine == 'numpy':
+            return render_matrix(qr.modules, qr.box_size, qr.border, fill_color, back_color)
+        return qr.make_image(fill_color=fill_color, back_color=back_color)
+
     def validate_data(self, data: str) -> tuple[bool, Optional[str]]:
         if not data or not data.strip():
             return False, "Data cannot be empty"
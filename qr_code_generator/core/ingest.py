@@ -0,0 +1,120 @@
+import time
+from itertools import islice
+import pandas as pd
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from qr_code_generator.core.validator import DataValidator, RowValidity
+from qr_code_generator.plugins.input import DataReader
+from qr_code_generator.utils.constants import DEFAULT_MAX_FILE_SIZE_MB, DEFAULT_MAX_ROWS
+from qr_code_generator.utils.file_utils import FileValidator
+
+
+class RowLimitExceeded(Exception):
+    pass
+
+
+@dataclass
+class RowChunk:
+    first_row: int
+    rows: List[Dict[str, str]]
+    phones: pd.Series
+    validity: RowValidity
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class IngestionStage:
+    MAX_REPORTED_ISSUES = 100
+    FIRST_CHUNK_SIZE = 32
+
+    def __init__(
+        self,
+        reader: DataReader,
+        validator: Optional[DataValidator] = None,
+        max_file_size_mb: int = DEFAULT_MAX_FILE_SIZE_MB,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        chunk_size: int = 2048,
+    ):
+        self.reader = reader
+        self.validator = validator or DataValidator()
+        self.max_file_size_mb = max_file_size_mb
+        self.max_rows = max_rows
+        self.chunk_size = chunk_size
+        self.columns: List[str] = []
+        self.schema_errors: List[str] = []
+        self.row_count = 0
+        self.valid_count = 0
+        self.issues: List[Dict[str, Any]] = []
+        self.seconds = 0.0
+        self.validate_seconds = 0.0
+
+    def check_file(self, source: str | Path) -> Tuple[bool, Optional[str]]:
+        valid, error = FileValidator.validate_excel_file(str(source))
+        if not valid:
+            return valid, error
+        return FileValidator.check_file_size(str(source), self.max_file_size_mb)
+
+    def chunks(self, source: str | Path) -> Iterator[RowChunk]:
+        start: Optional[float] = time.perf_counter()
+        # A count-only pass rejects over-limit input before any code is rendered or written
+        if self.reader.exceeds_rows(source, self.max_rows):
+            raise RowLimitExceeded(f"Row count exceeds limit ({self.max_rows})")
+        stream = self.reader.open(source)
+        try:
+            self.columns = stream.columns
+            _, self.schema_errors = self.validator.validate_columns(self.columns)
+            rows = iter(stream)
+            # Start small so the first codes render right away, then grow to amortise pandas overhead
+            size = min(self.FIRST_CHUNK_SIZE, self.chunk_size)
+            while True:
+                batch = self._take(rows, size)
+                if not batch:
+                    break
+                chunk = self._build_chunk(batch)
+                self.seconds += time.perf_counter() - start
+                start = None
+                yield chunk
+                start = time.perf_counter()
+                size = min(size * 2, self.chunk_size)
+        finally:
+            if start is not None:
+                self.seconds += time.perf_counter() - start
+            stream.close()
+
+    def rows(self, source: str | Path) -> Iterator[Tuple[int, Dict[str, str]]]:
+        for chunk in self.chunks(source):
+            yield from enumerate(chunk.rows, start=chunk.first_row)
+
+    def validation_report(self) -> Tuple[bool, Dict[str, Any]]:
+        if self.schema_errors:
+            return False, {'schema_errors': self.schema_errors}
+        return self.valid_count > 0, {
+            'valid_count': self.valid_count,
+            'invalid_count': self.row_count - self.valid_count,
+            'issues': self.issues,
+        }
+
+    def _take(self, rows: Iterator[Dict[str, str]], size: int) -> List[Dict[str, str]]:
+        # Backstop for a stale stored dimension that let the up-front count pass
+        remaining = self.max_rows - self.row_count
+        if remaining <= 0:
+            if next(rows, None) is not None:
+                raise RowLimitExceeded(f"Row count exceeds limit ({self.max_rows})")
+            return []
+        return list(islice(rows, min(size, remaining)))
+
+    def _build_chunk(self, batch: List[Dict[str, str]]) -> RowChunk:
+        first_row = self.row_count + 2
+        self.row_count += len(batch)
+        phones = pd.Series([row.get('Phone') for row in batch], dtype=object)
+        start = time.perf_counter()
+        validity = self.validator.row_validity(phones)
+        if not self.schema_errors:
+            self.valid_count += int(validity.valid.sum())
+            remaining = self.MAX_REPORTED_ISSUES - len(self.issues)
+            if remaining > 0:
+                self.issues.extend(validity.issues(first_row, limit=remaining))
+        self.validate_seconds += time.perf_counter() - start
+        return RowChunk(first_row=first_row, rows=batch, phones=phones, validity=validity)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 from pathlib import Path
 from dataclasses import dataclass
 
@@ -17,6 +17,10 @@ class IDataReader(ABC):
     def read(self, source: str | Path) -> List[Dict[str, Any]]:
         pass
 
+    @abstractmethod
+    def iter_rows(self, source: str | Path) -> Iterator[Dict[str, Any]]:
+        pass
+
     @abstractmethod
     def validate_schema(self, source: str | Path) -> tuple[bool, List[str]]:
         pass
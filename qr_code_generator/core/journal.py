@@ -0,0 +1,74 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, TextIO
+
+
+JOURNAL_FILENAME = '.qrgen-journal.jsonl'
+
+
+class RunJournal:
+    def __init__(self, directory: str | Path):
+        self.path = Path(directory) / JOURNAL_FILENAME
+        self._entries: Dict[str, str] = {}
+        self._file: Optional[TextIO] = None
+
+    def __enter__(self) -> "RunJournal":
+        self.load()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def load(self) -> Dict[str, str]:
+        self._entries = {}
+        line_count = 0
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        record = json.loads(line)
+                        self._entries[record['file']] = record['hash']
+                    except (ValueError, KeyError, TypeError):
+                        # A crash can leave a partially written last line behind
+                        continue
+        if line_count > 2 * len(self._entries) + 100:
+            self._compact()
+        return dict(self._entries)
+
+    def is_current(self, filename: str, key: str) -> bool:
+        return self._entries.get(filename) == key
+
+    def is_known(self, filename: str) -> bool:
+        return filename in self._entries
+
+    def record(self, row_number: int, filename: str, key: str) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+            if self._ends_mid_line():
+                # Terminate a fragment left by a crash so the next record is not merged into it
+                self._file.write('\n')
+        self._file.write(json.dumps({'row': row_number, 'file': filename, 'hash': key}) + '\n')
+        self._file.flush()
+        self._entries[filename] = key
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _ends_mid_line(self) -> bool:
+        with open(self.path, 'rb') as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b'\n'
+
+    def _compact(self) -> None:
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for filename, key in self._entries.items():
+                f.write(json.dumps({'file': filename, 'hash': key}) + '\n')
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,208 @@
+import os
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, List, Optional, Sequence, Tuple
+from PIL import ImageColor
+
+
+MM = 72 / 25.4
+
+PAGE_SIZES = {
+    'a4': (595.28, 841.89),
+    'a5': (419.53, 595.28),
+    'letter': (612.0, 792.0),
+    'legal': (612.0, 1008.0),
+}
+
+DEFAULT_LABEL_GRID = '3x8'
+
+# Helvetica advance widths (1/1000 em) for ASCII 32-126, used to centre and fit captions
+HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+
+
+def parse_grid(grid: str) -> Tuple[int, int]:
+    try:
+        columns, rows = (int(part) for part in grid.lower().split('x'))
+    except ValueError:
+        raise ValueError(f"Invalid label grid: {grid}. Use COLUMNSxROWS, e.g. 3x8")
+    if columns < 1 or rows < 1:
+        raise ValueError(f"Invalid label grid: {grid}. Columns and rows must be at least 1")
+    return columns, rows
+
+
+def page_dimensions(page_size: str) -> Tuple[float, float]:
+    dimensions = PAGE_SIZES.get(page_size.lower())
+    if dimensions is None:
+        raise ValueError(f"Unsupported page size: {page_size}. Supported: {', '.join(PAGE_SIZES)}")
+    return dimensions
+
+
+def text_width(text: str, font_size: float) -> float:
+    return sum(HELVETICA_WIDTHS[ord(c) - 32] if 32 <= ord(c) <= 126 else 556 for c in text) * font_size / 1000
+
+
+def _pdf_color(color: Any) -> str:
+    rgb = ImageColor.getcolor(color, 'RGB') if isinstance(color, str) else tuple(color[:3])
+    return ' '.join(f'{channel / 255:.4g}' for channel in rgb)
+
+
+def _pdf_text(text: str) -> bytes:
+    encoded = text.encode('cp1252', errors='replace')
+    return encoded.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+class LabelSheetWriter:
+    def __init__(
+        self,
+        path: str | Path,
+        grid: str = DEFAULT_LABEL_GRID,
+        page_size: str = 'A4',
+        margin_mm: float = 10.0,
+        fill_color: Any = "black",
+        back_color: Any = "white",
+        font_size: float = 8.0,
+        captions: bool = False,
+    ):
+        self.path = Path(path)
+        self.columns, self.rows = parse_grid(grid)
+        self.page_width, self.page_height = page_dimensions(page_size)
+        self.margin = margin_mm * MM
+        self.font_size = font_size
+        self.cell_width = (self.page_width - 2 * self.margin) / self.columns
+        self.cell_height = (self.page_height - 2 * self.margin) / self.rows
+        self.caption_height = font_size * 1.6 if captions else 0.0
+        if min(self.cell_width, self.cell_height - self.caption_height) <= 0:
+            raise ValueError("Page margins leave no room for the label grid")
+        self.fill = _pdf_color(fill_color).encode('ascii')
+        self.back = None if back_color == "transparent" else _pdf_color(back_color).encode('ascii')
+        self.labels = 0
+        self.pages = 0
+        self._partial = self.path.with_name(self.path.name + '.part')
+        self._file: Optional[BinaryIO] = None
+        self._offsets: List[int] = []
+        self._page_ids: List[int] = []
+        self._content: List[bytes] = []
+
+    def __enter__(self) -> "LabelSheetWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(commit=exc_type is None)
+
+    @property
+    def per_page(self) -> int:
+        return self.columns * self.rows
+
+    def open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._partial, 'wb')
+        self._file.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        # Objects 1 (catalog) and 2 (page tree) are written last, once every page id is known
+        self._offsets = [0, 0]
+        self._write_object(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+
+    def add(self, modules: Sequence[Sequence[bool]], border: int = 4, caption: str = '') -> int:
+        page = self.pages + 1
+        slot = self.labels % self.per_page
+        column, row = slot % self.columns, slot // self.columns
+        left = self.margin + column * self.cell_width
+        top = self.page_height - self.margin - row * self.cell_height
+        self._content.append(self._draw_code(modules, border, left, top))
+        if caption and self.caption_height:
+            self._content.append(self._draw_caption(caption, left, top - self.cell_height))
+        self.labels += 1
+        if self.labels % self.per_page == 0:
+            self._flush_page()
+        return page
+
+    def close(self, commit: bool = True) -> None:
+        if self._file is None:
+            return
+        try:
+            if commit:
+                if self._content or not self._page_ids:
+                    self._flush_page()
+                self._finish()
+        finally:
+            self._file.close()
+            self._file = None
+        if commit:
+            os.replace(self._partial, self.path)
+        else:
+            self._partial.unlink()
+
+    def _draw_code(self, modules: Sequence[Sequence[bool]], border: int, left: float, top: float) -> bytes:
+        count = len(modules) + 2 * border
+        side = min(self.cell_width, self.cell_height - self.caption_height)
+        module = side / count
+        x0 = left + (self.cell_width - side) / 2
+        y0 = top - (self.cell_height - self.caption_height - side) / 2 - side
+        ops = [b'q']
+        if self.back is not None:
+            ops.append(b'%s rg %.3f %.3f %.3f %.3f re f' % (self.back, x0, y0, side, side))
+        ops.append(b'%s rg' % self.fill)
+        # Horizontal runs of dark modules become one rectangle each
+        for r, line in enumerate(modules):
+            y = y0 + side - (r + border + 1) * module
+            start = None
+            for c, dark in enumerate(list(line) + [False]):
+                if dark and start is None:
+                    start = c
+                elif not dark and start is not None:
+                    ops.append(b'%.3f %.3f %.3f %.3f re' % (x0 + (start + border) * module, y, (c - start) * module, module))
+                    start = None
+        ops.append(b'f Q')
+        return b'\n'.join(ops)
+
+    def _draw_caption(self, caption: str, left: float, bottom: float) -> bytes:
+        available = self.cell_width - 4
+        if text_width(caption, self.font_size) > available:
+            while caption and text_width(caption + '...', self.font_size) > available:
+                caption = caption[:-1]
+            caption += '...'
+        x = left + (self.cell_width - text_width(caption, self.font_size)) / 2
+        y = bottom + (self.caption_height - self.font_size) / 2 + self.font_size * 0.2
+        return b'BT /F1 %.1f Tf 0 0 0 rg %.3f %.3f Td (%s) Tj ET' % (self.font_size, x, y, _pdf_text(caption))
+
+    def _flush_page(self) -> None:
+        content = zlib.compress(b'\n'.join(self._content))
+        self._content = []
+        content_id = self._write_object(
+            b'<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream' % (len(content), content)
+        )
+        page_id = self._write_object(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] /Contents %d 0 R '
+            b'/Resources << /Font << /F1 3 0 R >> >> >>' % (self.page_width, self.page_height, content_id)
+        )
+        self._page_ids.append(page_id)
+        self.pages += 1
+
+    def _write_object(self, body: bytes, object_id: Optional[int] = None) -> int:
+        assert self._file is not None
+        if object_id is None:
+            self._offsets.append(0)
+            object_id = len(self._offsets)
+        self._offsets[object_id - 1] = self._file.tell()
+        self._file.write(b'%d 0 obj\n%s\nendobj\n' % (object_id, body))
+        return object_id
+
+    def _finish(self) -> None:
+        assert self._file is not None
+        kids = b' '.join(b'%d 0 R' % page_id for page_id in self._page_ids)
+        self._write_object(b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(self._page_ids)), 2)
+        self._write_object(b'<< /Type /Catalog /Pages 2 0 R >>', 1)
+        xref = self._file.tell()
+        self._file.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(self._offsets) + 1))
+        for offset in self._offsets:
+            self._file.write(b'%010d 00000 n \n' % offset)
+        self._file.write(
+            b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(self._offsets) + 1, xref)
+        )
@@ -0,0 +1,105 @@
+from functools import lru_cache
+from typing import Sequence, Tuple
+import numpy as np
+import qrcode
+from numpy.lib.stride_tricks import sliding_window_view
+from qrcode.main import copy_2d_array, precomputed_qr_blanks
+
+
+# 1:1:3:1:1 finder-like runs with four light modules on either side (ISO/IEC 18004 rule 3)
+_FINDER_PATTERNS = (
+    int('10111010000', 2),
+    int('00001011101', 2),
+)
+_WINDOW_WEIGHTS = 1 << np.arange(10, -1, -1)
+
+
+@lru_cache(maxsize=None)
+def mask_patterns(size: int) -> Tuple[np.ndarray, ...]:
+    i, j = np.indices((size, size))
+    patterns = (
+        (i + j) % 2 == 0,
+        i % 2 == 0,
+        j % 3 == 0,
+        (i + j) % 3 == 0,
+        (i // 2 + j // 3) % 2 == 0,
+        (i * j) % 2 + (i * j) % 3 == 0,
+        ((i * j) % 2 + (i * j) % 3) % 2 == 0,
+        ((i * j) % 3 + (i + j) % 2) % 2 == 0,
+    )
+    for pattern in patterns:
+        pattern.setflags(write=False)
+    return patterns
+
+
+def _run_penalty(modules: np.ndarray) -> int:
+    rows, cols = modules.shape
+    boundaries = np.ones((rows, cols + 1), dtype=bool)
+    boundaries[:, 1:-1] = modules[:, 1:] != modules[:, :-1]
+    # Row ends sit next to the following row start, so those gaps have length 1 and are ignored
+    lengths = np.diff(np.flatnonzero(boundaries))
+    long_runs = lengths[lengths >= 5]
+    return int((long_runs - 2).sum())
+
+
+def _block_penalty(modules: np.ndarray) -> int:
+    top_left = modules[:-1, :-1]
+    same = (top_left == modules[:-1, 1:]) & (top_left == modules[1:, :-1]) & (top_left == modules[1:, 1:])
+    return 3 * int(same.sum())
+
+
+def _finder_penalty(modules: np.ndarray) -> int:
+    if modules.shape[1] < 11:
+        return 0
+    windows = sliding_window_view(modules, 11, axis=1) @ _WINDOW_WEIGHTS
+    return 40 * int(np.isin(windows, _FINDER_PATTERNS).sum())
+
+
+def _balance_penalty(modules: np.ndarray) -> int:
+    dark_count = int(modules.sum())
+    percent = float(dark_count) / (modules.shape[0] ** 2)
+    return int(abs(percent * 100 - 50) / 5) * 10
+
+
+def lost_point(modules: Sequence[Sequence[bool]] | np.ndarray) -> int:
+    matrix = np.asarray(modules, dtype=bool)
+    transposed = matrix.T
+    return (
+        _run_penalty(matrix) + _run_penalty(transposed)
+        + _block_penalty(matrix)
+        + _finder_penalty(matrix) + _finder_penalty(transposed)
+        + _balance_penalty(matrix)
+    )
+
+
+class FastMaskQRCode(qrcode.QRCode):
+    def best_mask_pattern(self) -> int:
+        # Only data modules depend on the mask, so one mapped matrix plus eight XORs replaces eight map_data passes
+        self.makeImpl(True, 0)
+        base = np.array(self.modules, dtype=bool)
+        data_modules = self._data_module_mask()
+        patterns = mask_patterns(self.modules_count)
+
+        min_lost_point = 0
+        pattern = 0
+
+        for i in range(8):
+            flip = data_modules & (patterns[0] != patterns[i])
+            lost = lost_point(base ^ flip)
+
+            if i == 0 or min_lost_point > lost:
+                min_lost_point = lost
+                pattern = i
+
+        return pattern
+
+    def _data_module_mask(self) -> np.ndarray:
+        modules = self.modules
+        self.modules = copy_2d_array(precomputed_qr_blanks[self.version])
+        try:
+            self.setup_type_info(True, 0)
+            if self.version >= 7:
+                self.setup_type_number(True)
+            return np.array([[cell is None for cell in row] for row in self.modules], dtype=bool)
+        finally:
+            self.modules = modules
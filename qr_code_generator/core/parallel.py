@@ -0,0 +1,56 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+
+class OrderedRenderPool:
+    def __init__(self, workers: int = 1, max_pending: Optional[int] = None):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.max_pending = max_pending or workers * 4
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Deque[Tuple[Any, Future]] = deque()
+
+    def __enter__(self) -> "OrderedRenderPool":
+        if self.workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(cancel=exc_type is not None)
+
+    def submit(self, context: Any, fn: Callable[..., Any], *args: Any) -> List[Tuple[Any, Any]]:
+        if self._executor is None:
+            return self.submit_result(context, fn(*args))
+        return self.submit_future(context, self._executor.submit(fn, *args))
+
+    def submit_result(self, context: Any, result: Any) -> List[Tuple[Any, Any]]:
+        if not self._pending:
+            return [(context, result)]
+        future: Future = Future()
+        future.set_result(result)
+        return self.submit_future(context, future)
+
+    def submit_future(self, context: Any, future: Future) -> List[Tuple[Any, Any]]:
+        self._pending.append((context, future))
+        return self._collect()
+
+    def drain(self) -> List[Tuple[Any, Any]]:
+        return [self._pop() for _ in range(len(self._pending))]
+
+    def close(self, cancel: bool = False) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=cancel)
+            self._executor = None
+        self._pending.clear()
+
+    def _pop(self) -> Tuple[Any, Any]:
+        context, future = self._pending.popleft()
+        return context, future.result()
+
+    def _collect(self) -> List[Tuple[Any, Any]]:
+        completed = []
+        while self._pending and (len(self._pending) > self.max_pending or self._pending[0][1].done()):
+            completed.append(self._pop())
+        return completed
@@ -0,0 +1,101 @@
+import os
+from typing import Any, BinaryIO, Iterator, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import quoteattr
+import numpy as np
+from PIL import Image, ImageColor
+
+
+def _normalize_color(color: Any) -> Any:
+    try:
+        return color.lower()
+    except AttributeError:
+        return color
+
+
+def render_matrix(
+    modules: Sequence[Sequence[bool]] | np.ndarray,
+    box_size: int = 10,
+    border: int = 4,
+    fill_color: Any = "black",
+    back_color: Any = "white",
+) -> Image.Image:
+    dark = np.asarray(modules, dtype=bool)
+    if border:
+        dark = np.pad(dark, border, constant_values=False)
+    pixels = np.repeat(np.repeat(dark, box_size, axis=0), box_size, axis=1)
+
+    fill_color = _normalize_color(fill_color)
+    back_color = _normalize_color(back_color)
+
+    # Mirrors qrcode.image.pil.PilImage: 1-bit for black on white, colour otherwise
+    if fill_color == "black" and back_color == "white":
+        return Image.fromarray(~pixels)
+
+    image = Image.fromarray(pixels.astype(np.uint8), mode="P")
+    fill_rgb = ImageColor.getcolor(fill_color, "RGB") if isinstance(fill_color, str) else tuple(fill_color[:3])
+    if back_color == "transparent":
+        image.putpalette([0, 0, 0, *fill_rgb])
+        image.info["transparency"] = 0
+    else:
+        back_rgb = ImageColor.getcolor(back_color, "RGB") if isinstance(back_color, str) else tuple(back_color[:3])
+        image.putpalette([*back_rgb, *fill_rgb])
+    return image
+
+
+def _svg_color(color: Any) -> str:
+    if isinstance(color, str):
+        return color
+    return '#{:02x}{:02x}{:02x}'.format(*color[:3])
+
+
+def svg_runs(modules: Sequence[Sequence[bool]] | np.ndarray) -> Iterator[Tuple[int, int, int]]:
+    dark = np.asarray(modules, dtype=bool)
+    edges = np.diff(np.pad(dark, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return zip(rows.tolist(), starts.tolist(), (ends - starts).tolist())
+
+
+class SvgMatrixImage:
+    kind = 'SVG'
+
+    def __init__(
+        self,
+        modules: Sequence[Sequence[bool]] | np.ndarray,
+        box_size: int = 10,
+        border: int = 4,
+        fill_color: Any = "black",
+        back_color: Any = "white",
+    ):
+        self.modules = modules
+        self.box_size = box_size
+        self.border = border
+        self.fill_color = fill_color
+        self.back_color = back_color
+        self.width = len(modules) + 2 * border
+
+    def save(self, stream: BinaryIO | str | os.PathLike, kind: Optional[str] = None) -> None:
+        if isinstance(stream, (str, os.PathLike)):
+            with open(stream, 'wb') as f:
+                return self.save(f)
+        size = f'{self.width * self.box_size / 10:g}mm'
+        stream.write(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="{size}" height="{size}" '
+            f'viewBox="0 0 {self.width} {self.width}" shape-rendering="crispEdges">'.encode('utf-8')
+        )
+        if _normalize_color(self.back_color) != "transparent":
+            stream.write(f'<rect width="100%" height="100%" fill={quoteattr(_svg_color(self.back_color))}/>'.encode('utf-8'))
+        stream.write(f'<path fill={quoteattr(_svg_color(self.fill_color))} d="'.encode('utf-8'))
+        # One rectangle per horizontal run of dark modules, emitted as the rows are scanned
+        offset = self.border
+        row_parts: List[str] = []
+        current = None
+        for row, start, length in svg_runs(self.modules):
+            if row != current and row_parts:
+                stream.write(''.join(row_parts).encode('ascii'))
+                row_parts = []
+            current = row
+            row_parts.append(f'M{start + offset} {row + offset}h{length}v1h-{length}z')
+        stream.write(''.join(row_parts).encode('ascii'))
+        stream.write(b'"/></svg>\n')
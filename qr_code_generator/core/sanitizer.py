@@ -1,12 +1,19 @@
+import os
 import re
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 from qr_code_generator.utils.constants import PATH_TRAVERSAL_PATTERNS, WINDOWS_RESERVED_NAMES, MAX_FILENAME_LENGTH
 
 
+# Built once at import; a compiled character class beats str.translate on typical filenames
+ILLEGAL_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+TRAVERSAL_PATTERN = re.compile('|'.join(re.escape(pattern.lower()) for pattern in PATH_TRAVERSAL_PATTERNS), re.IGNORECASE)
+DRIVE_PREFIX = re.compile(r'[a-zA-Z]:[/\\]')
+
+
 class FilenameSanitizer:
     @staticmethod
     def sanitize_filename(filename: str, max_length: int = MAX_FILENAME_LENGTH) -> str:
-        sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
+        sanitized = ILLEGAL_FILENAME_CHARS.sub('_', filename)
         name_without_ext = sanitized.rsplit('.', 1)[0] if '.' in sanitized else sanitized
         if name_without_ext.upper() in WINDOWS_RESERVED_NAMES:
             sanitized = f"_{sanitized}"
@@ -17,9 +24,16 @@ class FilenameSanitizer:
             sanitized = name_part[:max_name_length] + f".{ext}" if ext else name_part[:max_length]
         return sanitized
 
+    @staticmethod
+    def sanitize_filename_many(filenames: Iterable[str], max_length: int = MAX_FILENAME_LENGTH) -> List[str]:
+        seen: Dict[str, str] = {}
+        return [
+            seen[name] if name in seen else seen.setdefault(name, FilenameSanitizer.sanitize_filename(name, max_length))
+            for name in filenames
+        ]
+
     @staticmethod
     def validate_output_path(filepath: str, allowed_root: Optional[str] = None) -> tuple[bool, Optional[str]]:
-        import os
         abs_path = os.path.abspath(filepath)
         if allowed_root:
             abs_allowed = os.path.abspath(allowed_root)
@@ -29,33 +43,37 @@ class FilenameSanitizer:
 
     @staticmethod
     def sanitize_template_value(value: str) -> str:
-        for pattern in PATH_TRAVERSAL_PATTERNS:
-            if pattern.lower() in value.lower():
-                value = value.replace(pattern, '_')
-        if re.match(r'^[a-zA-Z]:[/\\]', value):
+        if TRAVERSAL_PATTERN.search(value):
+            # Rare path: keep the original ordered, case-sensitive replacement exactly
+            for pattern in PATH_TRAVERSAL_PATTERNS:
+                if pattern.lower() in value.lower():
+                    value = value.replace(pattern, '_')
+        if DRIVE_PREFIX.match(value):
             value = '_' + value
-        if value.startswith('\\\\') or value.startswith('//'):
+        if value.startswith(('\\\\', '//')):
             value = '_' + value
         return FilenameSanitizer.sanitize_filename(value)
 
+    @staticmethod
+    def sanitize_template_value_many(values: Iterable[str]) -> List[str]:
+        seen: Dict[str, str] = {}
+        return [
+            seen[value] if value in seen else seen.setdefault(value, FilenameSanitizer.sanitize_template_value(value))
+            for value in values
+        ]
+
 
 class PathValidator:
     @staticmethod
     def is_path_traversal_attempt(value: str) -> bool:
-        value_lower = value.lower()
-        for pattern in PATH_TRAVERSAL_PATTERNS:
-            if pattern.lower() in value_lower:
-                return True
-        return False
+        return TRAVERSAL_PATTERN.search(value) is not None
 
     @staticmethod
     def is_absolute_path(value: str) -> bool:
-        import os
         return os.path.isabs(value)
 
     @staticmethod
     def validate_and_sanitize_path(value: str, allowed_root: Optional[str] = None) -> tuple[str, Optional[str]]:
-        import os
         if PathValidator.is_path_traversal_attempt(value):
             return "", "Path traversal detected in value"
         if PathValidator.is_absolute_path(value):
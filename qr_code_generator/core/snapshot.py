@@ -0,0 +1,99 @@
+import os
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+
+class DirectorySnapshot:
+    def __init__(self, root: str | Path):
+        self.root = str(root)
+        self.scans = 0
+        self.entries = 0
+        self.exists_avoided = 0
+        self.path_checks_avoided = 0
+        self.mkdir_avoided = 0
+        self.case_insensitive: Optional[bool] = None
+        self._listings: Dict[str, Set[str]] = {}
+        self._created: Set[str] = set()
+
+    def exists(self, relative: str) -> bool:
+        directory, name = os.path.split(relative)
+        names = self._listing(directory)
+        self.exists_avoided += 1
+        return (name.casefold() if self.case_insensitive else name) in names
+
+    def key(self, relative: str) -> str:
+        # Names that differ only in case are one file on a case-insensitive filesystem
+        self._listing(os.path.dirname(relative))
+        return relative.casefold() if self.case_insensitive else relative
+
+    def is_contained(self, relative: str) -> bool:
+        # Relative paths made only of plain components cannot leave the root, so no abspath is needed
+        parts = relative.replace(os.altsep or os.sep, os.sep).split(os.sep)
+        if os.path.isabs(relative) or os.path.splitdrive(relative)[0] or any(part in ('', '.', '..') for part in parts):
+            return False
+        self.path_checks_avoided += 1
+        return True
+
+    def ensure_parent(self, path: str | Path) -> None:
+        directory = os.path.dirname(str(path))
+        if directory in self._created:
+            self.mkdir_avoided += 1
+            return
+        os.makedirs(directory, exist_ok=True)
+        self._created.add(directory)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'snapshot_scans': self.scans,
+            'snapshot_entries': self.entries,
+            'exists_calls_avoided': self.exists_avoided,
+            'path_checks_avoided': self.path_checks_avoided,
+            'mkdir_calls_avoided': self.mkdir_avoided,
+        }
+
+    def _listing(self, directory: str) -> Set[str]:
+        names = self._listings.get(directory)
+        if names is not None:
+            return names
+        path = os.path.join(self.root, directory) if directory else self.root
+        names = set()
+        parent, name = os.path.split(directory)
+        if name and (name.casefold() if self.case_insensitive else name) not in self._listing(parent):
+            # A directory missing from its parent's listing needs no scan of its own
+            self._listings[directory] = names
+            return names
+        self.scans += 1
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Broken symlinks are not "existing" for os.path.exists, so they are left out
+                    if entry.is_symlink() and not os.path.exists(entry.path):
+                        continue
+                    names.add(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        if self.case_insensitive is None:
+            self.case_insensitive = self._probe_case(path, names)
+            if self.case_insensitive:
+                self._listings = {key: {name.casefold() for name in value} for key, value in self._listings.items()}
+        if self.case_insensitive:
+            names = {name.casefold() for name in names}
+        self.entries += len(names)
+        self._listings[directory] = names
+        return names
+
+    @staticmethod
+    def _probe_case(path: str, names: Set[str]) -> Optional[bool]:
+        # SMB shares and default macOS/Windows volumes resolve names case-insensitively;
+        # one stat of a case-swapped existing name tells which kind of filesystem this is
+        for name in names:
+            swapped = name.swapcase()
+            if swapped != name and swapped not in names:
+                return os.path.exists(os.path.join(path, swapped))
+        # An empty directory has no names to swap, so its own name is probed instead
+        parent, name = os.path.split(os.path.abspath(path))
+        swapped = name.swapcase()
+        if swapped != name and os.path.isdir(path):
+            swapped_path = os.path.join(parent, swapped)
+            return os.path.exists(swapped_path) and os.path.samefile(path, swapped_path)
+        return None
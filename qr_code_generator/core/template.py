@@ -0,0 +1,82 @@
+import hashlib
+import re
+from string import Formatter
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from qr_code_generator.core.sanitizer import FilenameSanitizer, PathValidator
+
+
+FIELD_ROOT = re.compile(r'[.\[]')
+
+MAX_SHARD_DEPTH = 4
+
+
+def shard_path(filename: str, depth: int) -> str:
+    # Two hex characters per level (256 directories each), stable across runs and processes
+    if depth <= 0:
+        return filename
+    digest = hashlib.sha256(filename.encode('utf-8', 'surrogatepass')).hexdigest()
+    return '/'.join([digest[2 * level:2 * level + 2] for level in range(depth)] + [filename])
+
+
+class FilenameTemplate:
+    def __init__(
+        self,
+        template: str,
+        extension: str = '',
+        allowed_output_path: Optional[str] = None,
+        sanitizer: Optional[FilenameSanitizer] = None,
+    ):
+        self.template = template
+        self.extension = extension
+        self.allowed_output_path = allowed_output_path
+        self.sanitizer = sanitizer or FilenameSanitizer()
+        self.collisions = 0
+        self._claimed: Dict[str, Tuple[int, int]] = {}
+
+        # Parsed once per job; raises ValueError for malformed templates
+        self._parts: List[Tuple[str, Optional[str]]] = []
+        fields: List[str] = []
+        self.simple = True
+        self.positional = False
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if field_name is None:
+                self._parts.append((literal, None))
+                continue
+            root = FIELD_ROOT.split(field_name, 1)[0]
+            if root == '' or root.isdigit():
+                self.positional = True
+            if format_spec or conversion or root != field_name:
+                self.simple = False
+            if root not in fields:
+                fields.append(root)
+            self._parts.append((literal, root))
+        self.fields = tuple(fields)
+
+    def render(self, row: Mapping[str, Any], phone: str, fallback: Optional[str] = None) -> Tuple[str, List[str]]:
+        errors: List[str] = []
+        try:
+            if self.positional:
+                raise IndexError(self.template)
+            values = {}
+            for field in self.fields:
+                value = phone if field == 'Phone' else row[field]
+                sanitized, path_error = PathValidator.validate_and_sanitize_path(value, self.allowed_output_path)
+                if path_error:
+                    errors.append(path_error)
+                    sanitized = self.sanitizer.sanitize_template_value(value)
+                values[field] = sanitized
+            if self.simple:
+                base = ''.join(literal + values[field] if field is not None else literal for literal, field in self._parts)
+            else:
+                base = self.template.format(**values)
+        except (KeyError, IndexError):
+            base = phone if fallback is None else fallback
+        return self.sanitizer.sanitize_filename(base) + self.extension, errors
+
+    def claim(self, filename: str, payload: str, row_number: int) -> Optional[int]:
+        digest = hash(payload)
+        previous = self._claimed.setdefault(filename, (digest, row_number))
+        if previous[0] != digest:
+            self.collisions += 1
+            return previous[1]
+        return None
@@ -1,19 +1,35 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Any, Mapping, Optional, Tuple
 from qr_code_generator.core.formatter import PhoneFormatter
 
 
+@dataclass
+class RowValidity:
+    has_phone: np.ndarray
+    valid: np.ndarray
+    errors: np.ndarray
+
+    def issues(self, first_row: int = 2, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        positions = np.flatnonzero(~self.valid)[:limit]
+        return [{'row': int(pos) + first_row, 'error': self.errors[pos]} for pos in positions]
+
+
 class DataValidator:
     REQUIRED_COLUMNS = {'Phone'}
 
     def validate_schema(self, df: pd.DataFrame) -> Tuple[bool, List[str]]:
+        return self.validate_columns(df.columns)
+
+    def validate_columns(self, columns: Iterable[str]) -> Tuple[bool, List[str]]:
         errors = []
-        missing = self.REQUIRED_COLUMNS - set(df.columns)
+        missing = self.REQUIRED_COLUMNS - set(columns)
         if missing:
             errors.append(f"Missing required columns: {', '.join(missing)}")
         return len(errors) == 0, errors
 
-    def validate_row(self, row: pd.Series) -> Tuple[bool, Optional[str]]:
+    def validate_row(self, row: pd.Series | Mapping[str, Any]) -> Tuple[bool, Optional[str]]:
         phone = row.get('Phone')
         if phone is None or pd.isna(phone) or str(phone).strip() == '':
             return False, "Missing phone number"
@@ -22,22 +38,24 @@ class DataValidator:
             return False, error
         return True, None
 
+    def row_validity(self, phones: pd.Series) -> RowValidity:
+        missing = phones.isna().to_numpy()
+        text = phones.astype(object).where(~missing, '').astype(str)
+        has_phone = ~missing & (text.str.strip() != '').to_numpy()
+        valid, errors = PhoneFormatter.validate_many(text.to_numpy(dtype=object))
+        errors[~has_phone] = "Missing phone number"
+        return RowValidity(has_phone=has_phone, valid=valid & has_phone, errors=errors)
+
     def validate_dataframe(self, df: pd.DataFrame) -> Tuple[bool, Dict[str, Any]]:
         is_valid, schema_errors = self.validate_schema(df)
         if not is_valid:
             return False, {'schema_errors': schema_errors}
 
-        issues = []
-        valid_count = 0
-        for row_num, (_, row) in enumerate(df.iterrows(), start=2):
-            row_valid, row_error = self.validate_row(row)
-            if row_valid:
-                valid_count += 1
-            else:
-                issues.append({'row': row_num, 'error': row_error})
+        validity = self.row_validity(df['Phone'])
+        valid_count = int(validity.valid.sum())
 
         return valid_count > 0, {
             'valid_count': valid_count,
             'invalid_count': len(df) - valid_count,
-            'issues': issues[:100],
+            'issues': validity.issues(limit=100),
         }
@@ -0,0 +1,70 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+from qr_code_generator.utils.stats_utils import latency_summary
+
+
+DEFAULT_WRITE_QUEUE_SIZE = 64
+
+
+class WriterPool:
+    def __init__(self, threads: int, queue_size: int = DEFAULT_WRITE_QUEUE_SIZE):
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self.threads = threads
+        self.queue_size = queue_size
+        self.backpressure_waits = 0
+        self.backpressure_seconds = 0.0
+        self.busy_seconds = 0.0
+        self._latencies: List[float] = []
+        self._lock = threading.Lock()
+        # Queued plus in-flight writes; the producer blocks once this many buffers are outstanding
+        self._slots = threading.BoundedSemaphore(queue_size + threads)
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='qrgen-writer')
+
+    def __enter__(self) -> "WriterPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def capacity(self) -> int:
+        return self.queue_size + self.threads
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        if not self._slots.acquire(blocking=False):
+            start = time.perf_counter()
+            self._slots.acquire()
+            self.backpressure_waits += 1
+            self.backpressure_seconds += time.perf_counter() - start
+        try:
+            return self._executor.submit(self._write, fn, args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = list(self._latencies)
+        stats: Dict[str, Any] = latency_summary(latencies, prefix='write_')
+        stats['write_backpressure_waits'] = self.backpressure_waits
+        stats['write_backpressure_seconds'] = round(self.backpressure_seconds, 3)
+        return stats
+
+    def _write(self, fn: Callable[..., Any], args: tuple) -> Any:
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._latencies.append(elapsed)
+                self.busy_seconds += elapsed
+            self._slots.release()
@@ -1,69 +1,148 @@
 import inspect
-from typing import Type, TypeVar, Dict, Callable, Any, Optional
-from dataclasses import dataclass
+import threading
+from typing import Type, TypeVar, Dict, Callable, Any, List, Optional, Tuple
+from dataclasses import dataclass, field
 
 
 T = TypeVar('T')
 
+SINGLETON = "singleton"
+SCOPED = "scoped"
+TRANSIENT = "transient"
+LIFETIMES = (SINGLETON, SCOPED, TRANSIENT)
+
+_MISSING = object()
+
+Factory = Callable[[Callable[[Type], Any]], Any]
+
 
 @dataclass
 class ServiceDescriptor:
     service_type: Type
     implementation: Type | Callable
-    lifetime: str = "singleton"
+    lifetime: str = SINGLETON
+    factory: Optional[Factory] = field(default=None, repr=False, compare=False)
+
+
+def compile_factory(implementation: Type | Callable) -> Factory:
+    # Reflection runs once per registration; the closure only resolves dependencies and calls the constructor
+    dependencies: List[Tuple[str, Any, bool]] = []
+    for param_name, param in inspect.signature(implementation.__init__).parameters.items():
+        if param_name == 'self' or param.annotation is inspect.Parameter.empty:
+            continue
+        dependencies.append((param_name, param.annotation, param.default is not inspect.Parameter.empty))
+
+    if not dependencies:
+        return lambda resolve: implementation()
+
+    def factory(resolve: Callable[[Type], Any]) -> Any:
+        params = {}
+        for param_name, dependency, optional in dependencies:
+            try:
+                params[param_name] = resolve(dependency)
+            except KeyError:
+                if optional:
+                    continue
+                raise
+        return implementation(**params)
+
+    return factory
 
 
 class DIContainer:
     def __init__(self):
         self._services: Dict[Type, ServiceDescriptor] = {}
         self._singletons: Dict[Type, Any] = {}
+        # Re-entrant because building a singleton resolves its singleton dependencies
+        self._lock = threading.RLock()
 
     def register(
         self,
         service_type: Type[T],
         implementation: Optional[Type[T] | Callable[[], T]] = None,
-        lifetime: str = "singleton"
+        lifetime: str = SINGLETON
     ):
+        if lifetime not in LIFETIMES:
+            raise ValueError(f"Unknown lifetime: {lifetime}. Use {', '.join(LIFETIMES)}")
         if implementation is None:
             implementation = service_type
-        self._services[service_type] = ServiceDescriptor(
-            service_type=service_type,
-            implementation=implementation,
-            lifetime=lifetime
-        )
+        with self._lock:
+            self._services[service_type] = ServiceDescriptor(
+                service_type=service_type,
+                implementation=implementation,
+                lifetime=lifetime
+            )
 
     def register_instance(self, service_type: Type[T], instance: T):
-        self._singletons[service_type] = instance
+        with self._lock:
+            self._singletons[service_type] = instance
 
     def resolve(self, service_type: Type[T]) -> T:
         descriptor = self._services.get(service_type)
-        if not descriptor:
-            raise KeyError(f"Service {service_type} not registered")
-
-        if descriptor.lifetime == "singleton":
-            if service_type not in self._singletons:
-                self._singletons[service_type] = self._create_instance(descriptor)
-            return self._singletons[service_type]
-
-        return self._create_instance(descriptor)
-
-    def _create_instance(self, descriptor: ServiceDescriptor) -> Any:
-        implementation = descriptor.implementation
-        sig = inspect.signature(implementation.__init__)
-        params = {}
-
-        for param_name, param in sig.parameters.items():
-            if param_name == 'self':
-                continue
-            if param.annotation != inspect.Parameter.empty:
-                try:
-                    params[param_name] = self.resolve(param.annotation)
-                except KeyError:
-                    if param.default != inspect.Parameter.empty:
-                        continue
-                    raise
+        if descriptor is None:
+            instance = self._singletons.get(service_type, _MISSING)
+            if instance is _MISSING:
+                raise KeyError(f"Service {service_type} not registered")
+            return instance
+
+        if descriptor.lifetime == SINGLETON:
+            instance = self._singletons.get(service_type, _MISSING)
+            if instance is _MISSING:
+                with self._lock:
+                    instance = self._singletons.get(service_type, _MISSING)
+                    if instance is _MISSING:
+                        instance = self._singletons[service_type] = self._factory(descriptor)(self.resolve)
+            return instance
+
+        if descriptor.lifetime == SCOPED:
+            raise RuntimeError(f"Service {service_type} is scoped; resolve it from container.create_scope()")
+
+        return self._factory(descriptor)(self.resolve)
+
+    def create_scope(self) -> "DIScope":
+        return DIScope(self)
+
+    @staticmethod
+    def _factory(descriptor: ServiceDescriptor) -> Factory:
+        factory = descriptor.factory
+        if factory is None:
+            # Compiling twice under a race is harmless: both closures are equivalent
+            factory = descriptor.factory = compile_factory(descriptor.implementation)
+        return factory
+
+
+class DIScope:
+    def __init__(self, container: DIContainer):
+        self.container = container
+        self._instances: Dict[Type, Any] = {}
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> "DIScope":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
-        return implementation(**params)
+    def resolve(self, service_type: Type[T]) -> T:
+        descriptor = self.container._services.get(service_type)
+        if descriptor is None or descriptor.lifetime == SINGLETON:
+            return self.container.resolve(service_type)
+
+        if descriptor.lifetime == SCOPED:
+            instance = self._instances.get(service_type, _MISSING)
+            if instance is _MISSING:
+                with self._lock:
+                    instance = self._instances.get(service_type, _MISSING)
+                    if instance is _MISSING:
+                        instance = self._instances[service_type] = self.container._factory(descriptor)(self.resolve)
+            return instance
+
+        # Transients created in a scope share that scope's scoped dependencies
+        return self.container._factory(descriptor)(self.resolve)
+
+    def close(self) -> None:
+        with self._lock:
+            self._instances.clear()
 
 
 container = DIContainer()
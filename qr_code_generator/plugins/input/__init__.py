@@ -0,0 +1,21 @@
+from qr_code_generator.plugins.input.base import (
+    RowStream,
+    DataReader,
+    ExcelReader,
+    LegacyExcelReader,
+    CSVReader,
+    JSONReader,
+    READER_MAP,
+    get_reader,
+)
+
+__all__ = [
+    "RowStream",
+    "DataReader",
+    "ExcelReader",
+    "LegacyExcelReader",
+    "CSVReader",
+    "JSONReader",
+    "READER_MAP",
+    "get_reader",
+]
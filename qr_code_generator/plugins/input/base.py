@@ -0,0 +1,288 @@
+import csv
+import json
+from abc import abstractmethod
+from pathlib import Path
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+from qr_code_generator.core.interfaces import IDataReader
+
+
+def cell_to_text(value: Any) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        if value != value:
+            return ''
+        if value.is_integer():
+            return str(int(value))
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+class RowStream:
+    def __init__(
+        self,
+        columns: List[str],
+        rows: Iterator[Dict[str, str]],
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        self.columns = columns
+        self._rows = rows
+        self._on_close = on_close
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return self._rows
+
+    def __enter__(self) -> "RowStream":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+
+class DataReader(IDataReader):
+    def __init__(self, sheet_name: int | str = 0):
+        self.sheet_name = sheet_name
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        pass
+
+    @property
+    @abstractmethod
+    def extensions(self) -> Tuple[str, ...]:
+        pass
+
+    @abstractmethod
+    def open(self, source: str | Path) -> RowStream:
+        pass
+
+    def read_columns(self, source: str | Path) -> List[str]:
+        with self.open(source) as stream:
+            return stream.columns
+
+    def iter_rows(self, source: str | Path) -> Iterator[Dict[str, str]]:
+        with self.open(source) as stream:
+            yield from stream
+
+    def read(self, source: str | Path) -> List[Dict[str, Any]]:
+        return list(self.iter_rows(source))
+
+    def exceeds_rows(self, source: str | Path, limit: int) -> bool:
+        # Readers override this with a count that builds no row dicts
+        with self.open(source) as stream:
+            return sum(1 for _ in islice(stream, limit + 1)) > limit
+
+    def validate_schema(self, source: str | Path) -> tuple[bool, List[str]]:
+        errors = []
+        try:
+            columns = self.read_columns(source)
+        except Exception as e:
+            return False, [f"Error reading columns: {str(e)}"]
+        if not columns:
+            errors.append("No header row found")
+        duplicates = sorted({col for col in columns if columns.count(col) > 1})
+        if duplicates:
+            errors.append(f"Duplicate columns: {', '.join(duplicates)}")
+        return len(errors) == 0, errors
+
+
+class ExcelReader(DataReader):
+    @property
+    def name(self) -> str:
+        return "xlsx"
+
+    @property
+    def extensions(self) -> Tuple[str, ...]:
+        return (".xlsx",)
+
+    def open(self, source: str | Path) -> RowStream:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(str(source), read_only=True, data_only=True)
+        try:
+            values = self._sheet(workbook).iter_rows(values_only=True)
+            columns = self._header(next(values, ()))
+        except Exception:
+            workbook.close()
+            raise
+        return RowStream(columns, self._iter_records(columns, values), workbook.close)
+
+    def exceeds_rows(self, source: str | Path, limit: int) -> bool:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(str(source), read_only=True, data_only=True)
+        try:
+            sheet = self._sheet(workbook)
+            # The stored dimension covers every used row, so sheets within the limit need no scan
+            if sheet.max_row is not None and sheet.max_row - 1 <= limit:
+                return False
+            # Blank rows count only when a record follows them, as in _iter_records
+            for position, values in enumerate(islice(sheet.iter_rows(values_only=True), 1, None), start=1):
+                if position > limit and any(value is not None and value != '' for value in values):
+                    return True
+            return False
+        finally:
+            workbook.close()
+
+    def _sheet(self, workbook: Any) -> Any:
+        if isinstance(self.sheet_name, int):
+            return workbook.worksheets[self.sheet_name]
+        return workbook[self.sheet_name]
+
+    @staticmethod
+    def _iter_records(columns: List[str], values_iter: Iterator[Tuple[Any, ...]]) -> Iterator[Dict[str, str]]:
+        blank_rows = 0
+        for values in values_iter:
+            if all(value is None or value == '' for value in values):
+                blank_rows += 1
+                continue
+            # Blank rows between records are kept (as pandas does); trailing ones are dropped
+            for _ in range(blank_rows):
+                yield {col: '' for col in columns}
+            blank_rows = 0
+            yield {col: cell_to_text(value) for col, value in zip(columns, values)}
+
+    @staticmethod
+    def _header(values: Tuple[Any, ...]) -> List[str]:
+        return [
+            cell_to_text(value) if value is not None else f"Unnamed: {index}"
+            for index, value in enumerate(values)
+        ]
+
+
+class LegacyExcelReader(DataReader):
+    @property
+    def name(self) -> str:
+        return "xls"
+
+    @property
+    def extensions(self) -> Tuple[str, ...]:
+        return (".xls",)
+
+    def open(self, source: str | Path) -> RowStream:
+        # xlrd has no row-streaming API, so legacy workbooks are still loaded in one go
+        import pandas as pd
+        df = pd.read_excel(source, sheet_name=self.sheet_name)
+        columns = [str(col) for col in df.columns]
+        rows = (
+            {col: cell_to_text(value) for col, value in zip(columns, values)}
+            for values in df.itertuples(index=False, name=None)
+        )
+        return RowStream(columns, rows)
+
+
+class CSVReader(DataReader):
+    @property
+    def name(self) -> str:
+        return "csv"
+
+    @property
+    def extensions(self) -> Tuple[str, ...]:
+        return (".csv",)
+
+    def open(self, source: str | Path) -> RowStream:
+        f = open(source, newline='', encoding='utf-8-sig')
+        reader = csv.reader(f)
+        columns = next(reader, [])
+        return RowStream(columns, self._iter_records(columns, reader), f.close)
+
+    def exceeds_rows(self, source: str | Path, limit: int) -> bool:
+        with open(source, newline='', encoding='utf-8-sig') as f:
+            records = (values for values in islice(csv.reader(f), 1, None) if any(values))
+            return sum(1 for _ in islice(records, limit + 1)) > limit
+
+    @staticmethod
+    def _iter_records(columns: List[str], reader: Iterator[List[str]]) -> Iterator[Dict[str, str]]:
+        for values in reader:
+            if not any(values):
+                continue
+            row = dict(zip(columns, values))
+            for col in columns[len(values):]:
+                row[col] = ''
+            yield row
+
+
+class JSONReader(DataReader):
+    @property
+    def name(self) -> str:
+        return "json"
+
+    @property
+    def extensions(self) -> Tuple[str, ...]:
+        return (".json", ".ndjson", ".jsonl")
+
+    def open(self, source: str | Path) -> RowStream:
+        f = open(source, encoding='utf-8-sig')
+        try:
+            rows = self._iter_rows(self._iter_records(f))
+            first = next(rows, None)
+        except Exception:
+            f.close()
+            raise
+        if first is None:
+            return RowStream([], iter(()), f.close)
+        return RowStream(list(first), chain((first,), rows), f.close)
+
+    def exceeds_rows(self, source: str | Path, limit: int) -> bool:
+        with open(source, encoding='utf-8-sig') as f:
+            if self._peek(f) == '[':
+                return len(json.load(f)) > limit
+            # JSON strings cannot hold raw newlines, so each non-blank NDJSON line is one record
+            records = (line for line in f if line.strip())
+            return sum(1 for _ in islice(records, limit + 1)) > limit
+
+    @staticmethod
+    def _iter_rows(records: Iterator[Any]) -> Iterator[Dict[str, str]]:
+        for record in records:
+            if not isinstance(record, dict):
+                raise ValueError("JSON input must contain objects")
+            yield {str(key): cell_to_text(value) for key, value in record.items()}
+
+    @staticmethod
+    def _iter_records(f: TextIO) -> Iterator[Any]:
+        first_char = JSONReader._peek(f)
+        if first_char == '[':
+            # A JSON array has to be parsed as a whole; use NDJSON for constant memory
+            yield from json.load(f)
+            return
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+    @staticmethod
+    def _peek(f: TextIO) -> Optional[str]:
+        while True:
+            position = f.tell()
+            char = f.read(1)
+            if not char:
+                return None
+            if not char.isspace():
+                f.seek(position)
+                return char
+
+
+READER_MAP: Dict[str, type[DataReader]] = {
+    '.xlsx': ExcelReader,
+    '.xls': LegacyExcelReader,
+    '.csv': CSVReader,
+    '.json': JSONReader,
+    '.ndjson': JSONReader,
+    '.jsonl': JSONReader,
+}
+
+
+def get_reader(source: str | Path, sheet_name: int | str = 0) -> DataReader:
+    ext = Path(source).suffix.lower()
+    reader_cls = READER_MAP.get(ext)
+    if reader_cls is None:
+        raise ValueError(f"Unsupported input format: {ext}")
+    return reader_cls(sheet_name=sheet_name)
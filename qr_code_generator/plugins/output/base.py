@@ -1,5 +1,6 @@
+import io
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, BinaryIO
 from pathlib import Path
 from qr_code_generator.core.interfaces import QRCodeResult
 
@@ -24,6 +25,9 @@ class OutputAdapter(ABC):
     def save(self, qr_image: Any, filepath: Path, **kwargs) -> QRCodeResult:
         pass
 
+    def write(self, qr_image: Any, stream: BinaryIO, **kwargs) -> None:
+        raise NotImplementedError(f"{self.name} output does not support streaming")
+
     def supports_stream(self) -> bool:
         return False
 
@@ -44,12 +48,19 @@ class PNGOutputAdapter(OutputAdapter):
     def save(self, qr_image: Any, filepath: Path, **kwargs) -> QRCodeResult:
         try:
             filepath = filepath.with_suffix(self.extension)
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+            if kwargs.get('make_parents', True):
+                filepath.parent.mkdir(parents=True, exist_ok=True)
             qr_image.save(str(filepath), format="PNG")
             return QRCodeResult(success=True, filepath=filepath)
         except Exception as e:
             return QRCodeResult(success=False, error=str(e))
 
+    def write(self, qr_image: Any, stream: BinaryIO, **kwargs) -> None:
+        qr_image.save(stream, format="PNG")
+
+    def supports_stream(self) -> bool:
+        return True
+
 
 class SVGOutputAdapter(OutputAdapter):
     @property
@@ -67,15 +78,22 @@ class SVGOutputAdapter(OutputAdapter):
     def save(self, qr_image: Any, filepath: Path, **kwargs) -> QRCodeResult:
         try:
             filepath = filepath.with_suffix(self.extension)
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+            if kwargs.get('make_parents', True):
+                filepath.parent.mkdir(parents=True, exist_ok=True)
 
             with open(filepath, 'wb') as f:
-                qr_image.save(f)
+                self.write(qr_image, f)
 
             return QRCodeResult(success=True, filepath=filepath)
         except Exception as e:
             return QRCodeResult(success=False, error=str(e))
 
+    def write(self, qr_image: Any, stream: BinaryIO, **kwargs) -> None:
+        qr_image.save(stream)
+
+    def supports_stream(self) -> bool:
+        return True
+
 
 class PDFOutputAdapter(OutputAdapter):
     @property
@@ -93,13 +111,28 @@ class PDFOutputAdapter(OutputAdapter):
     def save(self, qr_image: Any, filepath: Path, **kwargs) -> QRCodeResult:
         try:
             filepath = filepath.with_suffix(self.extension)
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-
-            if hasattr(qr_image, "get_image"):
-                qr_image = qr_image.get_image()
+            if kwargs.get('make_parents', True):
+                filepath.parent.mkdir(parents=True, exist_ok=True)
 
-            qr_image.convert("RGB").save(str(filepath), format="PDF")
+            with open(filepath, 'wb') as f:
+                self.write(qr_image, f)
 
             return QRCodeResult(success=True, filepath=filepath)
         except Exception as e:
             return QRCodeResult(success=False, error=str(e))
+
+    def write(self, qr_image: Any, stream: BinaryIO, **kwargs) -> None:
+        if hasattr(qr_image, "get_image"):
+            qr_image = qr_image.get_image()
+        image = qr_image.convert("RGB")
+        seekable = getattr(stream, "seekable", None)
+        if seekable is not None and seekable():
+            image.save(stream, format="PDF")
+            return
+        # PIL's PDF writer seeks back to patch offsets, so pipes, sockets and archive entries get a buffered copy
+        buffer = io.BytesIO()
+        image.save(buffer, format="PDF")
+        stream.write(buffer.getbuffer())
+
+    def supports_stream(self) -> bool:
+        return True
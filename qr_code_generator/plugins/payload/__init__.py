@@ -7,6 +7,7 @@ from qr_code_generator.plugins.payload.base import (
     URLPayload,
     SMSPayload,
     EmailPayload,
+    PAYLOAD_MAP,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "URLPayload",
     "SMSPayload",
     "EmailPayload",
+    "PAYLOAD_MAP",
 ]
@@ -201,3 +201,14 @@ class EmailPayload(PayloadGenerator):
         if params:
             parts[0] += "?" + "&".join(params)
         return parts[0]
+
+
+PAYLOAD_MAP: Dict[str, type[PayloadGenerator]] = {
+    'phone': PhonePayload,
+    'vcard': VCardPayload,
+    'mecard': MeCardPayload,
+    'wifi': WiFiPayload,
+    'url': URLPayload,
+    'sms': SMSPayload,
+    'email': EmailPayload,
+}
@@ -0,0 +1,347 @@
+import argparse
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from qr_code_generator.core.cache import render_key
+from qr_code_generator.core.generator import QRCodeGenerator
+from qr_code_generator.plugins.payload import PAYLOAD_MAP
+from qr_code_generator.utils.stats_utils import latency_summary
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+DEFAULT_RESPONSE_CACHE_SIZE = 1024
+MAX_BODY_BYTES = 64 * 1024
+KEEP_ALIVE_SECONDS = 15
+LATENCY_WINDOW = 10000
+
+STYLE_PARAMS = {
+    'fill_color': str,
+    'back_color': str,
+    'box_size': int,
+    'border': int,
+    'error_correction': str,
+    'render_engine': str,
+}
+# Unbounded sizes would let one request allocate gigabytes; a version-40 code at the upper bounds is ~9000px square
+STYLE_RANGES = {
+    'box_size': (1, 40),
+    'border': (0, 20),
+}
+
+Response = Tuple[HTTPStatus, str, bytes, Dict[str, str]]
+
+_generator: Optional[QRCodeGenerator] = None
+
+
+def _render(payload: str, output_format: str, style: Dict[str, Any]) -> bytes:
+    # Runs in the worker pool; each process keeps one generator
+    global _generator
+    if _generator is None:
+        _generator = QRCodeGenerator()
+    return _generator.generate_bytes(payload, output_format, **style)
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _json_response(status: HTTPStatus, body: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    return status, 'application/json', json.dumps(body).encode('utf-8'), headers or {}
+
+
+class RenderServer:
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        workers: int = 1,
+        cache_size: int = DEFAULT_RESPONSE_CACHE_SIZE,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.cache_size = cache_size
+        self.counters = {'requests': 0, 'renders': 0, 'cache_hits': 0, 'cache_misses': 0, 'errors': 0}
+        self._cache: "OrderedDict[str, Tuple[bytes, str]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._executor: Optional[Executor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        if self.workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='qrgen-render')
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = dict(self.counters)
+        stats['cache_entries'] = len(self._cache)
+        stats.update(latency_summary(list(self._latencies), prefix='latency_'))
+        return stats
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HTTPError as e:
+                    self.counters['errors'] += 1
+                    await self._write_response(writer, 'GET', _json_response(e.status, {'error': str(e)}), False)
+                    break
+                if request is None:
+                    break
+                method, target, headers, body, keep_alive = request
+                response = await self._respond(method, target, headers, body)
+                await self._write_response(writer, method, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, method: str, response: Response, keep_alive: bool) -> None:
+        status, content_type, payload, extra = response
+        head = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(payload)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        head.extend(f"{name}: {value}" for name, value in extra.items())
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+        if method != 'HEAD':
+            writer.write(payload)
+        await writer.drain()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes, bool]]:
+        # One deadline covers the request line, headers and body, so a client that stalls midway cannot hold the connection
+        try:
+            return await asyncio.wait_for(self._parse_request(reader), KEEP_ALIVE_SECONDS)
+        except ValueError:
+            # StreamReader raises ValueError for a line longer than its buffer limit
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Request line or header too long")
+
+    @staticmethod
+    async def _parse_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes, bool]]:
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        parts = line.decode('latin-1').split()
+        if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+        method, target, version = parts
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, separator, value = line.decode('latin-1').partition(':')
+            if not separator or not name.strip():
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed header line")
+            headers[name.strip().lower()] = value.strip()
+        content_length = headers.get('content-length', '0')
+        if not content_length.isdigit():
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid Content-Length: {content_length}")
+        length = int(content_length)
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        body = await reader.readexactly(length) if length else b''
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+        return method.upper(), target, headers, body, keep_alive
+
+    async def _respond(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Response:
+        self.counters['requests'] += 1
+        start = time.perf_counter()
+        try:
+            url = urlsplit(target)
+            path = unquote(url.path)
+            if path == '/health':
+                return _json_response(HTTPStatus.OK, {'status': 'ok'})
+            if path == '/stats':
+                return _json_response(HTTPStatus.OK, self.stats())
+            if path in ('/', '/formats'):
+                return _json_response(HTTPStatus.OK, {
+                    'payloads': sorted(PAYLOAD_MAP),
+                    'outputs': sorted(QRCodeGenerator.OUTPUT_ADAPTERS),
+                })
+            if not path.startswith('/render/'):
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown endpoint: {path}")
+            if method not in ('GET', 'HEAD', 'POST'):
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"Method not allowed: {method}")
+            response = await self._render_response(path[len('/render/'):], url.query, body, headers)
+            self._latencies.append(time.perf_counter() - start)
+            return response
+        except HTTPError as e:
+            self.counters['errors'] += 1
+            return _json_response(e.status, {'error': str(e)})
+        except Exception as e:
+            self.counters['errors'] += 1
+            logger.exception("Render request failed")
+            return _json_response(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)})
+
+    async def _render_response(self, route: str, query: str, body: bytes, headers: Dict[str, str]) -> Response:
+        payload_format, _, output_format = route.partition('.')
+        params: List[Tuple[str, str]] = parse_qsl(query, keep_blank_values=True)
+        fields: Dict[str, Any] = {}
+        style: Dict[str, Any] = {}
+        for name, value in params:
+            if name == 'format':
+                output_format = value
+            elif name in STYLE_PARAMS:
+                try:
+                    style[name] = STYLE_PARAMS[name](value)
+                except ValueError:
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid value for {name}: {value}")
+                if name in STYLE_RANGES:
+                    low, high = STYLE_RANGES[name]
+                    if not low <= style[name] <= high:
+                        raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be between {low} and {high}")
+            else:
+                fields[name] = value
+        if body:
+            try:
+                posted = json.loads(body)
+            except json.JSONDecodeError as e:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid JSON body: {e}")
+            if not isinstance(posted, dict):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "JSON body must be an object")
+            fields.update({name: '' if value is None else str(value) for name, value in posted.items()})
+
+        output_format = (output_format or 'png').lower()
+        adapter_cls = QRCodeGenerator.OUTPUT_ADAPTERS.get(output_format)
+        if adapter_cls is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unsupported output format: {output_format}")
+        payload_cls = PAYLOAD_MAP.get(payload_format.lower())
+        if payload_cls is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown payload format: {payload_format}")
+        payload_gen = payload_cls()
+        valid, error = payload_gen.validate(fields)
+        if not valid:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, error or "Invalid payload")
+        payload = payload_gen.generate(fields)
+        valid, error = QRCodeGenerator().validate_data(payload)
+        if not valid:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, error or "Invalid payload")
+        render_engine = style.get('render_engine', 'pil')
+        if render_engine not in QRCodeGenerator.RENDER_ENGINES:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Unsupported render engine: {render_engine}")
+
+        key = render_key(
+            payload,
+            style.get('fill_color', 'black'),
+            style.get('back_color', 'white'),
+            style.get('box_size', 10),
+            style.get('border', 4),
+            style.get('error_correction', 'L'),
+            output_format,
+            render_engine,
+        )
+        etag = f'"{key[:32]}"'
+        if headers.get('if-none-match') == etag:
+            return HTTPStatus.NOT_MODIFIED, adapter_cls().mime_type, b'', {'ETag': etag}
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.counters['cache_hits'] += 1
+            return HTTPStatus.OK, cached[1], cached[0], {'ETag': etag, 'X-Cache': 'HIT'}
+
+        self.counters['cache_misses'] += 1
+        image = await self._render_once(key, payload, output_format, style)
+        mime_type = adapter_cls().mime_type
+        if self.cache_size > 0:
+            self._cache[key] = (image, mime_type)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return HTTPStatus.OK, mime_type, image, {'ETag': etag, 'X-Cache': 'MISS'}
+
+    async def _render_once(self, key: str, payload: str, output_format: str, style: Dict[str, Any]) -> bytes:
+        # Concurrent requests for the same image share one render
+        pending = self._inflight.get(key)
+        owner = pending is None
+        if pending is None:
+            pending = asyncio.get_running_loop().run_in_executor(self._executor, _render, payload, output_format, style)
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        try:
+            image = await asyncio.shield(pending)
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+        if owner:
+            self.counters['renders'] += 1
+        return image
+
+
+def serve_main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='qrgen serve',
+        description='Serve QR code images over HTTP, e.g. GET /render/vcard.svg?Name=Ada&Phone=441234567890',
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST,
+                        help=f'Interface to listen on (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'Port to listen on, 0 picks a free port (default: {DEFAULT_PORT})')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Render processes; 1 renders on a single background thread (default: 1)')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_RESPONSE_CACHE_SIZE,
+                        help=f'Rendered responses kept in the in-memory LRU, 0 disables it (default: {DEFAULT_RESPONSE_CACHE_SIZE})')
+    args = parser.parse_args(argv)
+
+    server = RenderServer(args.host, args.port, args.workers, args.cache_size)
+
+    async def run() -> None:
+        await server.start()
+        logger.info(f"Serving QR codes on {server.url} (Ctrl+C to stop)")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        logger.info("Server stopped")
+    except OSError as e:
+        logger.error(f"Could not start server: {e}")
+        return 1
+    return 0
@@ -1,36 +1,40 @@
 import os
 import logging
+import time
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import json
+import numpy as np
 import pandas as pd
 
 from qr_code_generator.core.generator import QRCodeGenerator
+from qr_code_generator.core.archive import ArchiveSink, archive_kind
+from qr_code_generator.core.cache import DEFAULT_CACHE_MAX_MB, RenderCache, render_key
+from qr_code_generator.core.journal import RunJournal
+from qr_code_generator.core.labels import DEFAULT_LABEL_GRID, LabelSheetWriter
+from qr_code_generator.core.ingest import IngestionStage, RowLimitExceeded
+from qr_code_generator.core.parallel import OrderedRenderPool
+from qr_code_generator.core.writer import DEFAULT_WRITE_QUEUE_SIZE, WriterPool
 from qr_code_generator.core.formatter import PhoneFormatter
+from qr_code_generator.core.interfaces import QRCodeResult
 from qr_code_generator.core.validator import DataValidator
-from qr_code_generator.core.sanitizer import FilenameSanitizer, PathValidator
-from qr_code_generator.utils.file_utils import FileValidator
-from qr_code_generator.utils.pii_utils import PIIRedactor
-from qr_code_generator.plugins.payload import (
-    PayloadGenerator, PhonePayload, VCardPayload, MeCardPayload,
-    WiFiPayload, URLPayload, SMSPayload, EmailPayload
-)
+from qr_code_generator.core.sanitizer import FilenameSanitizer
+from qr_code_generator.core.snapshot import DirectorySnapshot
+from qr_code_generator.core.template import MAX_SHARD_DEPTH, FilenameTemplate, shard_path
+from qr_code_generator.utils.log_utils import RowLogPolicy
+from qr_code_generator.utils.pii_utils import PIIRedactionFilter
+from qr_code_generator.utils.stats_utils import StageTimer
+from qr_code_generator.plugins.input import DataReader, get_reader
+from qr_code_generator.plugins.payload import PAYLOAD_MAP, PayloadGenerator
 
 
 logger = logging.getLogger(__name__)
 
 
 class QRCodeService:
-    PAYLOAD_MAP: Dict[str, type] = {
-        'phone': PhonePayload,
-        'vcard': VCardPayload,
-        'mecard': MeCardPayload,
-        'wifi': WiFiPayload,
-        'url': URLPayload,
-        'sms': SMSPayload,
-        'email': EmailPayload,
-    }
+    PAYLOAD_MAP: Dict[str, type] = PAYLOAD_MAP
 
     def __init__(
         self,
@@ -50,6 +54,9 @@ class QRCodeService:
             raise ValueError(f"Unknown payload format: {format_name}")
         return generator_class()  # type: ignore[return-value]
 
+    def get_data_reader(self, input_file: str, sheet_name: int | str = 0) -> DataReader:
+        return get_reader(input_file, sheet_name=sheet_name)
+
     def generate_from_excel(
         self,
         input_file: str,
@@ -73,13 +80,92 @@ class QRCodeService:
         dry_run: bool = False,
         export_manifest: bool = False,
         manifest_format: str = 'json',
+        workers: int = 1,
+        render_engine: str = 'pil',
+        cache_dir: Optional[str] = None,
+        cache_max_mb: int = DEFAULT_CACHE_MAX_MB,
+        cache_link: bool = False,
+        resume: bool = False,
+        writer_threads: int = 0,
+        write_queue_size: int = DEFAULT_WRITE_QUEUE_SIZE,
+        output_archive: Optional[str] = None,
+        label_sheet: Optional[str] = None,
+        label_grid: str = DEFAULT_LABEL_GRID,
+        page_size: str = 'A4',
+        page_margin_mm: float = 10.0,
+        caption_column: Optional[str] = None,
+        shard_depth: int = 0,
+        row_log: str = 'every',
     ) -> int:
-        valid, error = FileValidator.validate_input_file(input_file, max_rows=max_rows)
+        if workers < 1:
+            logger.error("Number of workers must be at least 1")
+            return 1
+        if render_engine not in QRCodeGenerator.RENDER_ENGINES:
+            logger.error(f"Unsupported render engine: {render_engine}")
+            return 1
+        try:
+            row_policy = RowLogPolicy(row_log)
+        except ValueError as e:
+            logger.error(str(e))
+            return 1
+        if not 0 <= shard_depth <= MAX_SHARD_DEPTH:
+            logger.error(f"Shard depth must be between 0 and {MAX_SHARD_DEPTH}")
+            return 1
+        if writer_threads > 0 and workers > 1:
+            logger.warning("--writer-threads is ignored with --workers > 1; worker processes write their own files")
+            writer_threads = 0
+        if output_archive and label_sheet:
+            logger.error("--output-archive and --label-sheet cannot be combined")
+            return 1
+        if output_archive and archive_kind(output_archive) is None:
+            logger.error(f"Unsupported archive type: {output_archive}. Use .zip, .tar, .tar.gz or .tgz")
+            return 1
+        sheet = None
+        if label_sheet:
+            try:
+                sheet = LabelSheetWriter(
+                    label_sheet, label_grid, page_size, page_margin_mm,
+                    fill_color, back_color, captions=bool(caption_column),
+                )
+            except ValueError as e:
+                logger.error(str(e))
+                return 1
+        single_file = output_archive or label_sheet
+        if single_file:
+            option = '--output-archive' if output_archive else '--label-sheet'
+            if resume:
+                logger.error(f"--resume cannot be combined with {option}")
+                return 1
+            if workers > 1 or writer_threads > 0 or cache_dir:
+                logger.warning(f"--workers, --writer-threads and --cache-dir are ignored with {option}")
+                workers, writer_threads, cache_dir = 1, 0, None
+            if label_sheet and shard_depth:
+                logger.warning("--shard-depth is ignored with --label-sheet")
+                shard_depth = 0
+            valid_path, path_error = self.sanitizer.validate_output_path(single_file, allowed_output_path)
+            if not valid_path:
+                logger.error(path_error)
+                return 1
+
+        try:
+            name_template = FilenameTemplate(filename_template, f'.{output_format}', allowed_output_path, self.sanitizer)
+        except ValueError as e:
+            logger.error(f"Invalid filename template '{filename_template}': {e}")
+            return 1
+
+        ingestion = IngestionStage(
+            self.get_data_reader(input_file, sheet_name),
+            self.validator,
+            max_file_size_mb=max_file_size_mb,
+            max_rows=max_rows,
+        )
+        valid, error = ingestion.check_file(input_file)
         if not valid:
             logger.error(error)
             return 1
 
-        os.makedirs(output_folder, exist_ok=True)
+        if not single_file:
+            os.makedirs(output_folder, exist_ok=True)
         
         if allowed_output_path:
             os.makedirs(allowed_output_path, exist_ok=True)
@@ -90,125 +176,285 @@ class QRCodeService:
             'skipped_existing': 0,
             'skipped_invalid': 0,
             'skipped_duplicate': 0,
+            'skipped_unchanged': 0,
+            'filename_collisions': 0,
             'start_time': datetime.now().isoformat(),
         }
 
         seen_phones = set()
         manifest = []
+        render_cache = RenderCache(cache_dir, cache_max_mb, link=cache_link) if cache_dir and not dry_run else None
+        journal = RunJournal(allowed_output_path or output_folder) if resume and not dry_run else None
+        if journal is not None:
+            journal.load()
+        writer = WriterPool(writer_threads, write_queue_size) if writer_threads > 0 and not dry_run else None
+        archive = ArchiveSink(output_archive) if output_archive and not dry_run else None
+        if dry_run:
+            sheet = None
+        # Existence checks are answered from one scandir per directory instead of a stat per row
+        snapshot = DirectorySnapshot(allowed_output_path or output_folder) if not single_file else None
+        timer = StageTimer()
 
-        try:
-            df = pd.read_excel(input_file, sheet_name=sheet_name)
-            stats['total'] = len(df)
-            logger.info(f"Found {stats['total']} rows")
+        def log_progress() -> None:
+            skipped = sum(value for name, value in stats.items() if name.startswith('skipped_'))
+            logger.info("Progress: %s rows read, %s generated, %s skipped", stats['total'], stats['generated'], skipped)
 
-            is_valid, validation_result = self.validator.validate_dataframe(df)
-            if not is_valid:
-                logger.warning(f"Data validation issues: {validation_result}")
+        def record_result(job: Dict[str, Any], result) -> None:
+            if result.success:
+                stats['generated'] += 1
+                if result.metadata and 'timings' in result.metadata:
+                    timer.merge(result.metadata['timings'])
+                if render_cache is not None and job.get('cache_miss') and result.filepath is not None:
+                    render_cache.store(job['render_key'], result.filepath)
+                if journal is not None:
+                    journal.record(job['row_number'], job['filename'], job['render_key'])
+                if row_policy.log_row(stats['generated']):
+                    logger.info("Generated: %s", job['filename'])
+                if row_policy.progress_due():
+                    log_progress()
+
+                if export_manifest or archive is not None:
+                    manifest.append({
+                        'row_number': job['row_number'],
+                        'filename': job['filename'],
+                        'payload_type': payload_format,
+                        'timestamp': datetime.now().isoformat(),
+                    })
+            else:
+                logger.error("Row %s: %s", job['row_number'], result.error)
+                stats['skipped_invalid'] += 1
 
+        # Redacts arguments of records that are actually emitted, so suppressed levels cost nothing
+        redaction = PIIRedactionFilter() if redact_logs else None
+        if redaction is not None:
+            logger.addFilter(redaction)
+        try:
             payload_gen = self.get_payload_generator(payload_format)
+            submitted_paths = set()
+
+            max_pending = writer.capacity if writer is not None else None
+            with OrderedRenderPool(workers, max_pending) as pool, writer or nullcontext(), \
+                    archive or nullcontext(), sheet or nullcontext():
+                for chunk in ingestion.chunks(input_file):
+                    stats['total'] += len(chunk)
+                    t = time.perf_counter()
+                    has_phone = chunk.validity.has_phone
+                    phones = self.formatter.format_many(chunk.phones, keep_plus).to_numpy(dtype=object)
+
+                    duplicate = np.zeros(len(chunk), dtype=bool)
+                    if dedup:
+                        candidates = pd.Series(phones[has_phone], dtype=object)
+                        duplicate[has_phone] = (candidates.duplicated() | candidates.isin(seen_phones)).to_numpy()
+                        seen_phones.update(candidates)
+                    timer.lap('format', t)
+                    if row_policy.progress_due():
+                        log_progress()
+
+                    for offset, row_dict in enumerate(chunk.rows):
+                        row_num = chunk.first_row + offset
+
+                        if not has_phone[offset]:
+                            stats['skipped_invalid'] += 1
+                            continue
+
+                        if duplicate[offset]:
+                            stats['skipped_duplicate'] += 1
+                            continue
+
+                        phone = phones[offset]
+                        t = time.perf_counter()
 
-            for index, row in df.iterrows():
-                row_num = int(index) + 2  # type: ignore[arg-type]
-
-                phone_val = row.get('Phone')
-                if phone_val is None or pd.isna(phone_val) or str(phone_val).strip() == '':
-                    stats['skipped_invalid'] += 1
-                    continue
-
-                phone = self.formatter.format_phone(str(phone_val), keep_plus)
-
-                if dedup:
-                    if phone in seen_phones:
-                        stats['skipped_duplicate'] += 1
-                        continue
-                    seen_phones.add(phone)
-
-                row_dict = {col: str(row[col]) if col in df.columns else '' for col in df.columns}
-                
-                valid_payload, payload_error = payload_gen.validate(row_dict)
-                if not valid_payload:
-                    logger.warning(f"Row {row_num}: {payload_error}")
-                    stats['skipped_invalid'] += 1
-                    continue
-
-                payload = payload_gen.generate(row_dict)
-
-                try:
-                    filename_data = row_dict.copy()
-                    filename_data['Phone'] = phone.lstrip('+') if not keep_plus else phone
-                    
-                    for key, value in filename_data.items():
-                        sanitized_value, path_error = PathValidator.validate_and_sanitize_path(
-                            value, allowed_output_path
+                        valid_payload, payload_error = payload_gen.validate(row_dict)
+                        if not valid_payload:
+                            logger.warning("Row %s: %s", row_num, payload_error)
+                            stats['skipped_invalid'] += 1
+                            continue
+
+                        payload = payload_gen.generate(row_dict)
+                        t = timer.lap('payload', t)
+
+                        filename, name_errors = name_template.render(
+                            row_dict, phone.lstrip('+') if not keep_plus else phone, fallback=phone
                         )
-                        if path_error:
-                            logger.warning(f"Row {row_num}: {path_error}")
-                            sanitized_value = self.sanitizer.sanitize_template_value(value)
-                        filename_data[key] = sanitized_value
-                    
-                    filename_base = filename_template.format(**filename_data)
-                    filename = self.sanitizer.sanitize_filename(filename_base) + f'.{output_format}'
-                except (KeyError, IndexError) as e:
-                    filename = self.sanitizer.sanitize_filename(phone) + f'.{output_format}'
-
-                if allowed_output_path:
-                    full_output_path = os.path.join(allowed_output_path, filename)
-                else:
-                    full_output_path = os.path.join(output_folder, filename)
-
-                valid_path, path_error = self.sanitizer.validate_output_path(full_output_path, allowed_output_path)
-                if not valid_path:
-                    logger.error(f"Row {row_num}: {path_error}")
-                    stats['skipped_invalid'] += 1
-                    continue
-
-                if os.path.exists(full_output_path) and not overwrite:
-                    stats['skipped_existing'] += 1
-                    continue
-
-                if dry_run:
-                    logger.info(f"[DRY RUN] Would generate: {filename}")
-                    stats['generated'] += 1
-                    continue
-
-                result = self.generator.generate(
-                    payload,
-                    Path(full_output_path),
-                    fill_color,
-                    back_color,
-                    box_size,
-                    border,
-                    error_correction,
-                    output_format,
-                )
+                        for name_error in name_errors:
+                            logger.warning("Row %s: %s", row_num, name_error)
+
+                        # From here on filename is the path relative to the output root
+                        base_filename = filename
+                        filename = shard_path(filename, shard_depth)
+                        if allowed_output_path:
+                            full_output_path = os.path.join(allowed_output_path, filename)
+                        else:
+                            full_output_path = os.path.join(output_folder, filename)
+
+                        if snapshot is not None and snapshot.is_contained(filename):
+                            valid_path, path_error = True, None
+                        else:
+                            valid_path, path_error = self.sanitizer.validate_output_path(full_output_path, allowed_output_path)
+                        if not valid_path:
+                            logger.error("Row %s: %s", row_num, path_error)
+                            stats['skipped_invalid'] += 1
+                            continue
+                        collides_with = name_template.claim(filename, payload, row_num)
+                        if collides_with is not None:
+                            logger.warning(
+                                "Row %s: filename %s was already used by row %s for a different payload; "
+                                "adjust --filename-template to include a unique column",
+                                row_num, base_filename, collides_with,
+                            )
+                        t = timer.lap('filename', t)
+
+                        key = render_key(
+                            payload, fill_color, back_color, box_size, border,
+                            error_correction, output_format, render_engine,
+                        ) if journal is not None or render_cache is not None else None
+
+                        changed = False
+                        if journal is not None:
+                            if journal.is_current(filename, key):
+                                stats['skipped_unchanged'] += 1
+                                continue
+                            changed = journal.is_known(filename)
+
+                        if archive is not None:
+                            exists = filename in archive.names
+                            path_key = filename
+                        elif snapshot is None:
+                            # Label sheets, and dry runs of any single-file sink, have no output directory to check
+                            exists = False
+                            path_key = filename
+                        else:
+                            path_key = snapshot.key(filename)
+                            exists = not (overwrite or changed) and (
+                                path_key in submitted_paths or snapshot.exists(filename)
+                            )
+                        t = timer.lap('lookup', t)
+                        if exists:
+                            stats['skipped_existing'] += 1
+                            continue
+
+                        if dry_run:
+                            stats['generated'] += 1
+                            if row_policy.log_row(stats['generated']):
+                                logger.info("[DRY RUN] Would generate: %s", filename)
+                            continue
+
+                        if path_key in submitted_paths:
+                            for done_job, result in pool.drain():
+                                record_result(done_job, result)
+                        submitted_paths.add(path_key)
+
+                        job = {'row_number': row_num, 'filename': filename, 'render_key': key}
+                        output_path = Path(full_output_path)
+                        if archive is not None:
+                            try:
+                                qr = self.generator.make_qr(payload, box_size, border, error_correction)
+                                t = timer.lap('encode', t)
+                                qr_image = self.generator.make_image(qr, output_format, fill_color, back_color, render_engine)
+                                t = timer.lap('render', t)
+                                archive.add(filename, lambda stream: self.generator.write(qr_image, stream, output_format))
+                                timer.lap('save', t)
+                                archived = QRCodeResult(success=True, metadata={'archive': str(archive.path)})
+                            except Exception as e:
+                                archived = QRCodeResult(success=False, error=str(e))
+                            for done_job, result in pool.submit_result(job, archived):
+                                record_result(done_job, result)
+                            continue
+
+                        if sheet is not None:
+                            try:
+                                qr = self.generator.make_qr(payload, box_size, border, error_correction)
+                                t = timer.lap('encode', t)
+                                caption = row_dict.get(caption_column, '') if caption_column else ''
+                                page = sheet.add(qr.modules, qr.border, caption)
+                                timer.lap('save', t)
+                                labelled = QRCodeResult(success=True, metadata={'page': page})
+                            except Exception as e:
+                                labelled = QRCodeResult(success=False, error=str(e))
+                            for done_job, result in pool.submit_result(job, labelled):
+                                record_result(done_job, result)
+                            continue
 
-                if result.success:
-                    stats['generated'] += 1
-                    log_msg = f"Generated: {filename}"
-                    if redact_logs:
-                        log_msg = PIIRedactor.redact_pii(log_msg)
-                    logger.info(log_msg)
-                    
-                    if export_manifest:
-                        manifest.append({
-                            'row_number': row_num,
-                            'filename': filename,
-                            'payload_type': payload_format,
-                            'timestamp': datetime.now().isoformat(),
-                        })
-                else:
-                    logger.error(f"Row {row_num}: {result.error}")
-                    stats['skipped_invalid'] += 1
-
-            if export_manifest and manifest:
+                        if render_cache is not None:
+                            hit = render_cache.fetch(key, output_path)
+                            t = timer.lap('cache', t)
+                            if hit:
+                                cached = QRCodeResult(success=True, filepath=output_path, metadata={'cache': 'hit'})
+                                for done_job, result in pool.submit_result(job, cached):
+                                    record_result(done_job, result)
+                                continue
+                            render_cache.release(output_path)
+                            job['cache_miss'] = True
+
+                        snapshot.ensure_parent(output_path)
+                        if writer is not None:
+                            try:
+                                qr = self.generator.make_qr(payload, box_size, border, error_correction)
+                                t = timer.lap('encode', t)
+                                qr_image = self.generator.make_image(qr, output_format, fill_color, back_color, render_engine)
+                                timer.lap('render', t)
+                            except Exception as e:
+                                completed = pool.submit_result(job, QRCodeResult(success=False, error=str(e)))
+                            else:
+                                completed = pool.submit_future(
+                                    job, writer.submit(self.generator.save, qr_image, output_path, output_format, False)
+                                )
+                        else:
+                            completed = pool.submit(
+                                job,
+                                self.generator.generate,
+                                payload,
+                                output_path,
+                                fill_color,
+                                back_color,
+                                box_size,
+                                border,
+                                error_correction,
+                                output_format,
+                                render_engine,
+                                False,
+                            )
+                        for done_job, result in completed:
+                            record_result(done_job, result)
+
+                for done_job, result in pool.drain():
+                    record_result(done_job, result)
+                if archive is not None and manifest:
+                    archive.add_bytes(f"manifest.{manifest_format}", self._manifest_bytes(manifest, manifest_format))
+
+            if archive is not None:
+                logger.info(f"Archive written to: {archive.path}")
+            if sheet is not None:
+                stats['label_pages'] = sheet.pages
+                logger.info(f"Label sheet written to: {sheet.path}")
+
+            is_valid, validation_result = ingestion.validation_report()
+            if not is_valid:
+                logger.warning(f"Data validation issues: {validation_result}")
+            stats['ingest_seconds'] = round(ingestion.seconds, 3)
+            timer.add('read', ingestion.seconds - ingestion.validate_seconds)
+            timer.add('validate', ingestion.validate_seconds)
+            if render_cache is not None:
+                stats.update(render_cache.stats())
+            if writer is not None:
+                stats.update(writer.stats())
+                timer.add('save', writer.busy_seconds)
+            if snapshot is not None:
+                stats.update(snapshot.stats())
+
+            if export_manifest and manifest and archive is None:
+                t = time.perf_counter()
+                os.makedirs(output_folder, exist_ok=True)
                 manifest_path = os.path.join(output_folder, f"manifest.{manifest_format}")
-                if manifest_format == 'json':
-                    with open(manifest_path, 'w') as f:
-                        json.dump(manifest, f, indent=2)
-                elif manifest_format == 'csv':
-                    pd.DataFrame(manifest).to_csv(manifest_path, index=False)
+                with open(manifest_path, 'wb') as f:
+                    f.write(self._manifest_bytes(manifest, manifest_format))
+                timer.lap('manifest', t)
                 logger.info(f"Manifest exported to: {manifest_path}")
 
+            stats['stage_seconds'] = timer.summary()
+            stats['filename_collisions'] = name_template.collisions
+            stats['row_logs_suppressed'] = row_policy.suppressed
+
             stats['end_time'] = datetime.now().isoformat()
             
             logger.info("\n" + "="*50)
@@ -216,16 +462,55 @@ class QRCodeService:
             logger.info("="*50)
             logger.info(f"Total rows:        {stats['total']}")
             logger.info(f"QR codes generated: {stats['generated']}")
+            logger.info(f"Input parsed once:  {stats['ingest_seconds']:.3f}s")
+            logger.info("Stage times:        " + ", ".join(
+                f"{stage} {seconds:.3f}s" for stage, seconds in stats['stage_seconds'].items()
+            ))
             if stats['skipped_existing'] > 0:
                 logger.info(f"Skipped (existing): {stats['skipped_existing']}")
             if stats['skipped_duplicate'] > 0:
                 logger.info(f"Skipped (duplicate): {stats['skipped_duplicate']}")
+            if stats['skipped_unchanged'] > 0:
+                logger.info(f"Skipped (unchanged): {stats['skipped_unchanged']}")
             if stats['skipped_invalid'] > 0:
                 logger.info(f"Skipped (invalid):  {stats['skipped_invalid']}")
+            if stats['filename_collisions'] > 0:
+                logger.info(f"Filename collisions: {stats['filename_collisions']}")
+            if stats['row_logs_suppressed'] > 0:
+                logger.info(f"Row log lines:      {stats['row_logs_suppressed']} suppressed (--row-log {row_log})")
+            if sheet is not None:
+                logger.info(f"Label pages:        {stats['label_pages']} ({sheet.columns}x{sheet.rows} per page)")
+            if render_cache is not None:
+                logger.info(f"Cache hits/misses:  {stats['cache_hits']}/{stats['cache_misses']}")
+            if snapshot is not None:
+                logger.info(
+                    f"Syscalls avoided:   {stats['exists_calls_avoided']} exists, "
+                    f"{stats['path_checks_avoided']} abspath, {stats['mkdir_calls_avoided']} mkdir "
+                    f"({stats['snapshot_scans']} directory scans)"
+                )
+            if writer is not None:
+                logger.info(
+                    f"Write latency:      p50 {stats['write_p50_ms']}ms, p95 {stats['write_p95_ms']}ms, "
+                    f"max {stats['write_max_ms']}ms ({stats['write_backpressure_waits']} backpressure waits)"
+                )
             logger.info("="*50)
 
             return 0
 
+        except RowLimitExceeded as e:
+            logger.error(f"{str(e)}; no QR codes were written")
+            return 1
         except Exception as e:
             logger.error(f"Error processing Excel file: {str(e)}")
             return 1
+        finally:
+            if redaction is not None:
+                logger.removeFilter(redaction)
+            if journal is not None:
+                journal.close()
+
+    @staticmethod
+    def _manifest_bytes(manifest: List[Dict[str, Any]], manifest_format: str) -> bytes:
+        if manifest_format == 'csv':
+            return pd.DataFrame(manifest).to_csv(index=False).encode('utf-8')
+        return json.dumps(manifest, indent=2).encode('utf-8')
@@ -9,7 +9,7 @@ DEFAULT_BORDER: Final[int] = 4
 DEFAULT_MAX_FILE_SIZE_MB: Final[int] = 100
 DEFAULT_MAX_ROWS: Final[int] = 100000
 
-VALID_INPUT_EXTENSIONS: Final[set] = {".xlsx", ".xls", ".csv", ".json"}
+VALID_INPUT_EXTENSIONS: Final[set] = {".xlsx", ".xls", ".csv", ".json", ".ndjson", ".jsonl"}
 VALID_OUTPUT_EXTENSIONS: Final[set] = {".png", ".svg", ".pdf"}
 
 WINDOWS_RESERVED_NAMES: Final[set] = {
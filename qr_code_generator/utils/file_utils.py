@@ -1,7 +1,8 @@
 import os
-import pandas as pd
+from itertools import islice
 from pathlib import Path
 from typing import Optional, Tuple
+from qr_code_generator.plugins.input import get_reader
 from qr_code_generator.utils.constants import (
     DEFAULT_MAX_FILE_SIZE_MB, 
     DEFAULT_MAX_ROWS,
@@ -32,20 +33,27 @@ class FileValidator:
                 return False, f"Error reading file: {str(e)}"
         return True, None
 
+    @staticmethod
+    def check_file_size(filepath: str, max_size_mb: int = DEFAULT_MAX_FILE_SIZE_MB) -> Tuple[bool, Optional[str]]:
+        file_size = os.path.getsize(filepath)
+        max_bytes = max_size_mb * 1024 * 1024
+        if file_size > max_bytes:
+            return False, f"File size ({file_size / (1024*1024):.1f}MB) exceeds limit ({max_size_mb}MB)"
+        return True, None
+
     @staticmethod
     def check_file_size_limits(
         filepath: str, 
         max_size_mb: int = DEFAULT_MAX_FILE_SIZE_MB,
         max_rows: int = DEFAULT_MAX_ROWS
     ) -> Tuple[bool, Optional[str]]:
-        file_size = os.path.getsize(filepath)
-        max_bytes = max_size_mb * 1024 * 1024
-        if file_size > max_bytes:
-            return False, f"File size ({file_size / (1024*1024):.1f}MB) exceeds limit ({max_size_mb}MB)"
+        valid, error = FileValidator.check_file_size(filepath, max_size_mb)
+        if not valid:
+            return valid, error
         try:
-            df = pd.read_excel(filepath, nrows=max_rows + 1)
-            if len(df) > max_rows:
-                return False, f"Row count ({len(df)}) exceeds limit ({max_rows})"
+            row_count = sum(1 for _ in islice(get_reader(filepath).iter_rows(filepath), max_rows + 1))
+            if row_count > max_rows:
+                return False, f"Row count ({row_count}) exceeds limit ({max_rows})"
         except Exception as e:
             return False, f"Error reading file: {str(e)}"
         return True, None
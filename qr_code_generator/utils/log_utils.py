@@ -0,0 +1,74 @@
+import logging
+import queue
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterator, Optional
+
+
+DEFAULT_PROGRESS_SECONDS = 10.0
+
+
+class DeferredQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue stays in-process, so formatting is left to the listener thread
+        return record
+
+
+@contextmanager
+def queued_logging(logger: Optional[logging.Logger] = None) -> Iterator[Optional[QueueListener]]:
+    target = logger or logging.getLogger()
+    handlers = list(target.handlers)
+    if not handlers:
+        yield None
+        return
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    target.handlers = [DeferredQueueHandler(records)]
+    listener.start()
+    try:
+        yield listener
+    finally:
+        # stop() drains every queued record before the original handlers come back
+        listener.stop()
+        target.handlers = handlers
+
+
+class RowLogPolicy:
+    def __init__(self, spec: str = 'every', clock=time.monotonic):
+        mode, _, value = spec.partition(':')
+        self.mode = mode
+        self.sample_every = 1
+        self.interval: Optional[float] = None
+        try:
+            if mode == 'sample':
+                self.sample_every = int(value)
+                if self.sample_every < 1:
+                    raise ValueError(value)
+            elif mode == 'summary':
+                self.interval = float(value) if value else DEFAULT_PROGRESS_SECONDS
+                if self.interval <= 0:
+                    raise ValueError(value)
+            elif mode != 'every' or value:
+                raise ValueError(value)
+        except ValueError:
+            raise ValueError(f"Invalid row log policy: {spec}. Use every, sample:N or summary[:SECONDS]") from None
+        self.suppressed = 0
+        self._clock = clock
+        self._next_progress = clock() + self.interval if self.interval else None
+
+    def log_row(self, count: int) -> bool:
+        # Sampling keeps the first row and every Nth one after it; summary mode keeps none
+        if self.mode == 'every' or self.mode == 'sample' and (count - 1) % self.sample_every == 0:
+            return True
+        self.suppressed += 1
+        return False
+
+    def progress_due(self) -> bool:
+        if self._next_progress is None:
+            return False
+        now = self._clock()
+        if now < self._next_progress:
+            return False
+        self._next_progress = now + self.interval
+        return True
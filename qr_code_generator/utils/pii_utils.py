@@ -1,5 +1,13 @@
+import logging
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+
+REDACTION_CACHE_SIZE = 4096
+
+NON_DIGIT = re.compile(r'\D')
+DIGIT = re.compile(r'\d')
 
 
 class PIIRedactor:
@@ -9,7 +17,7 @@ class PIIRedactor:
     @staticmethod
     def mask_phone(phone_str: str, mask_char: str = '*') -> str:
         phone_str = phone_str.strip()
-        digits = re.sub(r'\D', '', phone_str)
+        digits = NON_DIGIT.sub('', phone_str)
         if len(digits) <= 4:
             return phone_str
         visible_end = digits[-4:]
@@ -38,10 +46,47 @@ class PIIRedactor:
 
     @staticmethod
     def redact_pii(text: str, mask_char: str = '*') -> str:
-        text = PIIRedactor.PHONE_REGEX.sub(
-            lambda m: PIIRedactor.mask_phone(m.group(0), mask_char), text
-        )
-        text = PIIRedactor.EMAIL_REGEX.sub(
-            lambda m: PIIRedactor.mask_email(m.group(0), mask_char), text
-        )
+        phone_repl, email_repl = _replacers(mask_char)
+        # Neither pattern can match without a digit or an '@', which skips most log lines outright
+        if DIGIT.search(text):
+            text = PIIRedactor.PHONE_REGEX.sub(phone_repl, text)
+        if '@' in text:
+            text = PIIRedactor.EMAIL_REGEX.sub(email_repl, text)
         return text
+
+
+@lru_cache(maxsize=REDACTION_CACHE_SIZE)
+def _masked_phone(value: str, mask_char: str) -> str:
+    return PIIRedactor.mask_phone(value, mask_char)
+
+
+@lru_cache(maxsize=REDACTION_CACHE_SIZE)
+def _masked_email(value: str, mask_char: str) -> str:
+    return PIIRedactor.mask_email(value, mask_char)
+
+
+@lru_cache(maxsize=8)
+def _replacers(mask_char: str) -> Tuple[Callable[[re.Match], str], Callable[[re.Match], str]]:
+    # Built once per mask character; masked values are memoized because log lines repeat the same contacts
+    def phone(match: re.Match) -> str:
+        return _masked_phone(match.group(0), mask_char)
+
+    def email(match: re.Match) -> str:
+        return _masked_email(match.group(0), mask_char)
+
+    return phone, email
+
+
+class PIIRedactionFilter(logging.Filter):
+    def __init__(self, name: str = '', mask_char: str = '*'):
+        super().__init__(name)
+        self.mask_char = mask_char
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Loggers only build records for enabled levels, so this never runs when the level is suppressed.
+        # Only the interpolated arguments are redacted; message templates are constant text.
+        if isinstance(record.args, tuple) and record.args:
+            record.args = tuple(
+                PIIRedactor.redact_pii(arg, self.mask_char) if isinstance(arg, str) else arg for arg in record.args
+            )
+        return True
@@ -0,0 +1,65 @@
+import math
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def latency_summary(seconds: Sequence[float], prefix: str = '') -> Dict[str, float]:
+    return {
+        f'{prefix}count': len(seconds),
+        f'{prefix}p50_ms': round(percentile(seconds, 50) * 1000, 3),
+        f'{prefix}p95_ms': round(percentile(seconds, 95) * 1000, 3),
+        f'{prefix}p99_ms': round(percentile(seconds, 99) * 1000, 3),
+        f'{prefix}max_ms': round(max(seconds, default=0.0) * 1000, 3),
+    }
+
+
+STAGES = ('read', 'validate', 'format', 'payload', 'filename', 'lookup', 'cache', 'encode', 'render', 'save', 'manifest')
+
+
+class StageTimer:
+    def __init__(self) -> None:
+        self.seconds: Dict[str, float] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    def lap(self, stage: str, since: float) -> float:
+        now = time.perf_counter()
+        self.add(stage, now - since)
+        return now
+
+    def merge(self, timings: Mapping[str, float]) -> None:
+        for stage, seconds in timings.items():
+            self.add(stage, seconds)
+
+    def summary(self) -> Dict[str, float]:
+        ordered = [stage for stage in STAGES if stage in self.seconds]
+        ordered += sorted(stage for stage in self.seconds if stage not in STAGES)
+        return {stage: round(self.seconds[stage], 4) for stage in ordered}
+
+
+@contextmanager
+def profiled(path: Optional[str | Path]) -> Iterator[Any]:
+    if not path:
+        yield None
+        return
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(path))
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+
+from qr_code_generator import __version__
+
+
+HEAVY_MODULES = {'pandas', 'numpy', 'qrcode', 'PIL', 'openpyxl'}
+
+
+def imported_modules(*args):
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args], capture_output=True, text=True, check=True,
+    )
+    # Each -X importtime line ends with "| <indented dotted module name>"
+    modules = set()
+    for line in completed.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            modules.add(line.rsplit('|', 1)[1].strip())
+    return completed, modules
+
+
+class TestCliStartup:
+    @pytest.mark.parametrize('flag', ['--version', '--help'])
+    def test_cli_does_not_import_heavy_dependencies(self, flag):
+        completed, modules = imported_modules('-m', 'qr_code_generator', flag)
+        assert {name.split('.')[0] for name in modules} & HEAVY_MODULES == set()
+        if flag == '--version':
+            assert __version__ in completed.stdout
+
+    def test_package_import_is_lazy(self):
+        _, modules = imported_modules('-c', 'import qr_code_generator')
+        assert {name.split('.')[0] for name in modules} & HEAVY_MODULES == set()
+
+    def test_server_does_not_import_pandas(self):
+        _, modules = imported_modules('-c', 'import qr_code_generator.server')
+        assert 'pandas' not in modules
+
+    def test_lazy_exports_resolve(self):
+        import qr_code_generator
+        from qr_code_generator.core.generator import QRCodeGenerator
+        assert qr_code_generator.QRCodeGenerator is QRCodeGenerator
+        assert 'FilenameSanitizer' in dir(qr_code_generator)
+        with pytest.raises(AttributeError):
+            qr_code_generator.Missing
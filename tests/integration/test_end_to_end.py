@@ -1,9 +1,19 @@
+import json
+import logging
+import subprocess
+import sys
+import tarfile
+import zipfile
 import pytest
 
 from pathlib import Path
 from qr_code_generator.service import QRCodeService
 
 
+def service_logger_filters():
+    return logging.getLogger('qr_code_generator.service').filters
+
+
 class TestIntegration:
     def test_end_to_end_basic(self, sample_excel_file, temp_dir):
         service = QRCodeService()
@@ -108,6 +118,304 @@ class TestIntegration:
         
         assert exit_code == 0
 
+    def test_end_to_end_with_workers(self, sample_excel_with_duplicates, temp_dir):
+        service = QRCodeService()
+        output_folder = str(temp_dir / "output")
+
+        exit_code = service.generate_from_excel(
+            str(sample_excel_with_duplicates),
+            output_folder,
+            export_manifest=True,
+            workers=2,
+        )
+
+        assert exit_code == 0
+        output_path = Path(output_folder)
+        assert len(list(output_path.glob("*.png"))) == 2
+        manifest = json.loads((output_path / "manifest.json").read_text())
+        assert [entry['row_number'] for entry in manifest] == [2, 4]
+
+    def test_end_to_end_with_writer_threads(self, sample_excel_file, temp_dir, caplog):
+        service = QRCodeService()
+        output_folder = str(temp_dir / "output")
+
+        with caplog.at_level('INFO'):
+            exit_code = service.generate_from_excel(
+                str(sample_excel_file),
+                output_folder,
+                export_manifest=True,
+                writer_threads=2,
+                write_queue_size=1,
+            )
+
+        assert exit_code == 0
+        output_path = Path(output_folder)
+        assert len(list(output_path.glob("*.png"))) == 3
+        manifest = json.loads((output_path / "manifest.json").read_text())
+        assert [entry['row_number'] for entry in manifest] == [2, 3, 4]
+        assert "Write latency:" in caplog.text
+        assert "Stage times:" in caplog.text
+        assert "encode " in caplog.text and "save " in caplog.text
+
+    def test_end_to_end_skip_existing_uses_snapshot(self, sample_excel_file, temp_dir, caplog):
+        service = QRCodeService()
+        output_folder = str(temp_dir / "output")
+
+        assert service.generate_from_excel(str(sample_excel_file), output_folder) == 0
+        sorted(Path(output_folder).glob("*.png"))[0].unlink()
+        caplog.clear()
+        with caplog.at_level('INFO'):
+            exit_code = service.generate_from_excel(str(sample_excel_file), output_folder)
+
+        assert exit_code == 0
+        assert len(list(Path(output_folder).glob("*.png"))) == 3
+        assert "Skipped (existing): 2" in caplog.text
+        assert "Syscalls avoided:   3 exists, 3 abspath, 0 mkdir (1 directory scans)" in caplog.text
+
+    def test_end_to_end_shard_depth(self, sample_excel_file, temp_dir):
+        service = QRCodeService()
+        output_folder = temp_dir / "output"
+
+        exit_code = service.generate_from_excel(
+            str(sample_excel_file), str(output_folder), export_manifest=True, shard_depth=2,
+        )
+
+        assert exit_code == 0
+        assert list(output_folder.glob("*.png")) == []
+        files = sorted(output_folder.glob("*/*/*.png"))
+        assert len(files) == 3
+        manifest = json.loads((output_folder / "manifest.json").read_text())
+        relative = sorted(entry['filename'] for entry in manifest)
+        assert relative == sorted(path.relative_to(output_folder).as_posix() for path in files)
+
+        files[0].unlink()
+        stamp = files[1].stat().st_mtime_ns
+        assert service.generate_from_excel(str(sample_excel_file), str(output_folder), shard_depth=2) == 0
+        assert files[0].exists()
+        assert files[1].stat().st_mtime_ns == stamp
+
+        assert service.generate_from_excel(str(sample_excel_file), str(output_folder), overwrite=True, shard_depth=2) == 0
+        assert len(list(output_folder.rglob("*.png"))) == 3
+
+    def test_end_to_end_invalid_shard_depth(self, sample_excel_file, temp_dir):
+        service = QRCodeService()
+        assert service.generate_from_excel(str(sample_excel_file), str(temp_dir / "output"), shard_depth=9) == 1
+
+    def test_end_to_end_logs_are_redacted(self, sample_excel_file, temp_dir, caplog):
+        service = QRCodeService()
+        with caplog.at_level('INFO'):
+            assert service.generate_from_excel(str(sample_excel_file), str(temp_dir / "output")) == 0
+        assert "Generated: +********7890.png" in caplog.text
+        assert "+441234567890" not in caplog.text
+        assert not service_logger_filters()
+
+    def test_cli_quiet_suppresses_service_logs(self, sample_excel_file, temp_dir):
+        completed = subprocess.run(
+            [sys.executable, '-m', 'qr_code_generator', '-q',
+             '--input', str(sample_excel_file), '--output', str(temp_dir / "output")],
+            capture_output=True, text=True,
+        )
+        assert completed.returncode == 0
+        assert completed.stderr == ""
+        assert len(list((temp_dir / "output").glob("*.png"))) == 3
+
+    @pytest.mark.parametrize("row_log, generated_lines, suppressed", [
+        ("every", 3, None),
+        ("sample:2", 2, 1),
+        ("summary", 0, 3),
+    ])
+    def test_end_to_end_row_log_policy(self, sample_excel_file, temp_dir, caplog, row_log, generated_lines, suppressed):
+        service = QRCodeService()
+        with caplog.at_level('INFO'):
+            exit_code = service.generate_from_excel(
+                str(sample_excel_file), str(temp_dir / "output"), row_log=row_log,
+            )
+        assert exit_code == 0
+        assert len(list((temp_dir / "output").glob("*.png"))) == 3
+        assert caplog.text.count("Generated: ") == generated_lines
+        if suppressed is None:
+            assert "Row log lines:" not in caplog.text
+        else:
+            assert f"Row log lines:      {suppressed} suppressed (--row-log {row_log})" in caplog.text
+
+    def test_end_to_end_invalid_row_log(self, sample_excel_file, temp_dir):
+        service = QRCodeService()
+        assert service.generate_from_excel(str(sample_excel_file), str(temp_dir / "output"), row_log="sample:0") == 1
+
+    @pytest.mark.parametrize("archive_name", ["codes.zip", "codes.tar"])
+    def test_end_to_end_output_archive(self, sample_excel_with_duplicates, temp_dir, archive_name):
+        service = QRCodeService()
+        output_folder = temp_dir / "output"
+        archive_path = temp_dir / archive_name
+
+        exit_code = service.generate_from_excel(
+            str(sample_excel_with_duplicates),
+            str(output_folder),
+            output_archive=str(archive_path),
+            overwrite=True,
+        )
+
+        assert exit_code == 0
+        assert not output_folder.exists()
+        if archive_name.endswith('.zip'):
+            with zipfile.ZipFile(archive_path) as zf:
+                names = zf.namelist()
+                manifest = json.loads(zf.read("manifest.json"))
+        else:
+            with tarfile.open(archive_path) as tf:
+                names = tf.getnames()
+                manifest = json.loads(tf.extractfile("manifest.json").read())
+        assert names == ["+441234567890.png", "+442345678901.png", "manifest.json"]
+        assert [entry['row_number'] for entry in manifest] == [2, 4]
+
+    @pytest.mark.parametrize("archive_name", ["codes.zip", "codes.tar.gz"])
+    def test_end_to_end_pdf_archive(self, sample_excel_file, temp_dir, archive_name, caplog):
+        service = QRCodeService()
+        archive_path = temp_dir / archive_name
+
+        with caplog.at_level('INFO'):
+            exit_code = service.generate_from_excel(
+                str(sample_excel_file), str(temp_dir / "output"), output_format='pdf', output_archive=str(archive_path),
+            )
+
+        assert exit_code == 0
+        assert "Skipped (invalid)" not in caplog.text
+        if archive_name.endswith('.zip'):
+            with zipfile.ZipFile(archive_path) as zf:
+                contents = [zf.read(name) for name in zf.namelist() if name.endswith('.pdf')]
+        else:
+            with tarfile.open(archive_path) as tf:
+                contents = [tf.extractfile(member).read() for member in tf.getmembers() if member.name.endswith('.pdf')]
+        assert len(contents) == 3
+        assert all(data.startswith(b"%PDF") for data in contents)
+
+    def test_end_to_end_label_sheet(self, sample_excel_file, temp_dir, caplog):
+        service = QRCodeService()
+        sheet_path = temp_dir / "labels.pdf"
+
+        with caplog.at_level('INFO'):
+            exit_code = service.generate_from_excel(
+                str(sample_excel_file),
+                str(temp_dir / "output"),
+                label_sheet=str(sheet_path),
+                label_grid='1x2',
+                caption_column='Name',
+            )
+
+        assert exit_code == 0
+        assert sheet_path.read_bytes().startswith(b'%PDF')
+        assert b'/Count 2' in sheet_path.read_bytes()
+        assert not (temp_dir / "output").exists()
+        assert "Label pages:        2" in caplog.text
+
+    @pytest.mark.parametrize("sink", [
+        {'output_archive': 'codes.zip'},
+        {'label_sheet': 'labels.pdf'},
+    ])
+    def test_end_to_end_dry_run_single_file_sink(self, sample_excel_file, temp_dir, caplog, sink):
+        service = QRCodeService()
+        sink = {option: str(temp_dir / name) for option, name in sink.items()}
+
+        with caplog.at_level('INFO'):
+            exit_code = service.generate_from_excel(
+                str(sample_excel_file), str(temp_dir / "output"), dry_run=True, **sink,
+            )
+
+        assert exit_code == 0
+        assert caplog.text.count("[DRY RUN] Would generate:") == 3
+        assert sorted(p.name for p in temp_dir.iterdir()) == [sample_excel_file.name]
+
+    def test_end_to_end_csv_input(self, sample_csv_file, temp_dir):
+        service = QRCodeService()
+        output_folder = str(temp_dir / "output")
+
+        exit_code = service.generate_from_excel(str(sample_csv_file), output_folder)
+
+        assert exit_code == 0
+        assert sorted(p.name for p in Path(output_folder).glob("*.png")) == [
+            "+441234567890.png",
+            "+442345678901.png",
+        ]
+
+    def test_end_to_end_ndjson_input(self, temp_dir):
+        input_file = temp_dir / "contacts.ndjson"
+        input_file.write_text('{"Phone": "441234567890"}\n{"Phone": "442345678901"}\n')
+        service = QRCodeService()
+        output_folder = str(temp_dir / "output")
+
+        exit_code = service.generate_from_excel(str(input_file), output_folder)
+
+        assert exit_code == 0
+        assert len(list(Path(output_folder).glob("*.png"))) == 2
+
+    def test_end_to_end_filename_collisions(self, temp_dir, caplog):
+        input_file = temp_dir / "contacts.csv"
+        input_file.write_text("Phone,Name\n441234567890,Ada\n442345678901,Ada\n441234567890,Ada\n")
+        service = QRCodeService()
+        output_folder = temp_dir / "output"
+
+        with caplog.at_level('INFO'):
+            exit_code = service.generate_from_excel(str(input_file), str(output_folder), filename_template='{Name}')
+
+        assert exit_code == 0
+        assert [p.name for p in output_folder.glob("*.png")] == ["Ada.png"]
+        assert "Row 3: filename Ada.png was already used by row 2" in caplog.text
+        assert "Row 4: filename" not in caplog.text
+        assert "Filename collisions: 1" in caplog.text
+
+    def test_end_to_end_case_insensitive_names(self, temp_dir, caplog, monkeypatch):
+        from qr_code_generator.core.snapshot import DirectorySnapshot
+        monkeypatch.setattr(DirectorySnapshot, '_probe_case', staticmethod(lambda path, names: True))
+        input_file = temp_dir / "contacts.csv"
+        input_file.write_text("Phone,Name\n441234567890,Ada\n442345678901,ADA\n")
+        service = QRCodeService()
+        output_folder = temp_dir / "output"
+
+        with caplog.at_level('INFO'):
+            exit_code = service.generate_from_excel(str(input_file), str(output_folder), filename_template='{Name}')
+
+        assert exit_code == 0
+        assert [p.name for p in output_folder.glob("*.png")] == ["Ada.png"]
+        assert "Skipped (existing): 1" in caplog.text
+
+    def test_end_to_end_invalid_filename_template(self, sample_excel_file, temp_dir):
+        service = QRCodeService()
+        exit_code = service.generate_from_excel(str(sample_excel_file), str(temp_dir / "output"), filename_template='{Name')
+        assert exit_code == 1
+
+    def test_end_to_end_with_render_cache(self, sample_excel_file, temp_dir, caplog):
+        service = QRCodeService()
+        cache_dir = str(temp_dir / "cache")
+        caplog.set_level(logging.INFO)
+
+        first = service.generate_from_excel(str(sample_excel_file), str(temp_dir / "first"), cache_dir=cache_dir)
+        second = service.generate_from_excel(str(sample_excel_file), str(temp_dir / "second"), cache_dir=cache_dir)
+
+        assert first == 0 and second == 0
+        assert "Cache hits/misses:  3/0" in caplog.text
+        for name in ("+441234567890.png", "+442345678901.png", "+443456789012.png"):
+            assert (temp_dir / "second" / name).read_bytes() == (temp_dir / "first" / name).read_bytes()
+
+    def test_end_to_end_resume(self, temp_dir, caplog):
+        input_file = temp_dir / "contacts.csv"
+        input_file.write_text("Phone,Name\n+441234567890,John\n+442345678901,Alice\n")
+        output_folder = temp_dir / "output"
+        service = QRCodeService()
+        caplog.set_level(logging.INFO)
+
+        assert service.generate_from_excel(str(input_file), str(output_folder), payload_format='vcard', resume=True) == 0
+        assert (output_folder / ".qrgen-journal.jsonl").exists()
+        first_alice = (output_folder / "+442345678901.png").read_bytes()
+
+        input_file.write_text("Phone,Name\n+441234567890,John\n+442345678901,Alicia\n+443456789012,Bob\n")
+        caplog.clear()
+        assert service.generate_from_excel(str(input_file), str(output_folder), payload_format='vcard', resume=True) == 0
+
+        assert "QR codes generated: 2" in caplog.text
+        assert "Skipped (unchanged): 1" in caplog.text
+        assert (output_folder / "+442345678901.png").read_bytes() != first_alice
+        assert (output_folder / "+443456789012.png").exists()
+
     def test_end_to_end_max_rows(self, sample_excel_file, temp_dir):
         service = QRCodeService()
         output_folder = str(temp_dir / "output")
@@ -119,6 +427,26 @@ class TestIntegration:
         )
         
         assert exit_code == 1
+        assert not Path(output_folder).exists() or list(Path(output_folder).iterdir()) == []
+
+    def test_end_to_end_max_rows_at_limit(self, sample_excel_file, temp_dir):
+        service = QRCodeService()
+        output_folder = str(temp_dir / "output")
+        assert service.generate_from_excel(str(sample_excel_file), output_folder, max_rows=3) == 0
+        assert len(list(Path(output_folder).glob("*.png"))) == 3
+
+    def test_end_to_end_max_file_size(self, sample_excel_file, temp_dir):
+        service = QRCodeService()
+        output_folder = str(temp_dir / "output")
+
+        exit_code = service.generate_from_excel(
+            str(sample_excel_file),
+            output_folder,
+            max_file_size_mb=0,
+        )
+
+        assert exit_code == 1
+        assert len(list(Path(output_folder).glob("*.png"))) == 0
 
     def test_end_to_end_invalid_file(self, temp_dir):
         service = QRCodeService()
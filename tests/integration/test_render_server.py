@@ -0,0 +1,136 @@
+import asyncio
+import http.client
+import json
+import socket
+import threading
+import time
+import pytest
+
+from qr_code_generator.core.generator import QRCodeGenerator
+from qr_code_generator.plugins.payload import WiFiPayload
+from qr_code_generator import server as server_module
+from qr_code_generator.server import RenderServer
+
+
+@pytest.fixture
+def server():
+    render_server = RenderServer(port=0, cache_size=2)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(render_server.start(), loop).result(5)
+    yield render_server
+    asyncio.run_coroutine_threadsafe(render_server.close(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+def _request(server, method, path, body=None, headers=None):
+    conn = http.client.HTTPConnection(server.host, server.port, timeout=5)
+    try:
+        conn.request(method, path, body=body, headers=headers or {})
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        conn.close()
+
+
+class TestRenderServer:
+    def test_health_and_formats(self, server):
+        status, _, body = _request(server, 'GET', '/health')
+        assert status == 200
+        assert json.loads(body) == {'status': 'ok'}
+        formats = json.loads(_request(server, 'GET', '/formats')[2])
+        assert 'vcard' in formats['payloads']
+        assert formats['outputs'] == ['pdf', 'png', 'svg']
+
+    @pytest.mark.parametrize("path,content_type,magic", [
+        ('/render/phone?Phone=%2B441234567890', 'image/png', b'\x89PNG'),
+        ('/render/vcard.svg?Phone=441234567890&Name=Ada', 'image/svg+xml', b'<?xml'),
+        ('/render/url?URL=https://example.com&format=pdf', 'application/pdf', b'%PDF'),
+        ('/render/phone.svg?Phone=1234567&box_size=40&border=0', 'image/svg+xml', b'<?xml'),
+    ])
+    def test_render_formats(self, server, path, content_type, magic):
+        status, headers, body = _request(server, 'GET', path)
+        assert status == 200
+        assert headers['Content-Type'] == content_type
+        assert body.startswith(magic)
+
+    def test_post_json_matches_library_output(self, server):
+        fields = {'SSID': 'Office', 'Password': 'secret'}
+        status, _, body = _request(server, 'POST', '/render/wifi.png?box_size=4', body=json.dumps(fields))
+        assert status == 200
+        expected = QRCodeGenerator().generate_bytes(WiFiPayload().generate(fields), box_size=4)
+        assert body == expected
+
+    def test_lru_cache_and_stats(self, server):
+        paths = [f'/render/phone?Phone={n}' for n in ('111', '222', '111', '333', '222')]
+        results = [_request(server, 'GET', path)[1]['X-Cache'] for path in paths]
+        assert results == ['MISS', 'MISS', 'HIT', 'MISS', 'MISS']
+
+        stats = json.loads(_request(server, 'GET', '/stats')[2])
+        assert stats['cache_hits'] == 1
+        assert stats['cache_misses'] == 4
+        assert stats['renders'] == 4
+        assert stats['cache_entries'] == 2
+        assert stats['latency_count'] == 5
+        assert stats['latency_max_ms'] >= stats['latency_p50_ms'] > 0
+
+    def test_etag_not_modified(self, server):
+        _, headers, _ = _request(server, 'GET', '/render/phone?Phone=123')
+        status, _, body = _request(server, 'GET', '/render/phone?Phone=123', headers={'If-None-Match': headers['ETag']})
+        assert status == 304
+        assert body == b''
+
+    def test_keep_alive_connection_reused(self, server):
+        conn = http.client.HTTPConnection(server.host, server.port, timeout=5)
+        try:
+            for _ in range(3):
+                conn.request('GET', '/render/phone?Phone=123')
+                response = conn.getresponse()
+                assert response.status == 200
+                response.read()
+        finally:
+            conn.close()
+
+    @pytest.mark.parametrize("path,status", [
+        ('/render/unknown?Phone=1', 404),
+        ('/render/phone.gif?Phone=1', 404),
+        ('/render/wifi?Password=x', 400),
+        ('/render/phone?Phone=1&box_size=big', 400),
+        ('/render/phone?Phone=1&box_size=0', 400),
+        ('/render/phone?Phone=1&box_size=100000', 400),
+        ('/render/phone?Phone=1&border=-1', 400),
+        ('/render/phone?Phone=1&border=21', 400),
+        ('/render/phone?Phone=1&render_engine=cairo', 400),
+        ('/nope', 404),
+    ])
+    def test_errors(self, server, path, status):
+        response_status, headers, body = _request(server, 'GET', path)
+        assert response_status == status
+        assert headers['Content-Type'] == 'application/json'
+        assert 'error' in json.loads(body)
+
+    @pytest.mark.parametrize("raw,status", [
+        (b"garbage\r\n\r\n", b"400"),
+        (b"GET /health\r\n\r\n", b"400"),
+        (b"GET /health HTTP/1.1\r\nno-colon\r\n\r\n", b"400"),
+        (b"POST /render/wifi HTTP/1.1\r\nContent-Length: -1\r\n\r\n", b"400"),
+        (b"POST /render/wifi HTTP/1.1\r\nContent-Length: 99999999\r\n\r\n", b"413"),
+    ])
+    def test_malformed_request_gets_response(self, server, raw, status):
+        with socket.create_connection((server.host, server.port), timeout=5) as sock:
+            sock.sendall(raw)
+            response = sock.makefile('rb').read()
+        assert response.startswith(b"HTTP/1.1 " + status)
+        assert b"Connection: close" in response
+        assert b'"error"' in response
+
+    def test_stalled_headers_time_out(self, server, monkeypatch):
+        monkeypatch.setattr(server_module, 'KEEP_ALIVE_SECONDS', 0.2)
+        with socket.create_connection((server.host, server.port), timeout=5) as sock:
+            sock.sendall(b"GET /health HTTP/1.1\r\nHost: x\r\n")
+            start = time.monotonic()
+            assert sock.recv(1024) == b""
+            assert time.monotonic() - start < 4
@@ -0,0 +1,121 @@
+import io
+import tarfile
+import zipfile
+import pytest
+from qr_code_generator.core.archive import ArchiveSink, archive_kind
+from qr_code_generator.core.generator import QRCodeGenerator
+
+
+class TestArchiveSink:
+    @pytest.mark.parametrize("name,kind", [
+        ("out.zip", "zip"), ("out.tar", "tar"), ("out.TAR.GZ", "tar"), ("out.tgz", "tar"), ("out.rar", None),
+    ])
+    def test_archive_kind(self, name, kind):
+        assert archive_kind(name) == kind
+
+    def test_zip_entries_streamed(self, temp_dir):
+        path = temp_dir / "codes.zip"
+        with ArchiveSink(path) as archive:
+            archive.add("a.png", lambda stream: stream.write(b"png-bytes"))
+            archive.add_bytes("manifest.json", b"[]")
+            assert not path.exists()
+        with zipfile.ZipFile(path) as zf:
+            assert zf.namelist() == ["a.png", "manifest.json"]
+            assert zf.read("a.png") == b"png-bytes"
+            assert zf.getinfo("a.png").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("manifest.json").compress_type == zipfile.ZIP_DEFLATED
+        assert archive.names == {"a.png", "manifest.json"}
+
+    @pytest.mark.parametrize("name", ["codes.tar", "codes.tar.gz"])
+    def test_tar_entries(self, temp_dir, name):
+        path = temp_dir / name
+        with ArchiveSink(path) as archive:
+            archive.add_bytes("a.svg", b"<svg/>")
+        with tarfile.open(path) as tf:
+            assert tf.getnames() == ["a.svg"]
+            assert tf.extractfile("a.svg").read() == b"<svg/>"
+
+    def test_failed_run_leaves_no_archive(self, temp_dir):
+        path = temp_dir / "codes.zip"
+        with pytest.raises(RuntimeError):
+            with ArchiveSink(path) as archive:
+                archive.add_bytes("a.png", b"x")
+                raise RuntimeError("boom")
+        assert list(temp_dir.iterdir()) == []
+
+    @pytest.mark.parametrize("name", ["codes.zip", "codes.tar.gz"])
+    def test_pdf_entries(self, temp_dir, name):
+        generator = QRCodeGenerator()
+        qr_image = generator.render("Test data", output_format="pdf")
+        path = temp_dir / name
+        with ArchiveSink(path) as archive:
+            archive.add("a.pdf", lambda stream: generator.write(qr_image, stream, "pdf"))
+        if name.endswith(".zip"):
+            with zipfile.ZipFile(path) as zf:
+                data = zf.read("a.pdf")
+        else:
+            with tarfile.open(path) as tf:
+                data = tf.extractfile("a.pdf").read()
+        assert data.startswith(b"%PDF")
+        assert data.rstrip().endswith(b"%%EOF")
+
+    def test_failed_entry_leaves_nothing_behind(self, temp_dir):
+        def fail(stream):
+            stream.write(b"partial")
+            raise OSError("render failed")
+
+        path = temp_dir / "codes.zip"
+        with ArchiveSink(path) as archive:
+            with pytest.raises(OSError):
+                archive.add("a.png", fail)
+            archive.add_bytes("a.png", b"png-bytes")
+        with zipfile.ZipFile(path) as zf:
+            assert zf.namelist() == ["a.png"]
+            assert zf.read("a.png") == b"png-bytes"
+
+    def test_unsupported_extension(self, temp_dir):
+        with pytest.raises(ValueError):
+            ArchiveSink(temp_dir / "codes.7z")
+
+
+class TestStreamingAdapters:
+    @pytest.mark.parametrize("output_format,magic", [("png", b"\x89PNG"), ("svg", b"<?xml"), ("pdf", b"%PDF")])
+    def test_write_to_buffer_matches_file(self, temp_dir, output_format, magic):
+        generator = QRCodeGenerator()
+        adapter = generator.OUTPUT_ADAPTERS[output_format]()
+        assert adapter.supports_stream()
+        qr_image = generator.render("Test data", output_format=output_format)
+        buffer = io.BytesIO()
+        generator.write(qr_image, buffer, output_format)
+        assert buffer.getvalue().startswith(magic)
+        result = generator.save(qr_image, temp_dir / "qr", output_format)
+        assert self._body(result.filepath.read_bytes()) == self._body(buffer.getvalue())
+
+    @pytest.mark.parametrize("output_format,magic", [("png", b"\x89PNG"), ("svg", b"<?xml"), ("pdf", b"%PDF")])
+    def test_write_to_unseekable_stream(self, output_format, magic):
+        generator = QRCodeGenerator()
+        qr_image = generator.render("Test data", output_format=output_format)
+        stream = UnseekableStream()
+        generator.write(qr_image, stream, output_format)
+        data = stream.getvalue()
+        assert data.startswith(magic)
+        if output_format == "pdf":
+            assert data.rstrip().endswith(b"%%EOF")
+
+    @staticmethod
+    def _body(data):
+        # PIL's PDF info dict carries timestamps and, for named files, a /Title; the page image is what must match
+        if data.startswith(b"%PDF"):
+            return data.split(b"stream\n", 1)[1].split(b"endstream", 1)[0]
+        return data
+
+
+class UnseekableStream(io.BytesIO):
+    def seekable(self):
+        return False
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation("seek")
+
+    def tell(self):
+        raise io.UnsupportedOperation("tell")
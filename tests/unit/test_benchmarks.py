@@ -0,0 +1,60 @@
+import logging
+
+from benchmarks.pipeline import compare_results, run_case, time_operation
+from benchmarks.workbook import COLUMNS, make_workbook
+from qr_code_generator.plugins.input import ExcelReader
+
+
+class TestBenchmarkSuite:
+    def test_workbook_has_unique_rows_for_every_payload(self, temp_dir):
+        path = make_workbook(temp_dir / "bench.xlsx", 25)
+        reader = ExcelReader()
+        assert reader.read_columns(str(path)) == COLUMNS
+        rows = list(reader.iter_rows(str(path)))
+        assert len(rows) == 25
+        assert len({row['Phone'] for row in rows}) == 25
+
+    def test_compare_flags_regressions(self):
+        baseline = {
+            'pipeline': [{'name': 'case', 'rows_per_sec': 100.0, 'peak_rss_mb': 100.0}],
+            'micro': [{'name': 'op', 'ops_per_sec': 1000.0}],
+        }
+        current = {
+            'pipeline': [{'name': 'case', 'rows_per_sec': 85.0, 'peak_rss_mb': 125.0}],
+            'micro': [{'name': 'op', 'ops_per_sec': 950.0}, {'name': 'new', 'ops_per_sec': 1.0}],
+        }
+        rows = {(row['name'], row['metric']): row for row in compare_results(baseline, current, threshold=0.1)}
+        assert rows[('case', 'rows_per_sec')]['regression'] is True
+        assert rows[('case', 'peak_rss_mb')]['regression'] is True
+        assert rows[('op', 'ops_per_sec')]['regression'] is False
+        assert ('new', 'ops_per_sec') not in rows
+
+    def test_compare_reports_failed_cases(self):
+        baseline = {'pipeline': [
+            {'name': 'ok', 'failed': False, 'rows_per_sec': 100.0},
+            {'name': 'was_broken', 'failed': True, 'rows_per_sec': None},
+        ]}
+        current = {'pipeline': [
+            {'name': 'ok', 'failed': True, 'rows_per_sec': None},
+            {'name': 'was_broken', 'failed': False, 'rows_per_sec': 90.0},
+        ]}
+        rows = compare_results(baseline, current)
+        assert [(row['name'], row['metric'], row['regression']) for row in rows] == [('ok', 'failed', True)]
+
+    def test_run_case_marks_short_runs_failed(self, temp_dir):
+        path = make_workbook(temp_dir / "bench.xlsx", 5)
+        try:
+            result = run_case(str(path), 5, 'phone', 'svg')
+            assert result['failed'] is False
+            assert result['rows_per_sec'] > 0
+            # More rows requested than the workbook holds
+            result = run_case(str(path), 10, 'phone', 'svg')
+        finally:
+            logging.disable(logging.NOTSET)
+        assert result['generated'] == 5
+        assert result['failed'] is True
+        assert result['rows_per_sec'] is None
+
+    def test_time_operation(self):
+        result = time_operation('noop', lambda: None, min_seconds=0.001)
+        assert result['ops_per_sec'] > 0
@@ -0,0 +1,91 @@
+import json
+import pytest
+import pandas as pd
+from qr_code_generator.plugins.input import (
+    CSVReader,
+    ExcelReader,
+    JSONReader,
+    get_reader,
+)
+
+
+class TestDataReaders:
+    def test_excel_reader_streams_rows(self, sample_excel_file):
+        reader = ExcelReader()
+        rows = reader.iter_rows(sample_excel_file)
+        first = next(rows)
+        assert first == {'Phone': '+441234567890', 'Name': 'John Smith', 'Email': 'john@example.com'}
+        assert len(list(rows)) == 2
+
+    def test_excel_reader_converts_cells(self, temp_dir):
+        filepath = temp_dir / "numbers.xlsx"
+        pd.DataFrame({'Phone': [441234567890.0, None], 'Name': ['A', 'B']}).to_excel(filepath, index=False)
+        rows = ExcelReader().read(filepath)
+        assert rows == [{'Phone': '441234567890', 'Name': 'A'}, {'Phone': '', 'Name': 'B'}]
+
+    def test_excel_reader_columns(self, sample_excel_file):
+        assert ExcelReader().read_columns(sample_excel_file) == ['Phone', 'Name', 'Email']
+
+    def test_csv_reader(self, sample_csv_file):
+        rows = CSVReader().read(sample_csv_file)
+        assert rows[0] == {'Phone': '+441234567890', 'Name': 'John Smith'}
+        assert len(rows) == 2
+
+    def test_csv_reader_pads_short_rows(self, temp_dir):
+        filepath = temp_dir / "short.csv"
+        filepath.write_text("Phone,Name\n+441234567890\n\n")
+        assert CSVReader().read(filepath) == [{'Phone': '+441234567890', 'Name': ''}]
+
+    def test_json_reader_array(self, temp_dir):
+        filepath = temp_dir / "contacts.json"
+        filepath.write_text(json.dumps([{'Phone': 441234567890, 'Name': None}]))
+        assert JSONReader().read(filepath) == [{'Phone': '441234567890', 'Name': ''}]
+
+    def test_json_reader_ndjson(self, temp_dir):
+        filepath = temp_dir / "contacts.json"
+        filepath.write_text('{"Phone": "+441234567890"}\n\n{"Phone": "+442345678901"}\n')
+        rows = JSONReader().read(filepath)
+        assert [row['Phone'] for row in rows] == ['+441234567890', '+442345678901']
+        assert JSONReader().read_columns(filepath) == ['Phone']
+
+    @pytest.mark.parametrize("name,content", [
+        ("rows.csv", "Phone\n1\n\n2\n3\n\n"),
+        ("rows.json", json.dumps([{'Phone': 1}, {'Phone': 2}, {'Phone': 3}])),
+        ("rows.ndjson", '{"Phone": 1}\n\n{"Phone": 2}\n{"Phone": 3}\n'),
+    ])
+    def test_exceeds_rows(self, temp_dir, name, content):
+        filepath = temp_dir / name
+        filepath.write_text(content)
+        reader = get_reader(filepath)
+        assert len(reader.read(filepath)) == 3
+        assert reader.exceeds_rows(filepath, 2) is True
+        assert reader.exceeds_rows(filepath, 3) is False
+
+    def test_excel_exceeds_rows_matches_streamed_rows(self, temp_dir):
+        from openpyxl import Workbook
+        filepath = temp_dir / "rows.xlsx"
+        workbook = Workbook()
+        sheet = workbook.active
+        for values in (['Phone'], ['1'], [None], ['2']):
+            sheet.append(values)
+        # Trailing blank cells stretch the stored dimension to row 10 without adding records
+        sheet.cell(row=10, column=1, value='')
+        workbook.save(filepath)
+        reader = ExcelReader()
+        assert len(reader.read(filepath)) == 3
+        assert reader.exceeds_rows(filepath, 2) is True
+        assert reader.exceeds_rows(filepath, 3) is False
+        assert reader.exceeds_rows(filepath, 9) is False
+
+    def test_validate_schema_duplicates(self, temp_dir):
+        filepath = temp_dir / "dup.csv"
+        filepath.write_text("Phone,Phone\n1,2\n")
+        valid, errors = CSVReader().validate_schema(filepath)
+        assert valid is False
+        assert "Duplicate" in errors[0]
+
+    def test_get_reader(self):
+        assert isinstance(get_reader("contacts.xlsx"), ExcelReader)
+        assert isinstance(get_reader("contacts.jsonl"), JSONReader)
+        with pytest.raises(ValueError):
+            get_reader("contacts.txt")
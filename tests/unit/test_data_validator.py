@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+from qr_code_generator.core.validator import DataValidator
+
+
+PHONES = ['+441234567890', '', None, np.nan, '123', '1' * 20, '   ', 441234567890, '(020) 7946-0958']
+
+
+class TestDataValidator:
+    def test_validate_dataframe_matches_row_validation(self):
+        validator = DataValidator()
+        df = pd.DataFrame({'Phone': PHONES * 30})
+
+        issues = []
+        valid_count = 0
+        for row_num, (_, row) in enumerate(df.iterrows(), start=2):
+            row_valid, row_error = validator.validate_row(row)
+            if row_valid:
+                valid_count += 1
+            else:
+                issues.append({'row': row_num, 'error': row_error})
+
+        is_valid, report = validator.validate_dataframe(df)
+        assert is_valid is True
+        assert report == {
+            'valid_count': valid_count,
+            'invalid_count': len(df) - valid_count,
+            'issues': issues[:100],
+        }
+
+    def test_row_validity_masks(self):
+        validity = DataValidator().row_validity(pd.Series(PHONES, dtype=object))
+        assert validity.has_phone.tolist() == [True, False, False, False, True, True, False, True, True]
+        assert validity.valid.tolist() == [True, False, False, False, False, False, False, True, True]
+        assert validity.errors[4] == "Phone number must have at least 7 digits"
+        assert validity.errors[0] is None
+
+    def test_row_validity_issue_offsets(self):
+        validity = DataValidator().row_validity(pd.Series(['', '+441234567890', '12']))
+        assert validity.issues(first_row=10) == [
+            {'row': 10, 'error': "Missing phone number"},
+            {'row': 12, 'error': "Phone number must have at least 7 digits"},
+        ]
+
+    def test_validate_dataframe_missing_column(self):
+        is_valid, report = DataValidator().validate_dataframe(pd.DataFrame({'Name': ['x']}))
+        assert is_valid is False
+        assert 'schema_errors' in report
@@ -0,0 +1,110 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from qr_code_generator.di.container import DIContainer, SCOPED, TRANSIENT
+
+
+class Clock:
+    pass
+
+
+class Store:
+    def __init__(self, clock: Clock):
+        self.clock = clock
+
+
+class Handler:
+    def __init__(self, store: Store, clock: Clock, retries: int = 3):
+        self.store = store
+        self.clock = clock
+        self.retries = retries
+
+
+class SlowSingleton:
+    created = 0
+
+    def __init__(self):
+        time.sleep(0.01)
+        SlowSingleton.created += 1
+
+
+class TestDIContainer:
+    def test_resolves_dependencies_and_skips_optional_unregistered(self):
+        container = DIContainer()
+        container.register(Clock)
+        container.register(Store, lifetime=TRANSIENT)
+        container.register(Handler, lifetime=TRANSIENT)
+        handler = container.resolve(Handler)
+        assert handler.retries == 3
+        assert handler.clock is handler.store.clock is container.resolve(Clock)
+        assert container.resolve(Handler) is not handler
+
+    def test_missing_required_dependency_raises(self):
+        container = DIContainer()
+        container.register(Store)
+        with pytest.raises(KeyError):
+            container.resolve(Store)
+
+    def test_factory_is_compiled_once_per_registration(self, monkeypatch):
+        import qr_code_generator.di.container as module
+        calls = []
+        compile_factory = module.compile_factory
+        monkeypatch.setattr(module, "compile_factory", lambda impl: calls.append(impl) or compile_factory(impl))
+        container = DIContainer()
+        container.register(Clock, lifetime=TRANSIENT)
+        for _ in range(5):
+            container.resolve(Clock)
+        container.register(Clock, lambda: "replacement", lifetime=TRANSIENT)
+        assert container.resolve(Clock) == "replacement"
+        assert len(calls) == 2
+
+    def test_register_instance(self):
+        container = DIContainer()
+        clock = Clock()
+        container.register_instance(Clock, clock)
+        assert container.resolve(Clock) is clock
+
+    def test_unknown_lifetime(self):
+        with pytest.raises(ValueError, match="Unknown lifetime"):
+            DIContainer().register(Clock, lifetime="pooled")
+
+    def test_scoped_instances_are_shared_within_a_scope(self):
+        container = DIContainer()
+        container.register(Clock)
+        container.register(Store, lifetime=SCOPED)
+        container.register(Handler, lifetime=TRANSIENT)
+        with container.create_scope() as first, container.create_scope() as second:
+            assert first.resolve(Store) is first.resolve(Store)
+            assert first.resolve(Store) is not second.resolve(Store)
+            assert first.resolve(Handler).store is first.resolve(Store)
+            assert first.resolve(Clock) is second.resolve(Clock) is container.resolve(Clock)
+        with pytest.raises(RuntimeError, match="scoped"):
+            container.resolve(Store)
+
+    def test_singleton_created_once_under_concurrency(self):
+        SlowSingleton.created = 0
+        container = DIContainer()
+        container.register(SlowSingleton)
+        barrier = threading.Barrier(8)
+
+        def resolve():
+            barrier.wait()
+            return container.resolve(SlowSingleton)
+
+        with ThreadPoolExecutor(8) as pool:
+            instances = list(pool.map(lambda _: resolve(), range(8)))
+        assert SlowSingleton.created == 1
+        assert all(instance is instances[0] for instance in instances)
+
+    def test_scoped_created_once_under_concurrency(self):
+        SlowSingleton.created = 0
+        container = DIContainer()
+        container.register(SlowSingleton, lifetime=SCOPED)
+        scope = container.create_scope()
+        with ThreadPoolExecutor(8) as pool:
+            instances = list(pool.map(lambda _: scope.resolve(SlowSingleton), range(8)))
+        assert SlowSingleton.created == 1
+        assert len({id(instance) for instance in instances}) == 1
@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from qr_code_generator.core.snapshot import DirectorySnapshot
+
+
+class TestDirectorySnapshot:
+    def test_exists_answers_from_one_scan(self, temp_dir):
+        (temp_dir / "a.png").write_bytes(b"x")
+        (temp_dir / "sub").mkdir()
+        (temp_dir / "sub" / "b.png").write_bytes(b"x")
+        snapshot = DirectorySnapshot(temp_dir)
+        assert snapshot.exists("a.png") is True
+        assert snapshot.exists("missing.png") is False
+        assert snapshot.exists("sub") is True
+        assert snapshot.exists(os.path.join("sub", "b.png")) is True
+        assert snapshot.exists(os.path.join("nope", "c.png")) is False
+        stats = snapshot.stats()
+        # "nope" is absent from the root listing, so it is never scanned
+        assert stats['snapshot_scans'] == 2
+        assert stats['exists_calls_avoided'] == 5
+
+    def test_missing_shard_directories_are_not_scanned(self, temp_dir):
+        (temp_dir / "ab").mkdir()
+        (temp_dir / "ab" / "cd").mkdir()
+        (temp_dir / "ab" / "cd" / "a.png").write_bytes(b"x")
+        snapshot = DirectorySnapshot(temp_dir)
+        assert snapshot.exists("ab/cd/a.png") is True
+        assert snapshot.exists("ab/ef/a.png") is False
+        assert snapshot.exists("gh/ij/a.png") is False
+        assert snapshot.stats()['snapshot_scans'] == 3
+
+    def test_missing_root_is_empty(self, temp_dir):
+        snapshot = DirectorySnapshot(temp_dir / "absent")
+        assert snapshot.exists("a.png") is False
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unavailable")
+    def test_broken_symlink_does_not_exist(self, temp_dir):
+        os.symlink(temp_dir / "target.png", temp_dir / "link.png")
+        assert DirectorySnapshot(temp_dir).exists("link.png") is os.path.exists(temp_dir / "link.png")
+
+    def test_case_probe_matches_filesystem(self, temp_dir):
+        (temp_dir / "Ada.png").write_bytes(b"x")
+        snapshot = DirectorySnapshot(temp_dir)
+        assert snapshot.exists("ADA.PNG") is os.path.exists(temp_dir / "ADA.PNG")
+        assert snapshot.case_insensitive is os.path.exists(temp_dir / "aDA.PNG")
+
+    def test_empty_directory_probes_its_own_name(self, temp_dir):
+        snapshot = DirectorySnapshot(temp_dir)
+        assert snapshot.exists("a.png") is False
+        swapped = temp_dir.parent / temp_dir.name.swapcase()
+        assert snapshot.case_insensitive is (swapped.exists() and os.path.samefile(temp_dir, swapped))
+
+    def test_key_folds_case_when_insensitive(self, temp_dir):
+        snapshot = DirectorySnapshot(temp_dir)
+        assert snapshot.key("Ada.png") == ("ada.png" if snapshot.case_insensitive else "Ada.png")
+        snapshot.case_insensitive = True
+        assert snapshot.key(os.path.join("Sub", "Ada.png")) == os.path.join("sub", "ada.png")
+
+    def test_is_contained(self, temp_dir):
+        snapshot = DirectorySnapshot(temp_dir)
+        assert snapshot.is_contained("a.png") is True
+        assert snapshot.is_contained(os.path.join("ab", "a.png")) is True
+        assert snapshot.is_contained("..") is False
+        assert snapshot.is_contained(os.path.join("..", "a.png")) is False
+        assert snapshot.is_contained(os.path.abspath("a.png")) is False
+        assert snapshot.is_contained("") is False
+        assert snapshot.stats()['path_checks_avoided'] == 2
+
+    def test_ensure_parent_creates_each_directory_once(self, temp_dir):
+        snapshot = DirectorySnapshot(temp_dir)
+        for name in ("a.png", "b.png", "c.png"):
+            snapshot.ensure_parent(temp_dir / "out" / name)
+        assert (temp_dir / "out").is_dir()
+        assert snapshot.stats()['mkdir_calls_avoided'] == 2
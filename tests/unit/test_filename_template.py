@@ -0,0 +1,89 @@
+import hashlib
+import pytest
+from qr_code_generator.core.sanitizer import FilenameSanitizer, PathValidator
+from qr_code_generator.core.template import FilenameTemplate, shard_path
+
+
+def _reference(template, row, phone, allowed_root=None, extension='.png'):
+    # Previous per-row behaviour: sanitize every column, then str.format
+    data = dict(row, Phone=phone)
+    for key, value in data.items():
+        sanitized, error = PathValidator.validate_and_sanitize_path(value, allowed_root)
+        data[key] = FilenameSanitizer.sanitize_template_value(value) if error else sanitized
+    try:
+        base = template.format(**data)
+    except (KeyError, IndexError):
+        base = phone
+    return FilenameSanitizer.sanitize_filename(base) + extension
+
+
+ROWS = [
+    {'Phone': '+441234567890', 'Name': 'Ada Lovelace', 'Email': 'ada@example.com'},
+    {'Phone': '441234567890', 'Name': '../../etc/passwd', 'Email': 'C:\\evil'},
+    {'Phone': '+1', 'Name': 'CON', 'Email': '/abs/path', 'Org': 'a<b>c|d'},
+    {'Phone': '+2', 'Name': '', 'Email': '%2e%2e/x'},
+]
+
+
+class TestFilenameTemplate:
+    @pytest.mark.parametrize("template", [
+        '{Phone}', '{Name}_{Phone}', 'id-{Email}', '{Name:>20}', '{Name!r}', '{Name[0]}', '{{literal}}_{Phone}',
+        '{Org}', '{}', '{0}', 'static',
+    ])
+    @pytest.mark.parametrize("allowed_root", [None, 'output'])
+    def test_matches_previous_behaviour(self, template, allowed_root):
+        compiled = FilenameTemplate(template, '.png', allowed_root)
+        for row in ROWS:
+            if template == '{Name[0]}' and not row['Name']:
+                continue
+            filename, _ = compiled.render(row, row['Phone'])
+            assert filename == _reference(template, row, row['Phone'], allowed_root)
+
+    def test_only_referenced_fields_are_sanitized(self, monkeypatch):
+        calls = []
+        original = PathValidator.validate_and_sanitize_path
+        monkeypatch.setattr(PathValidator, 'validate_and_sanitize_path',
+                            staticmethod(lambda value, root=None: calls.append(value) or original(value, root)))
+        row = dict(ROWS[0], **{f'Col{i}': f'value {i}' for i in range(50)})
+        filename, errors = FilenameTemplate('{Name}').render(row, '441234567890')
+        assert filename == 'Ada Lovelace'
+        assert errors == []
+        assert calls == ['Ada Lovelace']
+
+    def test_reports_errors_for_referenced_fields(self):
+        template = FilenameTemplate('{Name}_{Phone}', '.svg')
+        filename, errors = template.render(ROWS[1], '441234567890')
+        assert errors == ['Path traversal detected in value']
+        assert filename.endswith('_441234567890.svg')
+        assert '..' not in filename
+
+    def test_fields_and_fallback(self):
+        template = FilenameTemplate('{Name}-{Name}-{Missing}', '.png')
+        assert template.fields == ('Name', 'Missing')
+        assert template.render(ROWS[0], '441234567890', fallback='+441234567890') == ('+441234567890.png', [])
+
+    def test_malformed_template(self):
+        with pytest.raises(ValueError):
+            FilenameTemplate('{Name')
+
+    def test_collision_detection(self):
+        template = FilenameTemplate('{Name}')
+        assert template.claim('Ada.png', 'payload 1', 2) is None
+        assert template.claim('Ada.png', 'payload 1', 3) is None
+        assert template.claim('Ada.png', 'payload 2', 4) == 2
+        assert template.claim('Bob.png', 'payload 2', 5) is None
+        assert template.collisions == 1
+
+
+class TestShardPath:
+    def test_flat_when_depth_is_zero(self):
+        assert shard_path("a.png", 0) == "a.png"
+
+    def test_prefix_directories_from_filename_hash(self):
+        digest = hashlib.sha256(b"+441234567890.png").hexdigest()
+        assert shard_path("+441234567890.png", 2) == f"{digest[:2]}/{digest[2:4]}/+441234567890.png"
+        assert shard_path("+441234567890.png", 1) == f"{digest[:2]}/+441234567890.png"
+
+    def test_spreads_names_across_directories(self):
+        prefixes = {shard_path(f"{n}.png", 1).split('/')[0] for n in range(2000)}
+        assert len(prefixes) > 200
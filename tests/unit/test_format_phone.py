@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import pytest
 from qr_code_generator.core.formatter import PhoneFormatter
 
@@ -42,3 +44,34 @@ class TestPhoneFormatter:
         assert valid is False
         assert error is not None
         assert "15 digits" in error
+
+
+PHONES = ['441234567890', ' +441234567890 ', '00441234567890', '01234567890', '0044123', '0123', '', '00 44 1234 567890']
+
+
+class TestPhoneFormatterBatch:
+    @pytest.mark.parametrize("keep_plus", [True, False])
+    def test_format_many_matches_scalar(self, keep_plus):
+        result = PhoneFormatter.format_many(pd.Series(PHONES), keep_plus)
+        assert result.tolist() == [PhoneFormatter.format_phone(p, keep_plus) for p in PHONES]
+
+    def test_normalize_many_matches_scalar(self):
+        result = PhoneFormatter.normalize_many(np.array(PHONES, dtype=object))
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [PhoneFormatter.normalize_phone(p) for p in PHONES]
+
+    def test_validate_many_matches_scalar(self):
+        values = PHONES + [None, np.nan, 0, 0.0, False, "", "  ", "+" + "1" * 20, "123"]
+        valid, errors = PhoneFormatter.validate_many(pd.Series(values, dtype=object))
+        assert list(zip(valid.tolist(), errors.tolist())) == [PhoneFormatter.validate_phone(v) for v in values]
+
+    def test_validate_many_na_matches_its_text(self):
+        # validate_phone(pd.NA) raises, so pd.NA is checked the way DataValidator passes it: as str(pd.NA)
+        valid, errors = PhoneFormatter.validate_many(pd.Series(['+441234567890', pd.NA], dtype="string"))
+        assert list(zip(valid.tolist(), errors.tolist())) == [
+            PhoneFormatter.validate_phone('+441234567890'), PhoneFormatter.validate_phone(str(pd.NA)),
+        ]
+
+    def test_batch_keeps_series_index(self):
+        series = pd.Series(['441234567890'], index=[7])
+        assert PhoneFormatter.format_many(series).index.tolist() == [7]
@@ -1,3 +1,4 @@
+import io
 import pytest
 from pathlib import Path
 from qr_code_generator.core.generator import QRCodeGenerator
@@ -85,3 +86,31 @@ class TestQRCodeGenerator:
         assert valid is False
         assert error is not None
         assert "capacity" in error.lower()
+
+
+class TestInMemoryRendering:
+    @pytest.mark.parametrize("output_format,magic", [("png", b"\x89PNG"), ("svg", b"<?xml"), ("pdf", b"%PDF")])
+    def test_generate_bytes(self, output_format, magic):
+        data = QRCodeGenerator().generate_bytes("Test data", output_format=output_format)
+        assert data.startswith(magic)
+
+    def test_generate_bytes_matches_file_output(self, temp_dir):
+        generator = QRCodeGenerator()
+        result = generator.generate("Test data", temp_dir / "qr.png", fill_color="red", render_engine="numpy")
+        data = generator.generate_bytes("Test data", fill_color="red", render_engine="numpy")
+        assert data == result.filepath.read_bytes()
+
+    def test_render_to_buffer_appends_to_caller_buffer(self):
+        buffer = io.BytesIO(b"prefix")
+        buffer.seek(0, io.SEEK_END)
+        result = QRCodeGenerator().render_to_buffer("Test data", buffer, output_format="svg")
+        assert result.success is True
+        assert result.filepath is None
+        assert result.metadata['mime_type'] == "image/svg+xml"
+        assert len(buffer.getvalue()) == len(b"prefix") + result.metadata['bytes_written']
+
+    def test_generate_bytes_rejects_unknown_format(self):
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            QRCodeGenerator().generate_bytes("Test data", output_format="gif")
+        result = QRCodeGenerator().render_to_buffer("Test data", io.BytesIO(), render_engine="cairo")
+        assert result.success is False
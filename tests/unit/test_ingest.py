@@ -0,0 +1,73 @@
+import pytest
+import pandas as pd
+from qr_code_generator.core.ingest import IngestionStage, RowLimitExceeded
+from qr_code_generator.core.validator import DataValidator
+from qr_code_generator.plugins.input import CSVReader, ExcelReader, RowStream
+
+
+class TestIngestionStage:
+    def test_single_parse(self, sample_excel_file, mocker):
+        reader = ExcelReader()
+        open_spy = mocker.spy(reader, 'open')
+        ingestion = IngestionStage(reader)
+
+        assert ingestion.check_file(sample_excel_file) == (True, None)
+        rows = list(ingestion.rows(sample_excel_file))
+
+        assert open_spy.call_count == 1
+        assert [row_num for row_num, _ in rows] == [2, 3, 4]
+        assert ingestion.columns == ['Phone', 'Name', 'Email']
+        assert ingestion.seconds > 0
+
+    def test_report_matches_dataframe_validation(self, sample_excel_with_invalid):
+        ingestion = IngestionStage(ExcelReader())
+        list(ingestion.rows(sample_excel_with_invalid))
+
+        expected = DataValidator().validate_dataframe(pd.read_excel(sample_excel_with_invalid))
+        assert ingestion.validation_report() == expected
+
+    def test_row_limit(self, sample_excel_file):
+        ingestion = IngestionStage(ExcelReader(), max_rows=2)
+        rows = ingestion.rows(sample_excel_file)
+        # Rejected before the first row is handed out
+        with pytest.raises(RowLimitExceeded):
+            next(rows)
+
+    def test_row_limit_exact(self, sample_excel_file):
+        ingestion = IngestionStage(ExcelReader(), max_rows=3)
+        assert len(list(ingestion.rows(sample_excel_file))) == 3
+
+    def test_first_chunk_released_before_rest_is_read(self, temp_dir, mocker):
+        filepath = temp_dir / "many.csv"
+        filepath.write_text("Phone\n" + "".join(f"+4412345{i:05d}\n" for i in range(1000)))
+        reader = CSVReader()
+        consumed = []
+        opened = reader.open
+
+        def counting_open(source):
+            stream = opened(source)
+
+            def rows():
+                for row in stream:
+                    consumed.append(row)
+                    yield row
+            return RowStream(stream.columns, rows(), stream.close)
+
+        mocker.patch.object(reader, 'open', side_effect=counting_open)
+        chunks = IngestionStage(reader).chunks(filepath)
+        assert len(next(chunks)) == IngestionStage.FIRST_CHUNK_SIZE
+        assert len(consumed) == IngestionStage.FIRST_CHUNK_SIZE
+        chunks.close()
+
+    def test_file_size_limit(self, sample_excel_file):
+        ingestion = IngestionStage(ExcelReader(), max_file_size_mb=0)
+        valid, error = ingestion.check_file(sample_excel_file)
+        assert valid is False
+        assert "exceeds limit" in error
+
+    def test_schema_errors(self, temp_dir):
+        filepath = temp_dir / "no_phone.csv"
+        filepath.write_text("Name\nJohn\n")
+        ingestion = IngestionStage(CSVReader())
+        list(ingestion.rows(filepath))
+        assert ingestion.validation_report() == (False, {'schema_errors': ['Missing required columns: Phone']})
@@ -0,0 +1,36 @@
+import pytest
+from qr_code_generator.core.journal import JOURNAL_FILENAME, RunJournal
+
+
+class TestRunJournal:
+    def test_record_and_reload(self, temp_dir):
+        with RunJournal(temp_dir) as journal:
+            journal.record(2, "a.png", "h1")
+            journal.record(3, "b.png", "h2")
+            journal.record(4, "a.png", "h3")
+
+        journal = RunJournal(temp_dir)
+        assert journal.load() == {"a.png": "h3", "b.png": "h2"}
+        assert journal.is_current("a.png", "h3") is True
+        assert journal.is_current("a.png", "h1") is False
+        assert journal.is_known("c.png") is False
+
+    def test_ignores_truncated_line(self, temp_dir):
+        (temp_dir / JOURNAL_FILENAME).write_text('{"row": 2, "file": "a.png", "hash": "h1"}\n{"row": 3, "fi')
+        assert RunJournal(temp_dir).load() == {"a.png": "h1"}
+
+    def test_records_after_truncated_line_survive(self, temp_dir):
+        (temp_dir / JOURNAL_FILENAME).write_text('{"row": 2, "file": "a.png", "hash": "h1"}\n{"row": 3, "fi')
+        with RunJournal(temp_dir) as journal:
+            journal.record(3, "b.png", "h2")
+            journal.record(4, "c.png", "h3")
+
+        assert RunJournal(temp_dir).load() == {"a.png": "h1", "b.png": "h2", "c.png": "h3"}
+
+    def test_compacts_superseded_records(self, temp_dir):
+        with RunJournal(temp_dir) as journal:
+            for i in range(300):
+                journal.record(2, "a.png", f"h{i}")
+
+        assert RunJournal(temp_dir).load() == {"a.png": "h299"}
+        assert len((temp_dir / JOURNAL_FILENAME).read_text().splitlines()) == 1
@@ -0,0 +1,73 @@
+import re
+import zlib
+import pytest
+from qr_code_generator.core.generator import QRCodeGenerator
+from qr_code_generator.core.labels import LabelSheetWriter, parse_grid, page_dimensions, text_width
+
+
+def _objects(data):
+    xref = int(re.search(rb'startxref\n(\d+)', data).group(1))
+    count = int(re.match(rb'xref\n0 (\d+)\n', data[xref:]).group(1))
+    entries = data[xref:].split(b'\n')[3:3 + count - 1]
+    return {i + 1: int(entry[:10]) for i, entry in enumerate(entries)}
+
+
+def _modules(text):
+    return QRCodeGenerator().make_qr(text).modules
+
+
+class TestLabelSheetWriter:
+    def test_parse_grid(self):
+        assert parse_grid('3x8') == (3, 8)
+        assert parse_grid('2X5') == (2, 5)
+        for grid in ('3', '0x2', 'axb'):
+            with pytest.raises(ValueError):
+                parse_grid(grid)
+
+    def test_page_dimensions(self):
+        assert page_dimensions('Letter') == (612.0, 792.0)
+        with pytest.raises(ValueError):
+            page_dimensions('B5')
+
+    def test_pages_are_flushed_as_they_fill(self, temp_dir):
+        path = temp_dir / "labels.pdf"
+        with LabelSheetWriter(path, '2x2') as sheet:
+            pages = [sheet.add(_modules(f"code {i}")) for i in range(5)]
+            assert sheet.pages == 1
+        assert pages == [1, 1, 1, 1, 2]
+        assert sheet.pages == 2
+
+        data = path.read_bytes()
+        assert data.startswith(b'%PDF-1.4')
+        assert data.rstrip().endswith(b'%%EOF')
+        assert b'/Count 2' in data
+        for object_id, offset in _objects(data).items():
+            assert data[offset:].startswith(b'%d 0 obj' % object_id)
+
+    def test_captions_and_colors(self, temp_dir):
+        path = temp_dir / "labels.pdf"
+        with LabelSheetWriter(path, '1x1', fill_color='red', back_color='transparent', captions=True) as sheet:
+            sheet.add(_modules("code"), caption="Smith (Jr)")
+        stream = re.search(rb'stream\n(.*)\nendstream', path.read_bytes(), re.S).group(1)
+        content = zlib.decompress(stream)
+        assert b'1 0 0 rg' in content
+        assert b'(Smith \\(Jr\\)) Tj' in content
+        assert content.count(b' re f') == 0
+
+    def test_long_caption_is_truncated(self, temp_dir):
+        sheet = LabelSheetWriter(temp_dir / "labels.pdf", '4x10', captions=True)
+        text = sheet._draw_caption('x' * 200, 0, 0)
+        caption = re.search(rb'\((.*)\) Tj', text).group(1).decode()
+        assert caption.endswith('...')
+        assert text_width(caption, sheet.font_size) <= sheet.cell_width
+
+    def test_failed_run_leaves_no_file(self, temp_dir):
+        with pytest.raises(RuntimeError):
+            with LabelSheetWriter(temp_dir / "labels.pdf") as sheet:
+                sheet.add(_modules("code"))
+                raise RuntimeError("boom")
+        assert list(temp_dir.iterdir()) == []
+
+    def test_margins_too_large(self, temp_dir):
+        with pytest.raises(ValueError):
+            LabelSheetWriter(temp_dir / "labels.pdf", page_size='A5', margin_mm=80)
@@ -0,0 +1,79 @@
+import logging
+import threading
+
+import pytest
+
+from qr_code_generator.utils.log_utils import DEFAULT_PROGRESS_SECONDS, RowLogPolicy, queued_logging
+
+
+class TestRowLogPolicy:
+    def test_every_logs_each_row(self):
+        policy = RowLogPolicy('every')
+        assert all(policy.log_row(count) for count in range(1, 6))
+        assert policy.suppressed == 0
+        assert policy.progress_due() is False
+
+    def test_sample_keeps_first_and_every_nth(self):
+        policy = RowLogPolicy('sample:3')
+        assert [count for count in range(1, 11) if policy.log_row(count)] == [1, 4, 7, 10]
+        assert policy.suppressed == 6
+
+    def test_summary_logs_progress_on_interval(self):
+        now = [0.0]
+        policy = RowLogPolicy('summary:5', clock=lambda: now[0])
+        assert policy.log_row(1) is False
+        assert policy.progress_due() is False
+        now[0] = 5.0
+        assert policy.progress_due() is True
+        assert policy.progress_due() is False
+        now[0] = 10.5
+        assert policy.progress_due() is True
+
+    def test_summary_default_interval(self):
+        assert RowLogPolicy('summary').interval == DEFAULT_PROGRESS_SECONDS
+
+    @pytest.mark.parametrize('spec', ['', 'all', 'every:2', 'sample', 'sample:0', 'sample:x', 'sample:1.5', 'summary:-1'])
+    def test_invalid_specs(self, spec):
+        with pytest.raises(ValueError, match="Invalid row log policy"):
+            RowLogPolicy(spec)
+
+
+class TestQueuedLogging:
+    def test_records_are_emitted_by_listener_thread_in_order(self):
+        logger = logging.getLogger("tests.queued")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        emitted = []
+        handler = logging.Handler()
+        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+        handler.emit = lambda record: emitted.append((handler.format(record), threading.current_thread()))
+        logger.handlers = [handler]
+
+        with queued_logging(logger):
+            assert logger.handlers != [handler]
+            for n in range(50):
+                logger.info("row %s", n)
+
+        assert logger.handlers == [handler]
+        assert [message for message, _ in emitted] == [f"INFO: row {n}" for n in range(50)]
+        assert all(thread is not threading.current_thread() for _, thread in emitted)
+
+    def test_handler_levels_are_respected(self):
+        logger = logging.getLogger("tests.queued_levels")
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        emitted = []
+        handler = logging.Handler(logging.WARNING)
+        handler.emit = emitted.append
+        logger.handlers = [handler]
+        with queued_logging(logger):
+            logger.info("dropped")
+            logger.warning("kept")
+        assert [record.getMessage() for record in emitted] == ["kept"]
+
+    def test_no_handlers_is_a_no_op(self):
+        logger = logging.getLogger("tests.queued_empty")
+        logger.handlers = []
+        with queued_logging(logger) as listener:
+            assert listener is None
+        assert logger.handlers == []
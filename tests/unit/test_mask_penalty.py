@@ -0,0 +1,42 @@
+import random
+import string
+import numpy as np
+import pytest
+import qrcode
+from qrcode import util
+from qr_code_generator.core.masks import FastMaskQRCode, lost_point, mask_patterns
+
+
+class TestLostPoint:
+    @pytest.mark.parametrize("size", [5, 11, 21, 45, 177])
+    def test_matches_library_scoring(self, size):
+        rng = np.random.default_rng(size)
+        for density in (0.2, 0.5, 0.8):
+            modules = (rng.random((size, size)) < density).tolist()
+            assert lost_point(modules) == util.lost_point(modules)
+
+    def test_mask_patterns_match_library(self):
+        size = 21
+        for index, pattern in enumerate(mask_patterns(size)):
+            mask_func = util.mask_func(index)
+            expected = [[bool(mask_func(i, j)) for j in range(size)] for i in range(size)]
+            assert pattern.tolist() == expected
+
+
+class TestFastMaskQRCode:
+    @pytest.mark.parametrize("seed", range(3))
+    def test_same_mask_and_modules_as_library(self, seed):
+        rng = random.Random(seed)
+        for _ in range(6):
+            data = ''.join(rng.choice(string.printable) for _ in range(rng.randint(1, 900)))
+            error_correction = rng.choice([0, 1, 2, 3])
+
+            stock = qrcode.QRCode(error_correction=error_correction)
+            stock.add_data(data)
+            stock.make()
+            fast = FastMaskQRCode(error_correction=error_correction)
+            fast.add_data(data)
+            fast.make()
+
+            assert fast.version == stock.version
+            assert fast.modules == stock.modules
@@ -1,5 +1,12 @@
+import logging
 import pytest
-from qr_code_generator.utils.pii_utils import PIIRedactor
+from qr_code_generator.utils.pii_utils import PIIRedactionFilter, PIIRedactor, _masked_email, _masked_phone
+
+
+def uncached_redact_pii(text, mask_char='*'):
+    # The original single regex pass, with no fast paths or memoized masks
+    text = PIIRedactor.PHONE_REGEX.sub(lambda m: PIIRedactor.mask_phone(m.group(0), mask_char), text)
+    return PIIRedactor.EMAIL_REGEX.sub(lambda m: PIIRedactor.mask_email(m.group(0), mask_char), text)
 
 
 class TestPIIRedactor:
@@ -39,3 +46,52 @@ class TestPIIRedactor:
     def test_redact_pii_empty(self):
         assert PIIRedactor.redact_pii("") == ""
         assert PIIRedactor.redact_pii("No PII here") == "No PII here"
+
+
+class TestPIIRedactionFilter:
+    def _logger(self, level):
+        logger = logging.getLogger("tests.pii_filter")
+        logger.setLevel(level)
+        logger.propagate = False
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.handlers = [handler]
+        logger.filters = [PIIRedactionFilter()]
+        return logger, records
+
+    def test_redacts_arguments_not_template(self):
+        logger, records = self._logger(logging.INFO)
+        logger.info("Row %s: Generated: %s", 123456789, "+441234567890.png")
+        assert records[0].getMessage() == "Row 123456789: Generated: +********7890.png"
+
+    def test_message_without_arguments_is_untouched(self):
+        logger, records = self._logger(logging.INFO)
+        logger.info("Total rows: 100000")
+        assert records[0].getMessage() == "Total rows: 100000"
+
+    def test_suppressed_level_never_redacts(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("redact_pii called for a suppressed record")
+        monkeypatch.setattr(PIIRedactor, "redact_pii", fail)
+        logger, records = self._logger(logging.ERROR)
+        logger.info("Generated: %s", "+441234567890.png")
+        assert records == []
+
+    def test_cached_redaction_matches_uncached(self):
+        texts = [
+            "Call +441234567890 or mail john@example.com, then +441234567890 again",
+            "Generated: +441234567890_john@example.com.png",
+            "Row 7: 442345678901 jane.doe@example.org",
+            "no pii here",
+        ]
+        _masked_phone.cache_clear()
+        _masked_email.cache_clear()
+        # Cold, then warm: the same values under another mask character must not be served from the cache
+        for _ in range(2):
+            for mask_char in ("*", "#"):
+                for text in texts:
+                    assert PIIRedactor.redact_pii(text, mask_char) == uncached_redact_pii(text, mask_char)
+        assert _masked_phone.cache_info().hits > 0
+        assert PIIRedactor.redact_pii(texts[0], "#") == \
+            "Call +########7890 or mail j##n@e######.com, then +########7890 again"
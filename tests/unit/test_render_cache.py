@@ -0,0 +1,66 @@
+import os
+import pytest
+from qr_code_generator.core.cache import RenderCache, render_key
+
+
+def _write(path, size):
+    path.write_bytes(b"x" * size)
+    return path
+
+
+class TestRenderKey:
+    def test_key_is_stable(self):
+        assert render_key("Phone: +44") == render_key("Phone: +44")
+
+    @pytest.mark.parametrize("changes", [
+        {'fill_color': 'red'},
+        {'back_color': 'blue'},
+        {'box_size': 5},
+        {'border': 2},
+        {'error_correction': 'H'},
+        {'output_format': 'svg'},
+        {'render_engine': 'numpy'},
+    ])
+    def test_key_depends_on_style(self, changes):
+        assert render_key("Phone: +44", **changes) != render_key("Phone: +44")
+
+
+class TestRenderCache:
+    def test_store_and_fetch(self, temp_dir):
+        cache = RenderCache(temp_dir / "cache")
+        source = _write(temp_dir / "a.png", 10)
+        destination = temp_dir / "out" / "b.png"
+
+        assert cache.fetch("k1", destination) is False
+        cache.store("k1", source)
+        assert cache.fetch("k1", destination) is True
+        assert destination.read_bytes() == source.read_bytes()
+        assert cache.stats()['cache_hits'] == 1
+        assert cache.stats()['cache_misses'] == 1
+
+    def test_lru_eviction(self, temp_dir):
+        cache = RenderCache(temp_dir / "cache", max_mb=1)
+        size = 400 * 1024
+        cache.store("a", _write(temp_dir / "a.png", size))
+        cache.store("b", _write(temp_dir / "b.png", size))
+        assert cache.fetch("a", temp_dir / "a_out.png") is True
+        cache.store("c", _write(temp_dir / "c.png", size))
+
+        assert cache.evictions == 1
+        assert cache.fetch("b", temp_dir / "b_out.png") is False
+        assert cache.fetch("a", temp_dir / "a_out.png") is True
+
+    def test_index_survives_restart(self, temp_dir):
+        RenderCache(temp_dir / "cache").store("k1", _write(temp_dir / "a.png", 10))
+        assert RenderCache(temp_dir / "cache").fetch("k1", temp_dir / "out.png") is True
+
+    def test_hardlink_and_release(self, temp_dir):
+        cache = RenderCache(temp_dir / "cache", link=True)
+        cache.store("k1", _write(temp_dir / "a.png", 10))
+        destination = temp_dir / "out.png"
+
+        assert cache.fetch("k1", destination) is True
+        assert os.stat(destination).st_nlink == 2
+        cache.release(destination)
+        assert not destination.exists()
+        assert cache.fetch("k1", temp_dir / "again.png") is True
@@ -0,0 +1,25 @@
+import pytest
+from qr_code_generator.core.parallel import OrderedRenderPool
+
+
+def _square(value):
+    return value * value
+
+
+class TestOrderedRenderPool:
+    def test_inline_pool_returns_result_immediately(self):
+        with OrderedRenderPool(1) as pool:
+            assert pool.submit('a', _square, 3) == [('a', 9)]
+            assert pool.drain() == []
+
+    def test_process_pool_preserves_submission_order(self):
+        results = []
+        with OrderedRenderPool(2, max_pending=3) as pool:
+            for i in range(20):
+                results.extend(pool.submit(i, _square, i))
+            results.extend(pool.drain())
+        assert results == [(i, i * i) for i in range(20)]
+
+    def test_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            OrderedRenderPool(0)
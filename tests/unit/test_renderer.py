@@ -0,0 +1,93 @@
+import io
+import re
+import xml.etree.ElementTree as ET
+import numpy as np
+import pytest
+from PIL import Image
+from qrcode.image.svg import SvgPathImage
+from qr_code_generator.core.generator import QRCodeGenerator
+from qr_code_generator.core.renderer import SvgMatrixImage, render_matrix
+
+
+def _pil_reference(qr, fill_color, back_color):
+    return qr.make_image(fill_color=fill_color, back_color=back_color).get_image()
+
+
+class TestRenderMatrix:
+    @pytest.mark.parametrize("fill_color,back_color", [
+        ("black", "white"),
+        ("Black", "WHITE"),
+        ("red", "blue"),
+        ("#123456", "transparent"),
+        ((10, 20, 30), (200, 200, 200)),
+    ])
+    def test_pixel_identical_to_pil(self, fill_color, back_color):
+        qr = QRCodeGenerator().make_qr("BEGIN:VCARD\nFN:John Smith\nEND:VCARD", box_size=3, border=2)
+        expected = _pil_reference(qr, fill_color, back_color)
+        result = render_matrix(qr.modules, 3, 2, fill_color, back_color)
+
+        assert result.size == expected.size
+        assert np.array_equal(np.asarray(result.convert(expected.mode)), np.asarray(expected))
+
+    def test_black_on_white_is_one_bit(self):
+        result = render_matrix([[True, False], [False, True]], box_size=2, border=0)
+        assert result.mode == "1"
+        assert np.asarray(result).tolist()[0] == [False, False, True, True]
+
+    def test_generate_with_numpy_engine(self, temp_dir):
+        generator = QRCodeGenerator()
+        result = generator.generate("Test data", temp_dir / "numpy.png", render_engine='numpy')
+        reference = generator.generate("Test data", temp_dir / "pil.png")
+
+        assert result.success is True
+        with Image.open(result.filepath) as fast, Image.open(reference.filepath) as slow:
+            assert np.array_equal(np.asarray(fast), np.asarray(slow))
+
+    def test_generate_rejects_unknown_engine(self, temp_dir):
+        result = QRCodeGenerator().generate("Test data", temp_dir / "x.png", render_engine='cairo')
+        assert result.success is False
+        assert "render engine" in result.error
+
+
+def _svg_modules(svg: bytes, width: int) -> np.ndarray:
+    path = re.search(rb' d="([^"]*)"', svg).group(1).decode()
+    grid = np.zeros((width, width), dtype=bool)
+    for x, y, length in re.findall(r'M(\d+) (\d+)h(\d+)v1h-\3z', path):
+        grid[int(y), int(x):int(x) + int(length)] = True
+    return grid
+
+
+class TestSvgMatrixImage:
+    @pytest.mark.parametrize("data", ["hi", "BEGIN:VCARD\nN:Lovelace;Ada\nTEL:+441234567890\nEND:VCARD" * 4])
+    def test_runs_reproduce_modules(self, data):
+        generator = QRCodeGenerator()
+        qr = generator.make_qr(data, border=2)
+        buffer = io.BytesIO()
+        generator.make_image(qr, 'svg').save(buffer)
+        svg = buffer.getvalue()
+        expected = np.pad(np.asarray(qr.modules, dtype=bool), 2)
+        assert np.array_equal(_svg_modules(svg, len(expected)), expected)
+        ET.fromstring(svg)
+
+    def test_smaller_than_per_module_path(self):
+        qr = QRCodeGenerator().make_qr("BEGIN:VCARD\nN:Lovelace;Ada\nEND:VCARD" * 4)
+        compact, reference = io.BytesIO(), io.BytesIO()
+        SvgMatrixImage(qr.modules).save(compact)
+        qr.make_image(image_factory=SvgPathImage).save(reference)
+        assert len(compact.getvalue()) * 2 < len(reference.getvalue())
+
+    def test_colors_and_dimensions(self):
+        buffer = io.BytesIO()
+        SvgMatrixImage([[True, False], [False, True]], box_size=5, border=1,
+                       fill_color=(255, 0, 16), back_color='#eee').save(buffer)
+        root = ET.fromstring(buffer.getvalue())
+        assert root.get('width') == '2mm'
+        assert root.get('viewBox') == '0 0 4 4'
+        rect, path = list(root)
+        assert rect.get('fill') == '#eee'
+        assert path.get('fill') == '#ff0010'
+
+    def test_transparent_background_has_no_rect(self):
+        buffer = io.BytesIO()
+        SvgMatrixImage([[True]], back_color='transparent').save(buffer)
+        assert [child.tag.split('}')[1] for child in ET.fromstring(buffer.getvalue())] == ['path']
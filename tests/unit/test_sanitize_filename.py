@@ -48,3 +48,29 @@ class TestPathValidator:
         assert PathValidator.is_absolute_path("/home/user/file") is True
         assert PathValidator.is_absolute_path("C:\\Users\\file") is True
         assert PathValidator.is_absolute_path("relative/file") is False
+
+
+class TestSanitizerEngine:
+    def test_matches_legacy_algorithm(self):
+        from benchmarks.sanitizer import (
+            legacy_is_path_traversal_attempt, legacy_sanitize_filename, legacy_sanitize_template_value, make_corpus,
+        )
+        corpus = make_corpus(5000, seed=7) + ["a" * 300 + ".png", "x" * 300, "%2E%2E/..\\..\\/"]
+        for value in corpus:
+            assert FilenameSanitizer.sanitize_filename(value) == legacy_sanitize_filename(value)
+            assert FilenameSanitizer.sanitize_filename(value, 20) == legacy_sanitize_filename(value, 20)
+            assert FilenameSanitizer.sanitize_template_value(value) == legacy_sanitize_template_value(value)
+            assert PathValidator.is_path_traversal_attempt(value) == legacy_is_path_traversal_attempt(value)
+
+    def test_mixed_case_traversal_is_detected_but_only_exact_case_replaced(self):
+        assert PathValidator.is_path_traversal_attempt("%2E%2E/etc") is True
+        assert FilenameSanitizer.sanitize_template_value("%2E%2E/etc") == "%2E%2E_etc"
+        assert FilenameSanitizer.sanitize_template_value("%2e%2e/etc") == "_etc"
+
+    def test_batch_apis_match_single_calls(self):
+        column = ["Ada", "../Ada", "CON", "Ada", "c:/x", "../Ada"]
+        assert FilenameSanitizer.sanitize_filename_many(column) == [FilenameSanitizer.sanitize_filename(v) for v in column]
+        assert FilenameSanitizer.sanitize_template_value_many(column) == [
+            FilenameSanitizer.sanitize_template_value(v) for v in column
+        ]
+        assert FilenameSanitizer.sanitize_filename_many([]) == []
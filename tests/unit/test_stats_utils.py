@@ -0,0 +1,35 @@
+import pstats
+import time
+from qr_code_generator.utils.stats_utils import StageTimer, profiled
+
+
+class TestStageTimer:
+    def test_lap_accumulates_and_returns_now(self):
+        timer = StageTimer()
+        start = time.perf_counter()
+        now = timer.lap('payload', start)
+        timer.lap('payload', now)
+        assert now >= start
+        assert timer.seconds['payload'] >= 0
+
+    def test_summary_uses_pipeline_order(self):
+        timer = StageTimer()
+        timer.merge({'save': 0.5, 'encode': 0.25})
+        timer.add('custom', 0.1)
+        timer.add('read', 1.0)
+        timer.add('save', 0.5)
+        assert list(timer.summary().items()) == [('read', 1.0), ('encode', 0.25), ('save', 1.0), ('custom', 0.1)]
+
+
+class TestProfiled:
+    def test_writes_pstats_dump(self, temp_dir):
+        path = temp_dir / "profiles" / "run.prof"
+        with profiled(path) as profiler:
+            sorted(range(1000))
+        assert profiler is not None
+        assert pstats.Stats(str(path)).total_calls > 0
+
+    def test_disabled_without_path(self):
+        with profiled(None) as profiler:
+            pass
+        assert profiler is None
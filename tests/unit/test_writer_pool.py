@@ -0,0 +1,72 @@
+import threading
+import pytest
+from qr_code_generator.core.parallel import OrderedRenderPool
+from qr_code_generator.core.writer import WriterPool
+from qr_code_generator.utils.stats_utils import latency_summary, percentile
+
+
+class TestWriterPool:
+    def test_results_collected_in_submission_order(self):
+        release = threading.Event()
+
+        def write(value):
+            if value == 0:
+                release.wait(5)
+            return value
+
+        results = []
+        with WriterPool(2, queue_size=4) as writer:
+            pool = OrderedRenderPool(1, max_pending=writer.capacity)
+            for i in range(4):
+                results.extend(pool.submit_future(i, writer.submit(write, i)))
+            results.extend(pool.submit_result('inline', 'done'))
+            assert results == []
+            release.set()
+            results.extend(pool.drain())
+        assert results == [(0, 0), (1, 1), (2, 2), (3, 3), ('inline', 'done')]
+
+    def test_backpressure_blocks_producer(self):
+        release = threading.Event()
+        writer = WriterPool(1, queue_size=1)
+        futures = [writer.submit(release.wait, 5) for _ in range(2)]
+        blocked = threading.Thread(target=lambda: futures.append(writer.submit(lambda: True)))
+        blocked.start()
+        blocked.join(0.05)
+        assert blocked.is_alive()
+        release.set()
+        blocked.join(5)
+        writer.close()
+        assert all(future.result() for future in futures)
+        assert writer.stats()['write_backpressure_waits'] == 1
+
+    def test_stats_report_latency(self):
+        with WriterPool(1) as writer:
+            writer.submit(lambda: None).result()
+        stats = writer.stats()
+        assert stats['write_count'] == 1
+        assert stats['write_max_ms'] >= stats['write_p50_ms'] >= 0
+
+    def test_write_errors_surface_on_future(self):
+        with WriterPool(1) as writer:
+            future = writer.submit(lambda: 1 / 0)
+            with pytest.raises(ZeroDivisionError):
+                future.result()
+        assert writer.stats()['write_count'] == 1
+
+    def test_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            WriterPool(0)
+        with pytest.raises(ValueError):
+            WriterPool(1, queue_size=0)
+
+
+class TestLatencySummary:
+    def test_percentile_nearest_rank(self):
+        values = [0.004, 0.001, 0.003, 0.002]
+        assert percentile(values, 50) == 0.002
+        assert percentile(values, 95) == 0.004
+        assert percentile([], 50) == 0.0
+
+    def test_summary_keys(self):
+        summary = latency_summary([0.001, 0.002], prefix='x_')
+        assert summary == {'x_count': 2, 'x_p50_ms': 1.0, 'x_p95_ms': 2.0, 'x_p99_ms': 2.0, 'x_max_ms': 2.0}